@@ -0,0 +1,313 @@
+# -*- coding: utf8 -*-
+import array
+import base64
+from collections import namedtuple
+from ctypes import POINTER, cast, create_string_buffer
+import six
+from py2jdbc.jni import jbyte, jdouble, jint, jlong
+from py2jdbc.lang import Object
+from py2jdbc.math import from_twos_complement, to_decimal
+from py2jdbc.wrap import JInstanceMethod
+
+Column = namedtuple('Column', ('values', 'nulls'))
+ColumnBuffers = namedtuple('ColumnBuffers', ('data', 'offsets', 'nulls'))
+LONG_TYPECODE = 'q' if six.PY3 else 'l'
+
+
+def is_null(nulls, i):
+    """
+    Check a column null bitmap for a row.
+
+    :param nulls: the bitmap from a Column
+    :param i: the row index
+    :return: True if the value in the row is NULL
+    """
+    return bool(nulls[i >> 3] & (1 << (i & 7)))
+
+
+def _copy_array(array_region, typecode, ctype, jarray, count):
+    """
+    Copy the first elements of a Java primitive array into a Python array.
+
+    :param array_region: the JNIEnv Get<Type>ArrayRegion function
+    :param typecode: the Python array typecode
+    :param ctype: the matching jni type
+    :param jarray: the Java array
+    :param count: the number of elements to copy
+    :return: an array.array of the elements
+    """
+    values = array.array(typecode, [0]) * count
+    if count:
+        array_region(jarray, 0, count, cast(values.buffer_info()[0], POINTER(ctype)))
+    return values
+
+
+class ColumnFetcher(Object):
+    """
+    Wrapper for the py2jdbc.ColumnFetcher helper class, which reads batches of rows
+    from a ResultSet into one Java array per column.
+
+    The class isn't shipped in a jar, it's defined from the bytecode below,
+    which is compiled from src/py2jdbc/ColumnFetcher.java.
+    """
+    class_name = 'py2jdbc.ColumnFetcher'
+    bytecode = base64.b64decode(
+        b'yv66vgAAADIA/QEAFXB5MmpkYmMvQ29sdW1uRmV0Y2hlcgcAAQEAEGphdmEvbGFuZy9PYmplY3QH'
+        b'AAMBAApTb3VyY2VGaWxlAQASQ29sdW1uRmV0Y2hlci5qYXZhAQAIZmxvb3JEaXYBAAUoSkopSgEA'
+        b'D0xpbmVOdW1iZXJUYWJsZQEADVN0YWNrTWFwVGFibGUBAARDb2RlAQAGbG9jYWwkAQAbKExweTJq'
+        b'ZGJjL0NvbHVtbkZldGNoZXI7SilKAQAEem9uZQEAFExqYXZhL3V0aWwvVGltZVpvbmU7DAAOAA8J'
+        b'AAIAEAEAEmphdmEvdXRpbC9UaW1lWm9uZQcAEgEACWdldE9mZnNldAEABChKKUkMABQAFQoAEwAW'
+        b'AQAEdXRmOAEAFihMamF2YS9sYW5nL1N0cmluZzspW0IBAApFeGNlcHRpb25zAQAVamF2YS9zcWwv'
+        b'U1FMRXhjZXB0aW9uBwAbAQAQamF2YS9sYW5nL1N0cmluZwcAHQEABVVURi04CAAfAQAIZ2V0Qnl0'
+        b'ZXMMACEAGQoAHgAiAQACW0IHACQBACRqYXZhL2lvL1Vuc3VwcG9ydGVkRW5jb2RpbmdFeGNlcHRp'
+        b'b24HACYBABNqYXZhL2xhbmcvVGhyb3dhYmxlBwAoAQAIdG9TdHJpbmcBABQoKUxqYXZhL2xhbmcv'
+        b'U3RyaW5nOwwAKgArCgApACwBAAY8aW5pdD4BABUoTGphdmEvbGFuZy9TdHJpbmc7KVYMAC4ALwoA'
+        b'HAAwAQAIdW5zY2FsZWQBADooTGphdmEvaW8vQnl0ZUFycmF5T3V0cHV0U3RyZWFtO0xqYXZhL21h'
+        b'dGgvQmlnRGVjaW1hbDtJSSlWAQAdamF2YS9pby9CeXRlQXJyYXlPdXRwdXRTdHJlYW0HADQBABRq'
+        b'YXZhL21hdGgvQmlnRGVjaW1hbAcANgEADVJPVU5EX0hBTEZfVVABAAFJDAA4ADkJADcAOgEACHNl'
+        b'dFNjYWxlAQAaKElJKUxqYXZhL21hdGgvQmlnRGVjaW1hbDsMADwAPQoANwA+AQANdW5zY2FsZWRW'
+        b'YWx1ZQEAGCgpTGphdmEvbWF0aC9CaWdJbnRlZ2VyOwwAQABBCgA3AEIBABRqYXZhL21hdGgvQmln'
+        b'SW50ZWdlcgcARAEAC3RvQnl0ZUFycmF5AQAEKClbQgwARgBHCgBFAEgBAA5kZWNpbWFsIHZhbHVl'
+        b'IAgASgEAB3ZhbHVlT2YBACYoTGphdmEvbGFuZy9PYmplY3Q7KUxqYXZhL2xhbmcvU3RyaW5nOwwA'
+        b'TABNCgAeAE4BAAZjb25jYXQBACYoTGphdmEvbGFuZy9TdHJpbmc7KUxqYXZhL2xhbmcvU3RyaW5n'
+        b'OwwAUABRCgAeAFIBABAgaXMgb3V0IG9mIHJhbmdlCABUAQAFd3JpdGUBAAQoSSlWDABWAFcKADUA'
+        b'WAEABWZldGNoAQAWKEkpW0xqYXZhL2xhbmcvT2JqZWN0OwEABWtpbmRzAQACW0kMAFwAXQkAAgBe'
+        b'BwBdAQATW0xqYXZhL2xhbmcvT2JqZWN0OwcAYQEAA1tbSQcAYwEAA1tbQgcAZQEAIFtMamF2YS9p'
+        b'by9CeXRlQXJyYXlPdXRwdXRTdHJlYW07BwBnAQACW0QHAGkBAAMoKVYMAC4AawoANQBsAQAGd2lk'
+        b'dGhzDABuAF0JAAIAbwwALgBXCgA1AHEBAAJbSgcAcwEAGHVuc3VwcG9ydGVkIGNvbHVtbiBraW5k'
+        b'IAgAdQEAFShJKUxqYXZhL2xhbmcvU3RyaW5nOwwATAB3CgAeAHgBAAJycwEAFExqYXZhL3NxbC9S'
+        b'ZXN1bHRTZXQ7DAB6AHsJAAIAfAEAEmphdmEvc3FsL1Jlc3VsdFNldAcAfgEABG5leHQBAAMoKVoM'
+        b'AIAAgQsAfwCCAQAHZ2V0TG9uZwEABChJKUoMAIQAhQsAfwCGAQAHd2FzTnVsbAwAiACBCwB/AIkB'
+        b'AAlnZXREb3VibGUBAAQoSSlEDACLAIwLAH8AjQEACWdldFN0cmluZwwAjwB3CwB/AJAMABgAGQoA'
+        b'AgCSAQAHKFtCSUkpVgwAVgCUCgA1AJUBAARzaXplAQADKClJDACXAJgKADUAmQEABShJKVtCDAAh'
+        b'AJsLAH8AnAEADWdldEJpZ0RlY2ltYWwBABkoSSlMamF2YS9tYXRoL0JpZ0RlY2ltYWw7DACeAJ8L'
+        b'AH8AoAEABnNjYWxlcwwAogBdCQACAKMMADIAMwoAAgClAQAKZ2V0Qm9vbGVhbgEABChJKVoMAKcA'
+        b'qAsAfwCpAQAHZ2V0RGF0ZQEAEihJKUxqYXZhL3NxbC9EYXRlOwwAqwCsCwB/AK0BAA1qYXZhL3Nx'
+        b'bC9EYXRlBwCvAQAOamF2YS91dGlsL0RhdGUHALEBAAdnZXRUaW1lAQADKClKDACzALQKALIAtQwA'
+        b'DAANCgACALcBAANEQVkBAAFKDAC5ALoJAAIAuwUAAAAABSZcAAwABwAICgACAL8BABIoSSlMamF2'
+        b'YS9zcWwvVGltZTsMALMAwQsAfwDCAQANamF2YS9zcWwvVGltZQcAxAEADGdldFRpbWVzdGFtcAEA'
+        b'FyhJKUxqYXZhL3NxbC9UaW1lc3RhbXA7DADGAMcLAH8AyAEAEmphdmEvc3FsL1RpbWVzdGFtcAcA'
+        b'ygoAywC1BQAAAAAAAAPoBQAAAAAAD0JAAQAIZ2V0TmFub3MMANEAmAoAywDSCgA1AEgBABkoTGph'
+        b'dmEvc3FsL1Jlc3VsdFNldDtbSSlWCgAEAGwBAApnZXREZWZhdWx0AQAWKClMamF2YS91dGlsL1Rp'
+        b'bWVab25lOwwA1wDYCgATANkBABpqYXZhL3NxbC9SZXN1bHRTZXRNZXRhRGF0YQcA2wEAB0RFQ0lN'
+        b'QUwMAN0AOQkAAgDeAQALZ2V0TWV0YURhdGEBAB4oKUxqYXZhL3NxbC9SZXN1bHRTZXRNZXRhRGF0'
+        b'YTsMAOAA4QsAfwDiAQAMZ2V0UHJlY2lzaW9uAQAEKEkpSQwA5ADlCwDcAOYBAAhnZXRTY2FsZQwA'
+        b'6ADlCwDcAOkBAA1Db25zdGFudFZhbHVlAwAAAAABAARMT05HAwAAAAEBAAZET1VCTEUDAAAAAgEA'
+        b'BlNUUklORwMAAAADAQAFQllURVMDAAAABAEAB0JPT0xFQU4DAAAABQEABERBVEUDAAAABgEABFRJ'
+        b'TUUDAAAABwEACVRJTUVTVEFNUAMAAAAIACEAAgAEAAAADwAZAO0AOQABAOsAAAACAOwAGQDvADkA'
+        b'AQDrAAAAAgDuABkA8QA5AAEA6wAAAAIA8AAZAPMAOQABAOsAAAACAPIAGQD1ADkAAQDrAAAAAgD0'
+        b'ABkA9wA5AAEA6wAAAAIA9gAZAPkAOQABAOsAAAACAPgAGQD7ADkAAQDrAAAAAgD6ABkA3QA5AAEA'
+        b'6wAAAAIA/AAYALkAugABAOsAAAACAL0AEAB6AHsAAAAQAFwAXQAAABAADgAPAAAAEACiAF0AAAAQ'
+        b'AG4AXQAAAAYACAAHAAgAAQALAAAAbwAFAAYAAAA0HiBtNwQeIHEDhZSZACYeA4WUmwAHA6cABAQg'
+        b'A4WUmwAHA6cABASfAAsWBASFZacABRYErQAAAAIACQAAAAoAAgAAAEcABQBIAAoAAAAZAAb8ABkE'
+        b'QAFKAf8AAAADBAQEAAIBAQpBBAAIAAwADQABAAsAAAAkAAUAAwAAAAwfKrQAER+2ABeFYa0AAAAB'
+        b'AAkAAAAGAAEAAABMAAgAGAAZAAIAGgAAAAQAAQAcAAsAAABIAAMAAgAAABQqEiC2ACOwTLsAHFkr'
+        b'tgAttwAxvwABAAAABwAHACcAAgAJAAAADgADAAAAUQAHAFIACABTAAoAAAAGAAFHBwAnAAgAMgAz'
+        b'AAIAGgAAAAQAAQAcAAsAAADTAAQABwAAAGwrHAe2AD+2AEO2AEk6BBkEvh2kAB+7ABxZEku4AE8r'
+        b'uABPtgBTElW4AE+2AFO3ADG/GQQDMwOiAAkRAP+nAAQDNgUENganACAqFQYZBL6jAA8ZBBkEvhUG'
+        b'ZDOnAAUVBbYAWYQGARUGHaT/4LEAAAACAAkAAAAiAAgAAABZAA4AWgAVAFsAMQBdAEIAXgBIAF8A'
+        b'YgBeAGsAVwAKAAAALQAH/AAxBwAlDUAB/QAHAQFUBwA1/wABAAcHADUHADcBAQcAJQEBAAIHADUB'
+        b'BQABAFoAWwACABoAAAAEAAEAHAALAAAGgAAIAA4AAAPQKrQAX749HL0ABE4cvQBgOgQcGxAHYBAI'
+        b'bMUAZgI6BRy9ADU6BgM2B6cAnCq0AF8VBy6qAAAAAHUAAAAAAAAACAAAAGsAAAAyAAAAPAAAADwA'
+        b'AABrAAAAawAAAGsAAABrAAAAUy0VBxu8B1OnAFYZBhUHuwA1WbcAbVMZBBUHG7wKU6cAPxkGFQe7'
+        b'ADVZGyq0AHAVBy5otwByU6cAJy0VBxu8C1OnAB27ABxZEna4AE8qtABfFQcuuAB5tgBTtwAxv4QH'
+        b'ARUHHKH/ZAM2B6cChgM2CKcCdxUIBGA2CSq0AF8VCC6qAAAB/AAAAAAAAAAIAAAAMQAAAFQAAAB3'
+        b'AAAAvQAAAVEAAAF9AAABtwAAAfwAAAD8LRUIMsAAdBUHKrQAfRUJuQCHAgBQKrQAfbkAigEANgqn'
+        b'AfgtFQgywABqFQcqtAB9FQm5AI4CAFIqtAB9uQCKAQA2CqcB1Sq0AH0VCbkAkQIAOgsZC8YABwOn'
+        b'AAQENgoVCpoAGBkLuACTOgwZBhUIMhkMAxkMvrYAlhkEFQgyFQcZBhUIMrYAmk+nAY8qtAB9FQm5'
+        b'AJ0CADoLGQvGAAcDpwAEBDYKFQqaABEZBhUIMhkLAxkLvrYAlhkEFQgyFQcZBhUIMrYAmk+nAVAq'
+        b'tAB9FQm5AKECADoLGQvGAAcDpwAEBDYKFQqZAB8ZBhUIMiq0AHAVCC68CAMqtABwFQgutgCWpwAb'
+        b'GQYVCDIZCyq0AKQVCC4qtABwFQguuACmpwD7LRUIMsAAdBUHKrQAfRUJuQCqAgCZAAcEpwAEA4VQ'
+        b'KrQAfbkAigEANgqnAM8qtAB9FQm5AK4CADoLGQvGAAcDpwAEBDYKFQqaABwtFQgywAB0FQcqGQu2'
+        b'ALa4ALgUAL24AMBQpwCVKrQAfRUJuQDDAgA6CxkLxgAHA6cABAQ2ChUKmgAnKhkLtgC2uAC4Nwwt'
+        b'FQgywAB0FQcWDBYMFAC9uADAFAC9aWVQpwBQKrQAfRUJuQDJAgA6CxkLxgAHA6cABAQ2ChUKmgAv'
+        b'KhkLtgDMuAC4FADNuADANwwtFQgywAB0FQcWDBQAz2kZC7YA0xED6GyFYVCnAAMVCpkAGRkFFQgy'
+        b'FQcGelwzBBUHEAd+eJGAkVSECAEVCByh/YmEBwEVBxuiAA8qtAB9uQCDAQCa/W4GHGgEYL0ABDoI'
+        b'AzYJpwBHGQYVCTLGABUZCAYVCWgZBhUJMrYA1FOnAA4ZCAYVCWgtFQkyUxkIBhUJaARgGQQVCTJT'
+        b'GQgGFQloBWAZBRUJMlOECQEVCRyh/7kZCAYcaAS8ClkDFQdPUxkIsAAAAAIACQAAARYARQAAAGQA'
+        b'BgBlAAsAZgARAGcAHwBoACUAaQArAGoAZABsAG4AcAB6AHEAhQB0AJ0AewCnAH4AwQBpAMoAgQDQ'
+        b'AIMA1gCEANwAhgEUAIgBKQCJATcAjQFMAI4BWgCSAWcAkwFzAJQBeACVAX8AlgGNAJgBoACcAa0A'
+        b'nQG5AJ4BvgCfAcwAoQHfAKUB7ACmAfgApwH9AKgCGQCqAjQArwJSALACYAC0Am0AtQJ5ALYCfgC3'
+        b'ApoAvAKnAL0CswC+ArgAvwLDAMAC3wDFAuwAxgL4AMcC/QDIAw4AyQMsAM4DMQDPA0cAgwNQANID'
+        b'UwCCA2UA1ANvANUDdQDWA30A1wOPANkDmgDbA6gA3AO2ANUDvwDeA80A3wAKAAABggAx/wArAAgH'
+        b'AAIBAQcAYgcAZAcAZgcAaAEAADgJFhcJGQIL/AAFAfwAPQEiIv0AFQAHAB5AAf8AGwAMBwACAQEH'
+        b'AGIHAGQHAGYHAGgBAQEBBwAeAAD5ABL9ABUABwAlQAH/ABQADAcAAgEBBwBiBwBkBwBmBwBoAQEB'
+        b'AQcAJQAA+QAS/QAVAAcAN0AB/wAiAAwHAAIBAQcAYgcAZAcAZgcAaAEBAQEHADcAABf5AAL/ABoA'
+        b'CgcAAgEBBwBiBwBkBwBmBwBoAQEBAAIHAHQB/wAAAAoHAAIBAQcAYgcAZAcAZgcAaAEBAQADBwB0'
+        b'AQEP/QAVAAcAskAB/wAfAAwHAAIBAQcAYgcAZAcAZgcAaAEBAQEHALIAAPkAAv0AFQAHALJAAf8A'
+        b'KgAMBwACAQEHAGIHAGQHAGYHAGgBAQEBBwCyAAD5AAL9ABUABwDLQAH/ADIADAcAAgEBBwBiBwBk'
+        b'BwBmBwBoAQEBAQcAywAA+gACGvkAAvoACBH9AA8HAGIBGQoeAAEALgDVAAIAGgAAAAQAAQAcAAsA'
+        b'AAEsAAUABgAAAIQqtwDWKiu1AH0qLLUAXyq4ANq1ABEqLL68CrUApCosvrwKtQBwAU4DNgSnAFIs'
+        b'FQQuEAigAEYtxwAKK7kA4wEATi0VBARguQDnAgA2BSq0AKQVBC0VBARguQDqAgBPKrQAcBUEFQUD'
+        b'pAAPFQUQJqMACBAQpwAFECBPhAQBFQQsvqH/rbEAAAACAAkAAABCABAAAAAzAAQANAAJADUADgA2'
+        b'ABUANwAdADgAJQA5ACcAOgAtADsANgA8ADoAPQBBAD8ATQBAAF4AQQB5ADoAgwAzAAoAAABOAAb/'
+        b'AC0ABQcAAgcAfwcAYAcA3AEAABP/ADQABgcAAgcAfwcAYAcA3AEBAAIHAGAB/wABAAYHAAIHAH8H'
+        b'AGAHANwBAQADBwBgAQH6AAACAAEABQAAAAIABg=='
+    )
+
+    class Instance(Object.Instance):
+        """
+        Wrapper for an instance of py2jdbc.ColumnFetcher
+        """
+        __slots__ = ('kinds', 'scales')
+        _fetch = JInstanceMethod('fetch')
+
+        def __init__(self, cls, obj):
+            super(ColumnFetcher.Instance, self).__init__(cls, obj)
+            self.kinds = ()
+            self.scales = ()
+
+        def fetch_buffers(self, size):
+            """
+            Read up to `size` rows, and copy them out of the JVM column by column,
+            without converting the values.
+
+            The data of integer, boolean and temporal columns is an array of longs,
+            of floating point columns an array of doubles, and of text and binary
+            columns the bytes of all the values, (text encoded as UTF-8), with an
+            array of end offsets of each row.  The data of decimal columns is the
+            unscaled values, as little-endian two's complement integers of 16 bytes,
+            (32 bytes if the precision is over 38 digits).
+
+            :param size: the maximum number of rows to read
+            :return: the number of rows read, and a tuple of ColumnBuffers, one for each column
+            """
+            env = self.cls.env.env
+            cls = self.cls
+            result = self._fetch(size)
+            try:
+                count = _copy_array(env.GetIntArrayRegion, 'i', jint, result[-1], 1)[0]
+                columns = []
+                for kind, values, offsets, nulls in zip(
+                        self.kinds, result[0::3], result[1::3], result[2::3]):
+                    bitmap = create_string_buffer((count + 7) // 8)
+                    if count:
+                        env.GetByteArrayRegion(
+                            nulls, 0, len(bitmap), cast(bitmap, POINTER(jbyte))
+                        )
+                    bitmap = bytearray(bitmap.raw)
+                    if kind == cls.DOUBLE:
+                        data = _copy_array(env.GetDoubleArrayRegion, 'd', jdouble, values, count)
+                    elif kind in (cls.STRING, cls.BYTES, cls.DECIMAL):
+                        length = env.GetArrayLength(values)
+                        buf = create_string_buffer(length)
+                        if length:
+                            env.GetByteArrayRegion(values, 0, length, cast(buf, POINTER(jbyte)))
+                        data = buf.raw[:length]
+                        if kind != cls.DECIMAL:
+                            offsets = _copy_array(env.GetIntArrayRegion, 'i', jint, offsets, count)
+                    else:
+                        data = _copy_array(
+                            env.GetLongArrayRegion, LONG_TYPECODE, jlong, values, count
+                        )
+                    columns.append(ColumnBuffers(
+                        data,
+                        offsets if kind in (cls.STRING, cls.BYTES) else None,
+                        bitmap
+                    ))
+                return count, tuple(columns)
+            finally:
+                for obj in result:
+                    if obj:
+                        env.DeleteLocalRef(obj)
+
+        def fetch(self, size):
+            """
+            Read up to `size` rows, and copy them out of the JVM column by column.
+
+            Integer, boolean and temporal columns are returned as arrays of longs,
+            floating point columns as arrays of doubles, and text, binary and
+            decimal columns as lists, with None for NULL values.
+
+            :param size: the maximum number of rows to read
+            :return: a tuple of Column values, one for each column
+            """
+            count, buffers = self.fetch_buffers(size)
+            columns = []
+            for kind, scale, (data, offsets, nulls) in zip(self.kinds, self.scales, buffers):
+                if kind == self.cls.DECIMAL:
+                    width = len(data) // count if count else 0
+                    columns.append(Column([
+                        None if is_null(nulls, i) else to_decimal(
+                            from_twos_complement(data[i * width:(i + 1) * width][::-1]), scale
+                        )
+                        for i in range(count)
+                    ], nulls))
+                    continue
+                if offsets is None:
+                    columns.append(Column(data, nulls))
+                    continue
+                values = []
+                start = 0
+                for i, end in enumerate(offsets):
+                    values.append(None if is_null(nulls, i) else data[start:end])
+                    start = end
+                if kind == self.cls.STRING:
+                    values = [v if v is None else v.decode('utf-8') for v in values]
+                columns.append(Column(values, nulls))
+            return tuple(columns)
+
+    def __init__(self, env):
+        super(ColumnFetcher, self).__init__(env)
+        self.cons = self.constructor('Ljava/sql/ResultSet;[I')
+        self.fetch = self.method('fetch', '(I)[Ljava/lang/Object;')
+        self._LONG = self.constant('LONG', 'I')
+        self._DOUBLE = self.constant('DOUBLE', 'I')
+        self._STRING = self.constant('STRING', 'I')
+        self._BYTES = self.constant('BYTES', 'I')
+        self._BOOLEAN = self.constant('BOOLEAN', 'I')
+        self._DATE = self.constant('DATE', 'I')
+        self._TIME = self.constant('TIME', 'I')
+        self._TIMESTAMP = self.constant('TIMESTAMP', 'I')
+        self._DECIMAL = self.constant('DECIMAL', 'I')
+
+    def new(self, rs, kinds, scales=None):
+        """
+        Create a fetcher for a result set.
+
+        :param rs: a ResultSet instance
+        :param kinds: a sequence of column kinds, (like LONG or STRING), one per column
+        :param scales: a sequence of column scales, one per column, used to convert
+            DECIMAL columns, or None if there aren't any
+        :return: a ColumnFetcher instance
+        """
+        fetcher = self.cons(rs.obj, kinds)
+        fetcher.kinds = tuple(kinds)
+        fetcher.scales = tuple(scales or (0,) * len(kinds))
+        return fetcher
+
+    @property
+    def LONG(self):
+        return self._LONG.get(self.cls)
+
+    @property
+    def DOUBLE(self):
+        return self._DOUBLE.get(self.cls)
+
+    @property
+    def STRING(self):
+        return self._STRING.get(self.cls)
+
+    @property
+    def BYTES(self):
+        return self._BYTES.get(self.cls)
+
+    @property
+    def BOOLEAN(self):
+        return self._BOOLEAN.get(self.cls)
+
+    @property
+    def DATE(self):
+        return self._DATE.get(self.cls)
+
+    @property
+    def TIME(self):
+        return self._TIME.get(self.cls)
+
+    @property
+    def TIMESTAMP(self):
+        return self._TIMESTAMP.get(self.cls)
+
+    @property
+    def DECIMAL(self):
+        return self._DECIMAL.get(self.cls)
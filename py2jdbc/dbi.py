@@ -1,10 +1,19 @@
 # -*- coding: utf8 -*-
 import six
-from collections import OrderedDict, namedtuple
+from collections import OrderedDict, deque, namedtuple
+import contextlib
+import decimal
+import threading
 import time
 
-from py2jdbc.wrap import get_env
-from py2jdbc.lang import LangException
+from six.moves import queue
+
+from py2jdbc.wrap import detach_thread, get_env
+from py2jdbc.columns import ColumnFetcher
+from py2jdbc.export import arrow_schema, to_arrow_table, to_dataframe, to_numpy, to_record_batch
+from py2jdbc.lang import LangException, Throwable
+from py2jdbc.lob import BlobReader, ClobReader
+from py2jdbc.math import BigDecimal, to_decimal
 from py2jdbc.sql import SQLException
 from py2jdbc.exc import (
     Warning,
@@ -23,6 +32,39 @@ apilevel = '2.0'
 threadsafety = 1
 paramstyle = 'qmark'
 
+# the default number of prepared statements kept by each connection
+STATEMENT_CACHE_SIZE = 50
+
+# the local reference capacity of frames reading metadata
+METADATA_FRAME_SIZE = 16
+
+
+@contextlib.contextmanager
+def _local_frame(env, capacity):
+    """
+    Delete the local references created in a block when it ends, (like the objects
+    returned by result set getters), since they're otherwise only freed when the
+    thread returns to Java, which attached Python threads never do.
+
+    A Java exception raised in the block is moved to the enclosing frame, so its
+    message can still be read.
+
+    :param env: the py2jdbc.jni.JNIEnv of the current thread
+    :param capacity: the number of local references the block is expected to create
+    """
+    if env.PushLocalFrame(max(capacity, 1)) < 0:
+        env.check_exception()
+    try:
+        yield
+    except Exception as e:
+        throwable = e if isinstance(e, Throwable.Instance) else getattr(e, 'cause', None)
+        if isinstance(throwable, Throwable.Instance):
+            throwable.obj = env.PopLocalFrame(throwable.obj)
+        else:
+            env.PopLocalFrame(None)
+        raise
+    env.PopLocalFrame(None)
+
 
 class DataTypes(object):
     def __init__(self):
@@ -48,13 +90,97 @@ class DataTypes(object):
 datatypes = DataTypes()
 
 
+def _convert(value):
+    """
+    Convert a wrapped Java value to Python, then delete its local reference.
+
+    :param value: a wrapper instance with a to_python method
+    :return: the Python value
+    """
+    try:
+        return value.to_python()
+    finally:
+        value.release()
+
+
 class DataType(object):
+    """
+    Base class for column data types.
+
+    Subclasses set ``getter`` to the name of the ResultSet method which
+    reads the column, and may override ``to_python`` to convert the value.
+    Types which need something else can override ``get`` instead.
+
+    ``column`` names the py2jdbc.ColumnFetcher kind used to read the
+    type in bulk, or None if it can't be.  ``dtype`` is the NumPy dtype
+    of the type, or None for object arrays.
+    """
+    getter = None
+    column = None
+    dtype = None
+
+    @classmethod
+    def for_column(cls, meta, i, outputsize=None):
+        """
+        Create the datatype for reading a result set column.
+
+        Subclasses can override this to pick a getter from the column metadata.
+
+        :param meta: the ResultSetMetaData instance
+        :param i: the column index, (starting from 1)
+        :param outputsize: the column's size from Cursor.setoutputsize, or None
+        :return: a DataType instance
+        """
+        return cls()
+
     @property
     def name(self):
         return self.__class__.__name__
 
+    def to_python(self, value):
+        return value
+
     def get(self, rs, i):
-        raise NotImplementedError("DataType.get")
+        if self.getter is None:
+            raise NotImplementedError("DataType.get")
+        value = getattr(rs, self.getter)(i)
+        return None if rs.wasNull() else self.to_python(value)
+
+
+class LOB(DataType):
+    """
+    Base class for large object types.
+
+    Values are read whole with ``getter``, unless the column has an output
+    size, (see Cursor.setoutputsize).  Then values up to that size are still
+    read whole, and longer values are returned as seekable file-like readers,
+    (``reader``), which read the value in chunks with ``lob_getter``.
+    """
+    lob_getter = None
+    reader = None
+
+    def __init__(self, outputsize=None):
+        self.outputsize = outputsize
+
+    @classmethod
+    def for_column(cls, meta, i, outputsize=None):
+        return cls(outputsize)
+
+    def get(self, rs, i):
+        if self.outputsize is None:
+            return super(LOB, self).get(rs, i)
+        lob = getattr(rs, self.lob_getter)(i)
+        if rs.wasNull():
+            return None
+        reader = self.reader(lob, lob.length())
+        if len(reader) > self.outputsize:
+            # the reader outlives the local frame the row is read in
+            reader.keep()
+            return reader
+        try:
+            return reader.read()
+        finally:
+            reader.close()
 
 
 # noinspection PyAbstractClass
@@ -66,64 +192,57 @@ class ARRAY(DataType):
 @datatypes.register
 class BIGINT(DataType):
     type_code = -5
-
-    def get(self, rs, i):
-        value = rs.getLong(i)
-        return None if rs.wasNull() else value
+    getter = 'getLong'
+    column = 'LONG'
+    dtype = 'int64'
 
 
 @datatypes.register
 class BINARY(DataType):
     type_code = -2
-
-    def get(self, rs, i):
-        value = rs.getBytes(i)
-        return None if rs.wasNull() else value
+    getter = 'getBytes'
+    column = 'BYTES'
 
 
 @datatypes.register
 class BIT(DataType):
     type_code = -7
-
-    def get(self, rs, i):
-        value = rs.getInt(i)
-        return None if rs.wasNull() else value
+    getter = 'getInt'
+    column = 'LONG'
+    dtype = 'bool'
 
 
 @datatypes.register
-class BLOB(DataType):
+class BLOB(LOB):
     type_code = 2004
-
-    def get(self, rs, i):
-        value = rs.getBytes(i)
-        return None if rs.wasNull() else value
+    getter = 'getBytes'
+    column = 'BYTES'
+    lob_getter = 'getBlob'
+    reader = BlobReader
 
 
 @datatypes.register
 class BOOLEAN(DataType):
     type_code = 16
-
-    def get(self, rs, i):
-        value = rs.getBoolean(i)
-        return None if rs.wasNull() else value
+    getter = 'getBoolean'
+    column = 'BOOLEAN'
+    dtype = 'bool'
 
 
 @datatypes.register
 class CHAR(DataType):
     type_code = 1
-
-    def get(self, rs, i):
-        value = rs.getString(i)
-        return None if rs.wasNull() else value
+    getter = 'getString'
+    column = 'STRING'
 
 
 @datatypes.register
-class CLOB(DataType):
+class CLOB(LOB):
     type_code = 2005
-
-    def get(self, rs, i):
-        value = rs.getString(i)
-        return None if rs.wasNull() else value
+    getter = 'getString'
+    column = 'STRING'
+    lob_getter = 'getClob'
+    reader = ClobReader
 
 
 # noinspection PyAbstractClass
@@ -135,19 +254,47 @@ class DATALINK(DataType):
 @datatypes.register
 class DATE(DataType):
     type_code = 91
+    getter = 'getDate'
+    column = 'DATE'
+    dtype = 'datetime64[ms]'
 
-    def get(self, rs, i):
-        value = rs.getDate(i)
-        return None if rs.wasNull() else value.to_python()
+    def to_python(self, value):
+        return _convert(value)
 
 
 @datatypes.register
 class DECIMAL(DataType):
+    """
+    Exact numeric type, converted to decimal.Decimal.
+
+    Columns of integers which fit in a long are read with getLong.  Other
+    columns of up to 15 digits are read with getDouble, and rounded back to
+    the column scale, which is exact for that many digits.  Anything else is
+    read with getBigDecimal, and built from its unscaled value and scale.
+    """
     type_code = 3
+    getter = 'getBigDecimal'
+    column = 'DECIMAL'
 
-    def get(self, rs, i):
-        value = rs.getDouble(i)
-        return None if rs.wasNull() else value
+    def __init__(self, precision=0, scale=0):
+        self.scale = scale
+        if 0 < precision <= 18 and scale == 0:
+            self.getter = 'getLong'
+            self.to_python = decimal.Decimal
+        elif 0 < precision <= 15 and 0 < scale <= precision:
+            self.getter = 'getDouble'
+            self.factor = 10 ** scale
+            self.to_python = self.from_double
+
+    @classmethod
+    def for_column(cls, meta, i, outputsize=None):
+        return cls(meta.getPrecision(i), meta.getScale(i))
+
+    def from_double(self, value):
+        return to_decimal(int(round(value * self.factor)), self.scale)
+
+    def to_python(self, value):
+        return _convert(value)
 
 
 # noinspection PyAbstractClass
@@ -159,28 +306,25 @@ class DISTINCT(DataType):
 @datatypes.register
 class DOUBLE(DataType):
     type_code = 8
-
-    def get(self, rs, i):
-        value = rs.getDouble(i)
-        return None if rs.wasNull() else value
+    getter = 'getDouble'
+    column = 'DOUBLE'
+    dtype = 'float64'
 
 
 @datatypes.register
 class FLOAT(DataType):
     type_code = 6
-
-    def get(self, rs, i):
-        value = rs.getFloat(i)
-        return None if rs.wasNull() else value
+    getter = 'getFloat'
+    column = 'DOUBLE'
+    dtype = 'float64'
 
 
 @datatypes.register
 class INTEGER(DataType):
     type_code = 4
-
-    def get(self, rs, i):
-        value = rs.getInt(i)
-        return None if rs.wasNull() else value
+    getter = 'getInt'
+    column = 'LONG'
+    dtype = 'int32'
 
 
 # noinspection PyAbstractClass,PyPep8Naming
@@ -192,42 +336,33 @@ class JAVA_OBJECT(DataType):
 @datatypes.register
 class LONGNVARCHAR(DataType):
     type_code = -16
-
-    def get(self, rs, i):
-        value = rs.getString(i)
-        return None if rs.wasNull() else value
+    getter = 'getString'
+    column = 'STRING'
 
 
 @datatypes.register
 class LONGVARBINARY(DataType):
     type_code = -4
-
-    def get(self, rs, i):
-        value = rs.getBytes(i)
-        return None if rs.wasNull() else value
+    getter = 'getBytes'
+    column = 'BYTES'
 
 
 @datatypes.register
 class LONGVARCHAR(DataType):
     type_code = -1
-
-    def get(self, rs, i):
-        value = rs.getString(i)
-        return None if rs.wasNull() else value
+    getter = 'getString'
+    column = 'STRING'
 
 
 @datatypes.register
 class NCHAR(DataType):
     type_code = -15
-
-    def get(self, rs, i):
-        value = rs.getString(i)
-        return None if rs.wasNull() else value
+    getter = 'getString'
+    column = 'STRING'
 
 
-# noinspection PyAbstractClass
 @datatypes.register
-class NCLOB(DataType):
+class NCLOB(CLOB):
     type_code = 2011
 
 
@@ -240,21 +375,15 @@ class NULL(DataType):
 
 
 @datatypes.register
-class NUMERIC(DataType):
+class NUMERIC(DECIMAL):
     type_code = 2
 
-    def get(self, rs, i):
-        value = rs.getDouble(i)
-        return None if rs.wasNull() else value
-
 
 @datatypes.register
 class NVARCHAR(DataType):
     type_code = -9
-
-    def get(self, rs, i):
-        value = rs.getString()
-        return None if rs.wasNull() else value
+    getter = 'getString'
+    column = 'STRING'
 
 
 # noinspection PyAbstractClass
@@ -266,10 +395,9 @@ class OTHER(DataType):
 @datatypes.register
 class REAL(DataType):
     type_code = 7
-
-    def get(self, rs, i):
-        value = rs.getDouble(i)
-        return None if rs.wasNull() else value
+    getter = 'getDouble'
+    column = 'DOUBLE'
+    dtype = 'float32'
 
 
 # noinspection PyAbstractClass
@@ -293,10 +421,9 @@ class ROWID(DataType):
 @datatypes.register
 class SMALLINT(DataType):
     type_code = 5
-
-    def get(self, rs, i):
-        value = rs.getInt(i)
-        return None if rs.wasNull() else value
+    getter = 'getInt'
+    column = 'LONG'
+    dtype = 'int16'
 
 
 # noinspection PyAbstractClass
@@ -314,10 +441,12 @@ class STRUCT(DataType):
 @datatypes.register
 class TIME(DataType):
     type_code = 92
+    getter = 'getTime'
+    column = 'TIME'
+    dtype = 'timedelta64[ms]'
 
-    def get(self, rs, i):
-        value = rs.getTime(i)
-        return None if rs.wasNull() else value.to_python()
+    def to_python(self, value):
+        return _convert(value)
 
 
 # noinspection PyAbstractClass,PyPep8Naming
@@ -329,10 +458,12 @@ class TIME_WITH_TIMEZONE(DataType):
 @datatypes.register
 class TIMESTAMP(DataType):
     type_code = 93
+    getter = 'getTimestamp'
+    column = 'TIMESTAMP'
+    dtype = 'datetime64[us]'
 
-    def get(self, rs, i):
-        value = rs.getTimestamp(i)
-        return None if rs.wasNull() else value.to_python()
+    def to_python(self, value):
+        return _convert(value)
 
 
 # noinspection PyAbstractClass,PyPep8Naming
@@ -344,10 +475,9 @@ class TIMESTAMP_WITH_TIMEZONE(DataType):
 @datatypes.register
 class TINYINT(DataType):
     type_code = -6
-
-    def get(self, rs, i):
-        value = rs.getInt(i)
-        return None if rs.wasNull() else value
+    getter = 'getInt'
+    column = 'LONG'
+    dtype = 'int16'
 
 
 # noinspection PyAbstractClass
@@ -359,13 +489,24 @@ class VARBINARY(DataType):
 @datatypes.register
 class VARCHAR(DataType):
     type_code = 12
+    getter = 'getString'
+    column = 'STRING'
 
-    def get(self, rs, i):
-        value = rs.getString(i)
-        return None if rs.wasNull() else value
+
+_default_to_python = six.get_unbound_function(DataType.to_python)
 
 
-def _fetch_funcs(rs):
+def _fetch_funcs(rs, outputsizes=None):
+    """
+    Create the datatypes for reading the columns of a result set.
+
+    :param rs: the ResultSet instance
+    :param outputsizes: a dictionary of sizes from Cursor.setoutputsize, keyed
+        by column index, (starting from 0), or None for the default
+    :return: a generator of DataType instances
+    :raises: DataError if a column has an unsupported type
+    """
+    outputsizes = outputsizes or {}
     meta = rs.getMetaData()
     try:
         count = meta.getColumnCount()
@@ -380,26 +521,325 @@ def _fetch_funcs(rs):
                 meta.getColumnType(i + 1),
                 meta.getColumnName(i + 1)
             ))
-        yield dt()
+            continue
+        yield dt.for_column(meta, i + 1, outputsizes.get(i, outputsizes.get(None)))
     if errors:
         raise DataError('\n'.join(errors))
 
 
-def _fetch_row(rs, funcs):
-    for i, fn in enumerate(funcs):
-        yield fn.get(rs, i + 1)
+def _row_decoder(rs, outputsizes=None):
+    """
+    Build a function which decodes the current row of a result set into a tuple.
+
+    The column types are looked up once, and the source of a function is
+    generated which calls the bound ResultSet getters for each column directly,
+    so fetching a row doesn't go through the metadata or the datatype registry.
+
+    :param rs: the ResultSet instance
+    :param outputsizes: the sizes of large columns, (see `_fetch_funcs`)
+    :return: a function taking no arguments, returning the current row as a tuple
+    :raises: DataError if a column has an unsupported type
+    """
+    with _local_frame(rs.env.env, METADATA_FRAME_SIZE):
+        funcs = tuple(_fetch_funcs(rs, outputsizes))
+    namespace = {'rs': rs, 'was_null': rs.wasNull}
+    lines = ['def decode():']
+    for i, dt in enumerate(funcs):
+        if dt.getter is None or type(dt).get is not DataType.get:
+            namespace['f%d' % i] = dt.get
+            lines.append('    v%d = f%d(rs, %d)' % (i, i, i + 1))
+            continue
+        namespace['g%d' % i] = getattr(rs, dt.getter)
+        lines.append('    v%d = g%d(%d)' % (i, i, i + 1))
+        lines.append('    if was_null():')
+        lines.append('        v%d = None' % i)
+        if getattr(dt.to_python, '__func__', None) is not _default_to_python:
+            namespace['c%d' % i] = dt.to_python
+            lines.append('    else:')
+            lines.append('        v%d = c%d(v%d)' % (i, i, i))
+    lines.append('    return (%s)' % ''.join('v%d, ' % i for i in range(len(funcs))))
+    six.exec_(compile('\n'.join(lines), '<row decoder>', 'exec'), namespace)
+    decode = namespace['decode']
+    decode.columns = len(funcs)
+    return decode
+
+
+def _read_rows(rs, decode, size):
+    """
+    Read and decode the next rows of a result set, in a local frame sized for
+    the batch, so the objects returned by the getters are freed afterwards.
+
+    :param rs: the ResultSet instance
+    :param decode: the row decoder, (see `_row_decoder`)
+    :param size: the maximum number of rows to read
+    :return: a list of rows
+    :raises: DatabaseError for a Java exception
+    """
+    rows = []
+    try:
+        with _local_frame(rs.env.env, size * decode.columns):
+            for _ in range(size):
+                if not rs._next():
+                    break
+                rows.append(decode())
+    except LangException.Instance as e:
+        raise DatabaseError.from_java(e)
+    return rows
+
+
+def _read_all_rows(rs, decode, size):
+    """
+    Read and decode the rest of the rows of a result set, in batches, (see `_read_rows`).
+
+    :param rs: the ResultSet instance
+    :param decode: the row decoder, (see `_row_decoder`)
+    :param size: the number of rows in each batch
+    :return: a tuple of rows
+    """
+    size = max(size, 1)
+    rows = []
+    while True:
+        batch = _read_rows(rs, decode, size)
+        rows.extend(batch)
+        if len(batch) < size:
+            return tuple(rows)
+
+
+def _column_fetcher(rs):
+    """
+    Create a py2jdbc.ColumnFetcher for the columns of a result set.
+
+    :param rs: the ResultSet instance
+    :return: a ColumnFetcher instance
+    :raises: DataError if a column can't be fetched in bulk
+    """
+    fetcher = rs.env.get(ColumnFetcher.class_name)
+    kinds = []
+    scales = []
+    with _local_frame(rs.env.env, METADATA_FRAME_SIZE):
+        for dt in _fetch_funcs(rs):
+            if dt.column is None:
+                raise DataError("datatype %r can't be fetched by column" % dt.name)
+            kinds.append(getattr(fetcher, dt.column))
+            scales.append(getattr(dt, 'scale', 0))
+    return fetcher.new(rs, kinds, scales).keep()
+
+
+class _Prefetcher(object):
+    """
+    Reads batches of rows from a result set in a background thread, into a bounded queue.
+
+    The thread attaches to the JVM with its own ThreadEnv, and reads the result
+    set through a global reference, since local references and JNIEnv pointers
+    can't be shared between threads.
+    """
+    # marks the end of the result set in the queue
+    done = object()
+
+    def __init__(self, rs, size, depth):
+        """
+        Start the prefetch thread.
+
+        :param rs: the ResultSet instance
+        :param size: the number of rows in each batch
+        :param depth: the maximum number of batches waiting in the queue
+        """
+        self.env = rs.env.env
+        self.ref = self.env.NewGlobalRef(rs.obj)
+        self.queue = queue.Queue(depth)
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, args=(size,), name='py2jdbc-prefetch')
+        self.thread.daemon = True
+        self.thread.start()
+
+    def put(self, item):
+        """
+        Add an item to the queue, waiting for room unless the prefetcher is stopped.
+
+        :param item: a batch of rows, an exception or `done`
+        :return: False if the prefetcher was stopped
+        """
+        while not self.stopped.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def run(self, size):
+        """
+        The thread body, which reads batches until the result set is exhausted,
+        the prefetcher is stopped, or an error occurs.
+
+        :param size: the number of rows in each batch
+        """
+        try:
+            env = get_env()
+            rs = env.get('java.sql.ResultSet')(self.ref)
+            decode = _row_decoder(rs)
+            while True:
+                rows = _read_rows(rs, decode, size)
+                if rows and not self.put(rows):
+                    return
+                if len(rows) < size:
+                    break
+            self.put(self.done)
+        except LangException.Instance as e:
+            # the message is read here, since the exception is only valid in this thread
+            self.put(OperationalError.from_java(e, message=True))
+        except Error as e:
+            if e.cause is not None:
+                e = type(e).from_java(e.cause, message=True)
+            self.put(e)
+        except Exception as e:
+            self.put(e)
+        finally:
+            detach_thread()
+
+    def get(self):
+        """
+        Wait for the next item from the queue.
+
+        :return: a batch of rows, `done`, or raises an exception from the thread.
+        """
+        item = self.queue.get()
+        if isinstance(item, Exception):
+            self.queue.put(self.done)
+            raise item
+        if item is self.done:
+            self.queue.put(self.done)
+        return item
+
+    def stop(self):
+        """
+        Stop the thread, wait for it to exit, and release the global reference.
+        """
+        self.stopped.set()
+        while self.thread.is_alive():
+            try:
+                self.queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        self.env.DeleteGlobalRef(self.ref)
+
+
+class StatementCache(object):
+    """
+    The least recently used prepared statements of a connection, by SQL text.
+
+    Statements are taken out of the cache while a cursor uses them, (so two
+    cursors never share one), and put back when the cursor is done with them,
+    closing the least recently used statement if the cache is full.
+    """
+    def __init__(self, maxsize=STATEMENT_CACHE_SIZE):
+        """
+        :param maxsize: the maximum number of statements kept, or 0 to close them after use
+        """
+        self.maxsize = maxsize
+        self.statements = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.statements)
+
+    def __contains__(self, sql):
+        return sql in self.statements
+
+    def get(self, sql):
+        """
+        Take a statement out of the cache, with its parameters cleared.
+
+        :param sql: the SQL text
+        :return: a PreparedStatement instance, or None if it isn't cached
+        """
+        stmt = self.statements.pop(sql, None)
+        if stmt is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        stmt.clearParameters()
+        return stmt
+
+    def put(self, sql, stmt):
+        """
+        Put a statement back in the cache, as the most recently used.
+
+        The statement is closed instead if another one is cached for the same SQL,
+        and the least recently used statements are closed if the cache is full.
+
+        :param sql: the SQL text
+        :param stmt: a PreparedStatement instance
+        """
+        if self.maxsize <= 0 or sql in self.statements:
+            _close_statement(stmt)
+            return
+        self.statements[sql] = stmt
+        while len(self.statements) > self.maxsize:
+            _close_statement(self.statements.popitem(last=False)[1])
+
+    def clear(self):
+        """
+        Close all the cached statements.
+        """
+        statements, self.statements = self.statements, OrderedDict()
+        for stmt in statements.values():
+            _close_statement(stmt)
+
+
+def _close_statement(stmt):
+    """
+    Close a statement, ignoring errors, (like the connection being closed already),
+    and delete its reference.
+
+    :param stmt: a PreparedStatement instance
+    """
+    try:
+        stmt.close()
+    except LangException.Instance:
+        pass
+    stmt.release()
+
+
+def _close_result_set(rs):
+    """
+    Close a result set, ignoring errors, and delete its reference.
+
+    :param rs: a ResultSet instance
+    """
+    try:
+        rs.close()
+    except LangException.Instance:
+        pass
+    rs.release()
 
 
 class Cursor(object):
     """
     The DBI Cursor object.  It allows you to execute SQL statements and manage
     the results.  If a query, this object becaomes an interator.
+
+    With `prefetch`, rows are read ahead in batches of `arraysize` by a
+    background thread, keeping up to `prefetch` batches waiting.
+
+    Queries are prepared forward-only and read-only, with `arraysize` passed
+    to the driver as the fetch size, and `maxrows`, if set, as the limit on
+    the number of rows returned.
     """
-    def __init__(self, conn):
+    def __init__(self, conn, prefetch=0):
         self._conn = conn
         self._rs = None
+        self._stmt = None
+        self._decoder = None
+        self._fetcher = None
+        self._prefetcher = None
+        self._rows = deque()
         self.rowcount = None
         self.arraysize = 100
+        self.maxrows = 0
+        self.prefetch = prefetch
+        self._outputsizes = {}
 
     def __enter__(self):
         return self
@@ -422,6 +862,61 @@ class Cursor(object):
     def connection(self):
         return self._conn
 
+    @property
+    def _columns(self):
+        """
+        The column fetcher for the current result set, created on first use.
+
+        :return: a py2jdbc.ColumnFetcher instance
+        """
+        if self.prefetch:
+            raise NotSupportedError("column fetches aren't supported with prefetch")
+        if self._fetcher is None:
+            self._fetcher = _column_fetcher(self._rs)
+        return self._fetcher
+
+    def _prefetched(self, size):
+        """
+        Take rows read by the prefetch thread, starting it if needed.
+
+        :param size: the maximum number of rows, or None for all of them
+        :return: a list of rows
+        """
+        if self._prefetcher is None:
+            self._prefetcher = _Prefetcher(self._rs, self.arraysize, self.prefetch)
+        rows = []
+        while size is None or len(rows) < size:
+            if not self._rows:
+                batch = self._prefetcher.get()
+                if batch is _Prefetcher.done:
+                    break
+                self._rows.extend(batch)
+            count = len(self._rows)
+            if size is not None:
+                count = min(count, size - len(rows))
+            rows.extend(self._rows.popleft() for _ in range(count))
+        return rows
+
+    def _stop_prefetch(self):
+        """
+        Stop the prefetch thread, if any, and discard the rows it read.
+        """
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+            self._prefetcher = None
+        self._rows.clear()
+
+    @property
+    def _decode(self):
+        """
+        The row decoder for the current result set, built on first use.
+
+        :return: a function returning the current row as a tuple
+        """
+        if self._decoder is None:
+            self._decoder = _row_decoder(self._rs, self._outputsizes)
+        return self._decoder
+
     @property
     def description(self):
         """
@@ -439,20 +934,21 @@ class Cursor(object):
         """
         if self._rs is None:
             return None
-        meta = self._rs.getMetaData()
-        count = meta.getColumnCount()
-        results = tuple(
-            (
-                meta.getColumnName(i + 1),
-                meta.getColumnType(i + 1),
-                meta.getColumnTypeName(i + 1),
-                meta.getColumnDisplaySize(i + 1),
-                meta.getPrecision(i + 1),
-                meta.getScale(i + 1),
-                meta.isNullable(i + 1) == meta.cls.columnNullable
+        with _local_frame(self._rs.env.env, METADATA_FRAME_SIZE):
+            meta = self._rs.getMetaData()
+            count = meta.getColumnCount()
+            results = tuple(
+                (
+                    meta.getColumnName(i + 1),
+                    meta.getColumnType(i + 1),
+                    meta.getColumnTypeName(i + 1),
+                    meta.getColumnDisplaySize(i + 1),
+                    meta.getPrecision(i + 1),
+                    meta.getScale(i + 1),
+                    meta.isNullable(i + 1) == meta.cls.columnNullable
+                )
+                for i in range(count)
             )
-            for i in range(count)
-        )
         return tuple(
             (
                 res[0],
@@ -509,45 +1005,62 @@ class Cursor(object):
         if returns:
             sql = '?= ' + sql
         stmt = self._conn.conn.prepareCall('{ %s }' % sql)
-        j = 0
-        for i, col in enumerate(cols):
-            if col.column_type in (meta.functionColumnIn, meta.functionColumnInOut):
-                stmt.set(col.column_name, args[j])
-                j += 1
-            elif col.column_type in (
-                meta.functionColumnInOut,
-                meta.functionColumnOut,
-                meta.functionReturn,
-            ):
-                stmt.registerOutParameter(col.ordinal_position + 1, col.data_type)
-        check = stmt.execute()
-        if check:
-            rs2 = stmt.getResultSet()
-            funcs = tuple(_fetch_funcs(rs2))
-            return tuple(
-                tuple(_fetch_row(rs2, funcs))
-                for _ in rs2
-            )
-
-        results = []
-        for i, col in enumerate(cols):
-            if col.column_type in (meta.functionColumnOut, meta.functionReturn):
-                dt = datatypes[col.data_type]()
-                value = dt.get(stmt, col.ordinal_position + 1)
-                results.append(value)
-        if len(results) == 0:
-            return None
-        elif len(results) == 1:
-            return results[0]
-        return results
+        try:
+            j = 0
+            for i, col in enumerate(cols):
+                if col.column_type in (meta.functionColumnIn, meta.functionColumnInOut):
+                    stmt.set(col.column_name, args[j])
+                    j += 1
+                elif col.column_type in (
+                    meta.functionColumnInOut,
+                    meta.functionColumnOut,
+                    meta.functionReturn,
+                ):
+                    stmt.registerOutParameter(col.ordinal_position + 1, col.data_type)
+            check = stmt.execute()
+            if check:
+                rs2 = stmt.getResultSet()
+                try:
+                    return _read_all_rows(rs2, _row_decoder(rs2), self.arraysize)
+                finally:
+                    _close_result_set(rs2)
+
+            results = []
+            for i, col in enumerate(cols):
+                if col.column_type in (meta.functionColumnOut, meta.functionReturn):
+                    dt = datatypes[col.data_type]()
+                    value = dt.get(stmt, col.ordinal_position + 1)
+                    results.append(value)
+            if len(results) == 0:
+                return None
+            elif len(results) == 1:
+                return results[0]
+            return results
+        finally:
+            _close_statement(stmt)
 
     def close(self):
         """
         Close the cursor and make it inaccessible.
         """
+        self._stop_prefetch()
+        self._close_results()
+        self._decoder = None
+
+    def _close_results(self):
+        """
+        Close the result set of the last query, and give its statement back to the connection.
+        """
+        if self._fetcher is not None:
+            self._fetcher.release()
+            self._fetcher = None
         if self._rs is not None:
-            self._rs.close()
+            _close_result_set(self._rs)
             self._rs = None
+        if self._stmt is not None:
+            sql, stmt = self._stmt
+            self._stmt = None
+            self._conn.release_statement(sql, stmt)
 
     def execute(self, sql, args=None):
         """
@@ -559,10 +1072,13 @@ class Cursor(object):
         """
         if not isinstance(sql, six.string_types):
             raise ValueError("sql must be string")
+        self._stop_prefetch()
+        self._close_results()
         try:
-            stmt = self._conn.conn.prepareStatement(sql)
+            stmt = self._conn.prepare_statement(sql)
         except SQLException.Instance as e:
-            raise OperationalError(e.message)
+            raise OperationalError.from_java(e)
+        self._limit(stmt)
         if args:
             if hasattr(args, '__getitem__'):
                 args = [args[i] for i in range(len(args))]
@@ -570,27 +1086,73 @@ class Cursor(object):
                 for i, arg in enumerate(args):
                     stmt.set(i + 1, arg)
             except SQLException.Instance as e2:
-                raise ProgrammingError(e2.message)
+                stmt.close_streams()
+                _close_statement(stmt)
+                raise ProgrammingError.from_java(e2)
             except LangException.Instance as e1:
-                raise ProgrammingError(e1.message)
+                stmt.close_streams()
+                _close_statement(stmt)
+                raise ProgrammingError.from_java(e1)
+            except BaseException:
+                # like a TypeError for an unsupported parameter type
+                stmt.close_streams()
+                _close_statement(stmt)
+                raise
         try:
             check = stmt.execute()
         except LangException.Instance as e:
+            _close_statement(stmt)
             if isinstance(e, SQLException.Instance):
-                raise OperationalError(e.message)
-            raise ProgrammingError(e.message)
-
+                raise OperationalError.from_java(e)
+            raise ProgrammingError.from_java(e)
+        except BaseException:
+            _close_statement(stmt)
+            raise
+        finally:
+            stmt.close_streams()
+
+        self._decoder = None
         if check:
-            self._rs = stmt.getResultSet()
+            self._rs = stmt.getResultSet().keep()
+            self._stmt = (sql, stmt)
         else:
             count = stmt.getUpdateCount()
-            if count == -1:
-                self._rs = None
-            else:
+            if count != -1:
                 self.rowcount = count
-            stmt.close()
+            self._conn.release_statement(sql, stmt)
         return self
 
+    def _limit(self, stmt):
+        """
+        Pass the cursor's fetch size and row limit to a prepared statement.
+
+        The fetch size is only a hint, so it's skipped if the driver rejects it.
+
+        :param stmt: a py2jdbc.sql.PreparedStatement instance
+        :raises: ProgrammingError if the driver rejects `maxrows`,
+            NotSupportedError if it can't limit to more than 2**31 - 1 rows.
+        """
+        if self.arraysize > 0:
+            try:
+                stmt.setFetchSize(min(self.arraysize, 0x7fffffff))
+            except LangException.Instance:
+                pass
+        if self.maxrows == stmt.maxrows:
+            return
+        try:
+            if self.maxrows > 0x7fffffff:
+                stmt.setLargeMaxRows(self.maxrows)
+            else:
+                stmt.setMaxRows(self.maxrows)
+        except SQLException.Instance as e:
+            _close_statement(stmt)
+            raise ProgrammingError.from_java(e)
+        except LangException.Instance as e:
+            _close_statement(stmt)
+            raise NotSupportedError.from_java(e)
+        # statements are reused, so the limit is reset when a cursor has none
+        stmt.maxrows = self.maxrows
+
     def executemany(self, sql, rows):
         """
         Prepare a database operation and execute it against each row.
@@ -603,15 +1165,22 @@ class Cursor(object):
             raise ValueError("wrong datatype for sql")
         self.rowcount = None
         try:
-            stmt = self._conn.conn.prepareStatement(sql)
+            stmt = self._conn.prepare_statement(sql)
         except SQLException.Instance as e:
-            raise DatabaseError(e.message)
+            raise DatabaseError.from_java(e)
 
-        for row in rows:
-            for i, col in enumerate(row):
-                stmt.set(i + 1, col)
-            stmt.addBatch()
-        self.rowcount = sum(stmt.executeBatch())
+        try:
+            for row in rows:
+                for i, col in enumerate(row):
+                    stmt.set(i + 1, col)
+                stmt.addBatch()
+            self.rowcount = sum(stmt.executeBatch())
+        except BaseException:
+            stmt.close_streams()
+            _close_statement(stmt)
+            raise
+        stmt.close_streams()
+        self._conn.release_statement(sql, stmt)
         return True
 
     def fetchall(self):
@@ -620,11 +1189,154 @@ class Cursor(object):
         sequences.  An empty sequence is returned when no more rows are available.
         :return: a sequence of sequences or empty sequence.
         """
-        funcs = tuple(_fetch_funcs(self._rs))
-        return tuple(
-            tuple(_fetch_row(self._rs, funcs))
-            for _ in self._rs
-        )
+        if self.prefetch:
+            return tuple(self._prefetched(None))
+        return _read_all_rows(self._rs, self._decode, self.arraysize)
+
+    def fetch_columns(self, size=None):
+        """
+        Fetch the next set of rows of a query result, column by column.
+
+        The rows are read inside the JVM, and each column is copied out with
+        a single call, instead of calling a getter for every value.
+        Each column is returned as a Column(values, nulls) pair, where nulls
+        is a bitmap with a bit set for each NULL value, (see py2jdbc.columns.is_null).
+
+        Integer and boolean columns are arrays of longs, floating point columns are
+        arrays of doubles, text and binary columns are lists, and decimal columns
+        are lists of exact `decimal.Decimal` values.
+        DATE columns are days, TIME columns milliseconds since midnight, and
+        TIMESTAMP columns microseconds since the epoch, all in local time.
+
+        :param size: the number of rows to fetch, or arraysize if not specified.
+        :return: a sequence of Column values, one per column, which are empty
+            when no more rows are available.
+        """
+        if self._rs is None:
+            return None
+        return self._columns.fetch(size or self.arraysize)
+
+    def _column_batches(self, size=None):
+        """
+        Generate batches of columns with fetch_columns, until there are no more rows.
+
+        :param size: the number of rows in each batch, or arraysize if not specified.
+        :return: a generator of column sequences
+        """
+        while True:
+            columns = self.fetch_columns(size)
+            if not columns or len(columns[0].values) == 0:
+                break
+            yield columns
+
+    def fetchnumpy(self):
+        """
+        Fetch the rest of the rows of a query result as NumPy arrays, one per column.
+
+        Integer, floating point and boolean columns are masked arrays, DATE and
+        TIMESTAMP columns are datetime64 arrays and TIME columns timedelta64 arrays,
+        with NaT for NULL values.  Other columns are object arrays, (of exact
+        `decimal.Decimal` values for DECIMAL and NUMERIC columns).
+
+        Requires NumPy.
+
+        :return: an OrderedDict of arrays keyed by column name, or None if no query was executed.
+        """
+        if self._rs is None:
+            return None
+        return to_numpy(self.description, self._column_batches())
+
+    def fetch_dataframe(self):
+        """
+        Fetch the rest of the rows of a query result as a pandas DataFrame.
+
+        Requires NumPy and pandas.
+
+        :return: a pandas.DataFrame, or None if no query was executed.
+        """
+        if self._rs is None:
+            return None
+        return to_dataframe(self.description, self._column_batches())
+
+    def iter_dataframes(self, chunksize=None):
+        """
+        Iterate over the rest of the rows of a query result as pandas DataFrames.
+
+        Requires NumPy and pandas.
+
+        :param chunksize: the number of rows in each DataFrame, or arraysize if not specified.
+        :return: a generator of pandas.DataFrame objects
+        """
+        if self._rs is None:
+            return
+        description = self.description
+        for columns in self._column_batches(chunksize):
+            yield to_dataframe(description, (columns,))
+
+    def _arrow_batches(self, schema, description, batch_size):
+        """
+        Generate Arrow record batches until there are no more rows.
+
+        :param schema: the Arrow schema of the result
+        :param description: the cursor description
+        :param batch_size: the number of rows in each batch, or arraysize if not specified.
+        :return: a generator of pyarrow.RecordBatch objects
+        """
+        while True:
+            count, buffers = self._columns.fetch_buffers(batch_size or self.arraysize)
+            if count == 0:
+                break
+            yield to_record_batch(schema, description, count, buffers)
+
+    def fetch_arrow_batches(self, batch_size=None):
+        """
+        Iterate over the rest of the rows of a query result as Arrow record batches.
+
+        The schema is derived from the result set metadata, (DECIMAL and NUMERIC
+        columns are decimal128 or decimal256, with the column precision and scale),
+        and each batch is assembled from the column buffers copied out of the JVM.
+
+        Requires pyarrow.
+
+        :param batch_size: the number of rows in each batch, or arraysize if not specified.
+        :return: a generator of pyarrow.RecordBatch objects
+        """
+        if self._rs is None:
+            return
+        description = self.description
+        for batch in self._arrow_batches(arrow_schema(description), description, batch_size):
+            yield batch
+
+    def fetch_arrow_table(self, batch_size=None):
+        """
+        Fetch the rest of the rows of a query result as an Arrow table.
+
+        Requires pyarrow.
+
+        :param batch_size: the number of rows fetched at a time, or arraysize if not specified.
+        :return: a pyarrow.Table, or None if no query was executed.
+        """
+        if self._rs is None:
+            return None
+        description = self.description
+        schema = arrow_schema(description)
+        batches = list(self._arrow_batches(schema, description, batch_size))
+        return to_arrow_table(schema, batches)
+
+    def iter_batches(self, size=None):
+        """
+        Iterate over the rest of the rows of a query result in batches.
+
+        :param size: the number of rows in each batch, or arraysize if not specified.
+        :return: a generator of lists of rows
+        """
+        if self._rs is None:
+            return
+        while True:
+            rows = self.fetchmany(size)
+            if not rows:
+                break
+            yield list(rows)
 
     def fetchmany(self, size=None):
         """
@@ -634,15 +1346,9 @@ class Cursor(object):
         :param size: the number of rows to fetch, or arraysize if not specified.
         :return: a sequence of sequences or empty sequence.
         """
-        funcs = tuple(_fetch_funcs(self._rs))
-        rows = []
-        for i in range(size or self.arraysize):
-            try:
-                six.next(self._rs)
-            except StopIteration:
-                break
-            rows.append(tuple(_fetch_row(self._rs, funcs)))
-        return tuple(rows)
+        if self.prefetch:
+            return tuple(self._prefetched(size or self.arraysize))
+        return tuple(_read_rows(self._rs, self._decode, size or self.arraysize))
 
     def fetchone(self):
         """
@@ -652,12 +1358,11 @@ class Cursor(object):
         """
         if self._rs is None:
             return
-        try:
-            self._rs.next()
-        except StopIteration:
-            return
-        funcs = tuple(_fetch_funcs(self._rs))
-        return tuple(_fetch_row(self._rs, funcs))
+        if self.prefetch:
+            rows = self._prefetched(1)
+        else:
+            rows = _read_rows(self._rs, self._decode, 1)
+        return rows[0] if rows else None
 
     def setinputsizes(self, sizes):
         """
@@ -676,12 +1381,17 @@ class Cursor(object):
         Not specifying the column will set the default size for all large
         columns.
 
-        This implementation currently does nothing.
+        BLOB and CLOB values longer than the size are returned as seekable
+        file-like readers, (py2jdbc.lob.BlobReader and ClobReader), instead of
+        bytes and strings.  Readers can only be read until the transaction ends,
+        which, in autocommit mode, can be as soon as the last row is fetched.
+        Values are always read whole with `prefetch`, or by column.
 
         :param size: the size of the column.
         :param column: the column index to apply this size
         """
-        pass
+        self._outputsizes[column] = size
+        self._decoder = None
 
 
 Function = namedtuple('Function', (
@@ -777,9 +1487,13 @@ class Connection(object):
     ProgrammingError = ProgrammingError
     NotSupportedError = NotSupportedError
 
-    def __init__(self):
+    def __init__(self, statement_cache_size=STATEMENT_CACHE_SIZE):
+        """
+        :param statement_cache_size: the number of prepared statements kept for reuse
+        """
         self.conn = None
         self._autocommit = False
+        self.statement_cache = StatementCache(statement_cache_size)
 
     def __enter__(self):
         return self
@@ -791,6 +1505,23 @@ class Connection(object):
         if self.conn is None:
             raise InterfaceError("not connected")
 
+    @contextlib.contextmanager
+    def _metadata(self, name, *args):
+        """
+        Read a metadata result set in a local frame, which frees the references to
+        the metadata and result set objects when it ends.  The result set is closed
+        when the block ends.
+
+        :param name: the DatabaseMetaData method returning the result set, (like 'getTables')
+        :param args: the method arguments
+        """
+        with _local_frame(self.conn.env.env, METADATA_FRAME_SIZE):
+            rs = getattr(self.conn.getMetaData(), name)(*args)
+            try:
+                yield rs
+            finally:
+                _close_result_set(rs)
+
     @property
     def autocommit(self):
         """
@@ -814,16 +1545,53 @@ class Connection(object):
 
     @property
     def catalogs(self):
-        rs = self.conn.getMetaData().getCatalogs()
-        return tuple(rs.getString(1) for _ in rs)   # table_cat
+        with self._metadata('getCatalogs') as rs:
+            return tuple(rs.getString(1) for _ in rs)   # table_cat
 
     def close(self):
         """
         Close the connection now.
         """
-        if self.conn is not None:
-            self.conn.close()
-        self.conn = None
+        self.statement_cache.clear()
+        conn, self.conn = self.conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            finally:
+                conn.release()
+
+    def prepare_statement(self, sql):
+        """
+        Get a prepared statement for some SQL, from the statement cache if possible.
+
+        Queries are prepared forward-only and read-only.  The statement should be given
+        back with `release_statement` once its results have been read.
+
+        :param sql: the SQL text
+        :return: a PreparedStatement instance
+        """
+        self.is_connected()
+        stmt = self.statement_cache.get(sql)
+        if stmt is None:
+            rs_class = self.conn.env.get('java.sql.ResultSet')
+            stmt = self.conn.prepareStatement(
+                sql,
+                rs_class.TYPE_FORWARD_ONLY,
+                rs_class.CONCUR_READ_ONLY
+            ).keep()
+        return stmt
+
+    def release_statement(self, sql, stmt):
+        """
+        Give a statement from `prepare_statement` back, for reuse.
+
+        :param sql: the SQL text
+        :param stmt: the PreparedStatement instance
+        """
+        if self.conn is None:
+            _close_statement(stmt)
+        else:
+            self.statement_cache.put(sql, stmt)
 
     def commit(self):
         """
@@ -834,53 +1602,55 @@ class Connection(object):
         if not self._autocommit:
             self.conn.commit()
 
-    def cursor(self):
+    def cursor(self, prefetch=0):
         """
         Create a new Cursor object using this connection.
+
+        :param prefetch: the number of batches of rows to read ahead in a background
+            thread, or 0 to read rows as they are fetched.
         :return: a new Cursor object
         """
         self.is_connected()
-        return Cursor(self)
+        return Cursor(self, prefetch=prefetch)
 
     def function_columns(self, catalog=None, schemas=None, functions=None, columns=None):
-        meta = self.conn.getMetaData()
-        rs = meta.getFunctionColumns(catalog, schemas, functions, columns)
-        return tuple(
-            FunctionColumns(
-                function_cat=rs.getString(1),    # FUNCTION_CAT
-                function_schem=rs.getString(2),    # FUNCTION_SCHEM
-                function_name=rs.getString(3),    # FUNCTION_NAME
-                column_name=rs.getString(4),    # COLUMN_NAME
-                column_type=rs.getInt(5),       # COLUMN_TYPE
-                data_type=rs.getInt(6),       # DATA_TYPE
-                type_name=rs.getString(7),    # TYPE_NAME
-                precision=rs.getInt(8),       # PRECISION
-                length=rs.getInt(9),       # LENGTH
-                scale=rs.getInt(10),      # SCALE
-                radix=rs.getInt(11),      # RADIX
-                nullable=rs.getInt(12),      # NULLABLE
-                remarks=rs.getString(13),   # REMARKS
-                char_octet_length=rs.getInt(14),      # CHAR_OCTET_LENGTH
-                ordinal_position=rs.getInt(15),      # ORDINAL_POSITION
-                is_nullable=rs.getString(16),   # IS_NULLABLE
-                specific_name=rs.getString(17),   # SPECIFIC_NAME
+        with self._metadata('getFunctionColumns', catalog, schemas, functions, columns) as rs:
+            return tuple(
+                FunctionColumns(
+                    function_cat=rs.getString(1),    # FUNCTION_CAT
+                    function_schem=rs.getString(2),    # FUNCTION_SCHEM
+                    function_name=rs.getString(3),    # FUNCTION_NAME
+                    column_name=rs.getString(4),    # COLUMN_NAME
+                    column_type=rs.getInt(5),       # COLUMN_TYPE
+                    data_type=rs.getInt(6),       # DATA_TYPE
+                    type_name=rs.getString(7),    # TYPE_NAME
+                    precision=rs.getInt(8),       # PRECISION
+                    length=rs.getInt(9),       # LENGTH
+                    scale=rs.getInt(10),      # SCALE
+                    radix=rs.getInt(11),      # RADIX
+                    nullable=rs.getInt(12),      # NULLABLE
+                    remarks=rs.getString(13),   # REMARKS
+                    char_octet_length=rs.getInt(14),      # CHAR_OCTET_LENGTH
+                    ordinal_position=rs.getInt(15),      # ORDINAL_POSITION
+                    is_nullable=rs.getString(16),   # IS_NULLABLE
+                    specific_name=rs.getString(17),   # SPECIFIC_NAME
+                )
+                for _ in rs
             )
-            for _ in rs
-        )
 
     def functions(self, catalog=None, schemas=None, functions=None):
-        rs = self.conn.getMetaData().getFunctions(catalog, schemas, functions)
-        return tuple(
-            Function(
-                function_cat=rs.getString(1),
-                function_schem=rs.getString(2),
-                function_name=rs.getString(3),
-                remarks=rs.getString(4),
-                function_type=rs.getInt(5),
-                specific_name=rs.getString(6)
+        with self._metadata('getFunctions', catalog, schemas, functions) as rs:
+            return tuple(
+                Function(
+                    function_cat=rs.getString(1),
+                    function_schem=rs.getString(2),
+                    function_name=rs.getString(3),
+                    remarks=rs.getString(4),
+                    function_type=rs.getInt(5),
+                    specific_name=rs.getString(6)
+                )
+                for _ in rs
             )
-            for _ in rs
-        )
 
     def open(self, *args, **kwargs):
         """
@@ -894,54 +1664,53 @@ class Connection(object):
         dm = env.get('java.sql.DriverManager')
         self.close()
         try:
-            self.conn = dm.getConnection(*args)
+            self.conn = dm.getConnection(*args).keep()
         except SQLException.Instance as e:
-            raise OperationalError(e.message)
+            raise OperationalError.from_java(e)
         self._autocommit = self.conn.getAutoCommit()
         return self
 
     def procedure_columns(self, catalog=None, schemas=None, procedures=None, columns=None):
-        meta = self.conn.getMetaData()
-        rs = meta.getProcedureColumns(catalog, schemas, procedures, columns)
-        return tuple(
-            ProcedureColumn(
-                procedure_cat=rs.getString(1),
-                procedure_schem=rs.getString(2),
-                procedure_name=rs.getString(3),
-                column_name=rs.getString(4),
-                column_type=rs.getInt(5),
-                data_type=rs.getInt(6),
-                type_name=rs.getString(7),
-                precision=rs.getInt(8),
-                length=rs.getInt(9),
-                scale=rs.getInt(10),
-                radix=rs.getInt(11),
-                nullable=rs.getInt(12),
-                remarks=rs.getString(13),
-                column_def=rs.getString(14),
-                sql_data_type=rs.getInt(15),
-                sql_datetime_sub=rs.getInt(16),
-                char_octet_length=rs.getInt(17),
-                ordinal_position=rs.getInt(18),
-                is_nullable=rs.getString(19),
-                specific_name=rs.getString(20)
+        with self._metadata('getProcedureColumns', catalog, schemas, procedures, columns) as rs:
+            return tuple(
+                ProcedureColumn(
+                    procedure_cat=rs.getString(1),
+                    procedure_schem=rs.getString(2),
+                    procedure_name=rs.getString(3),
+                    column_name=rs.getString(4),
+                    column_type=rs.getInt(5),
+                    data_type=rs.getInt(6),
+                    type_name=rs.getString(7),
+                    precision=rs.getInt(8),
+                    length=rs.getInt(9),
+                    scale=rs.getInt(10),
+                    radix=rs.getInt(11),
+                    nullable=rs.getInt(12),
+                    remarks=rs.getString(13),
+                    column_def=rs.getString(14),
+                    sql_data_type=rs.getInt(15),
+                    sql_datetime_sub=rs.getInt(16),
+                    char_octet_length=rs.getInt(17),
+                    ordinal_position=rs.getInt(18),
+                    is_nullable=rs.getString(19),
+                    specific_name=rs.getString(20)
+                )
+                for _ in rs
             )
-            for _ in rs
-        )
 
     def procedures(self, catalog=None, schemas=None, procedures=None):
-        rs = self.conn.getMetaData().getProcedures(catalog, schemas, procedures)
-        return tuple(
-            Procedure(
-                procedure_cat=rs.getString(1),
-                procedure_schem=rs.getString(2),
-                procedure_name=rs.getString(3),
-                remarks=rs.getString(7),
-                procedure_type=rs.getInt(8),
-                specific_name=rs.getString(9)
+        with self._metadata('getProcedures', catalog, schemas, procedures) as rs:
+            return tuple(
+                Procedure(
+                    procedure_cat=rs.getString(1),
+                    procedure_schem=rs.getString(2),
+                    procedure_name=rs.getString(3),
+                    remarks=rs.getString(7),
+                    procedure_type=rs.getInt(8),
+                    specific_name=rs.getString(9)
+                )
+                for _ in rs
             )
-            for _ in rs
-        )
 
     def rollback(self):
         """
@@ -953,32 +1722,32 @@ class Connection(object):
             self.conn.rollback()
 
     def schemas(self, catalog=None, schemas=None):
-        rs = self.conn.getMetaData().getSchemas(catalog, schemas)
-        return tuple(
-            Schema(
-                table_schem=rs.getString(1),
-                table_catalog=rs.getString(2)
+        with self._metadata('getSchemas', catalog, schemas) as rs:
+            return tuple(
+                Schema(
+                    table_schem=rs.getString(1),
+                    table_catalog=rs.getString(2)
+                )
+                for _ in rs
             )
-            for _ in rs
-        )
 
     def tables(self, catalog=None, schemas=None, tables=None, types=None):
-        rs = self.conn.getMetaData().getTables(catalog, schemas, tables, types)
-        return tuple(
-            Table(
-                table_cat=rs.getString(1),
-                table_schem=rs.getString(2),
-                table_name=rs.getString(3),
-                table_type=rs.getString(4),
-                remarks=rs.getString(5),
-                type_cat=rs.getString(6),
-                type_schem=rs.getString(7),
-                type_name=rs.getString(8),
-                self_referencing_col_name=rs.getString(9),
-                ref_generation=rs.getString(10)
+        with self._metadata('getTables', catalog, schemas, tables, types) as rs:
+            return tuple(
+                Table(
+                    table_cat=rs.getString(1),
+                    table_schem=rs.getString(2),
+                    table_name=rs.getString(3),
+                    table_type=rs.getString(4),
+                    remarks=rs.getString(5),
+                    type_cat=rs.getString(6),
+                    type_schem=rs.getString(7),
+                    type_name=rs.getString(8),
+                    self_referencing_col_name=rs.getString(9),
+                    ref_generation=rs.getString(10)
+                )
+                for _ in rs
             )
-            for _ in rs
-        )
 
 
 def connect(*args, **kwargs):
@@ -995,10 +1764,11 @@ def connect(*args, **kwargs):
         'jdbc:hive2://localhost:10000/default'
 
     :param args: JDBC URL, with optional username and password
-    :param kwargs: JVM environment; classpath, verbose, check, etc.
+    :param kwargs: JVM environment; classpath, verbose, check, etc., and
+        `statement_cache_size`, the number of prepared statements kept for reuse.
     :return: a `Connection` object.
     """
-    db = Connection()
+    db = Connection(kwargs.pop('statement_cache_size', STATEMENT_CACHE_SIZE))
     db.open(*args, **kwargs)
     return db
 
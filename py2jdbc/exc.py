@@ -12,8 +12,48 @@ class Warning(Exception):
 class Error(Exception):
     """
     Exception that is the base class of all other error exceptions.
-    """
-    pass
+
+    Errors raised for a Java exception keep it as `cause`, with its SQL state
+    and vendor error code, and only build the message, (which walks the Java
+    stack trace), when the error is printed, on the thread which raised it.
+    """
+    cause = None
+    sqlstate = None
+    errorcode = None
+
+    @classmethod
+    def from_java(cls, cause, message=False):
+        """
+        Create an error for a Java exception, reading the SQL state and error code
+        of SQLExceptions.
+
+        The message is read from the exception when it's needed, so errors passed
+        to another thread should read it now, with `message`.
+
+        :param cause: a py2jdbc.lang.Throwable instance
+        :param message: True to read the Java exception's message, (`getMessage`),
+            when the error is created
+        :return: the error
+        """
+        if message:
+            text = cause.getMessage()
+            error = cls(cause.toString() if text is None else text)
+        else:
+            error = cls()
+        error.cause = cause
+        if hasattr(cause, 'getSQLState'):
+            error.sqlstate = cause.getSQLState()
+            error.errorcode = cause.getErrorCode()
+        return error
+
+    def __str__(self):
+        if self.cause is not None and not self.args:
+            if self.cause.on_own_thread:
+                # kept as the argument, so the error can be printed on any thread after this
+                self.args = (self.cause.message,)
+                return self.args[0]
+            return "%s, (raised on another thread)" % self.cause.cls.class_name
+        return super(Error, self).__str__()
 
 
 class InterfaceError(Error):
@@ -0,0 +1,257 @@
+# -*- coding: utf8 -*-
+"""
+Conversion of columns fetched with Cursor.fetch_columns into NumPy arrays,
+pandas DataFrames and Arrow record batches, without boxing each value in
+a Python object.
+
+NumPy, pandas and pyarrow are optional, and only imported when used.
+"""
+import array
+from collections import OrderedDict
+from py2jdbc.columns import Column, LONG_TYPECODE
+
+# the units of the values returned by py2jdbc.ColumnFetcher for temporal kinds
+UNITS = {
+    'DATE': 'datetime64[D]',
+    'TIME': 'timedelta64[ms]',
+    'TIMESTAMP': 'datetime64[us]',
+}
+
+# inverts a null bitmap into an Arrow validity bitmap
+_INVERT = bytes(bytearray(0xff - i for i in range(256)))
+
+
+def _import(name):
+    """
+    Import an optional module.
+
+    :param name: the module name
+    :return: the module
+    :raises: ImportError with a hint, if the module isn't installed.
+    """
+    try:
+        return __import__(name)
+    except ImportError:
+        raise ImportError("%s is required for this feature, (pip install %s)" % (name, name))
+
+
+def to_array(dt, column):
+    """
+    Convert a fetched column to a NumPy array.
+
+    Numeric and boolean columns become masked arrays, temporal columns
+    use NaT for NULL values, and other columns become object arrays,
+    with None for NULL values.
+
+    :param dt: the column's DataType class
+    :param column: a py2jdbc.columns.Column
+    :return: a numpy.ndarray or numpy.ma.MaskedArray
+    """
+    numpy = _import('numpy')
+    count = len(column.values)
+    if dt.dtype is None:
+        result = numpy.empty(count, dtype=object)
+        result[:] = column.values
+        return result
+    mask = numpy.unpackbits(
+        numpy.frombuffer(column.nulls, dtype=numpy.uint8),
+        bitorder='little'
+    )[:count].astype(bool)
+    if dt.column == 'DOUBLE':
+        data = numpy.frombuffer(column.values, dtype=numpy.float64)
+    else:
+        data = numpy.frombuffer(column.values, dtype=numpy.int64)
+    if dt.column in UNITS:
+        result = data.astype(UNITS[dt.column]).astype(dt.dtype)
+        result[mask] = result.dtype.type('NaT')
+        return result
+    return numpy.ma.MaskedArray(data.astype(dt.dtype), mask=mask)
+
+
+def to_numpy(description, batches):
+    """
+    Convert batches of fetched columns to NumPy arrays.
+
+    :param description: the cursor description
+    :param batches: an iterable of column sequences from Cursor.fetch_columns
+    :return: an OrderedDict of arrays, keyed by column name
+    """
+    numpy = _import('numpy')
+    arrays = [[] for _ in description]
+    for batch in batches:
+        for i, (desc, column) in enumerate(zip(description, batch)):
+            arrays[i].append(to_array(desc[1], column))
+    result = OrderedDict()
+    for desc, chunks in zip(description, arrays):
+        if not chunks:
+            chunks = [to_array(desc[1], _empty(desc[1]))]
+        if isinstance(chunks[0], numpy.ma.MaskedArray):
+            value = numpy.ma.concatenate(chunks)
+        else:
+            value = numpy.concatenate(chunks)
+        result[desc[0]] = value
+    return result
+
+
+def _empty(dt):
+    """
+    An empty column, for results without rows.
+
+    :param dt: the column's DataType class
+    :return: a py2jdbc.columns.Column
+    """
+    if dt.dtype is None:
+        return Column([], bytearray())
+    return Column(array.array('d' if dt.column == 'DOUBLE' else LONG_TYPECODE), bytearray())
+
+
+def _series(numpy, pandas, value):
+    """
+    Convert a NumPy array to data for a pandas DataFrame column.
+
+    Masked integer and boolean arrays with NULL values use the pandas nullable
+    extension types, masked floating point arrays use NaN.
+
+    :param numpy: the numpy module
+    :param pandas: the pandas module
+    :param value: a numpy.ndarray or numpy.ma.MaskedArray
+    :return: an array for the DataFrame
+    """
+    if not isinstance(value, numpy.ma.MaskedArray):
+        return value
+    mask = numpy.ma.getmaskarray(value)
+    if not mask.any():
+        return value.data
+    if value.dtype.kind == 'f':
+        return value.filled(numpy.nan)
+    if value.dtype.kind == 'b':
+        return pandas.arrays.BooleanArray(value.data, mask)
+    return pandas.arrays.IntegerArray(value.data, mask)
+
+
+def to_dataframe(description, batches):
+    """
+    Convert batches of fetched columns to a pandas DataFrame.
+
+    :param description: the cursor description
+    :param batches: an iterable of column sequences from Cursor.fetch_columns
+    :return: a pandas.DataFrame
+    """
+    numpy = _import('numpy')
+    pandas = _import('pandas')
+    arrays = to_numpy(description, batches)
+    return pandas.DataFrame(OrderedDict(
+        (name, _series(numpy, pandas, value))
+        for name, value in arrays.items()
+    ), columns=list(arrays))
+
+
+def arrow_type(pa, dt, precision, scale):
+    """
+    Map a column's DataType to an Arrow data type.
+
+    :param pa: the pyarrow module
+    :param dt: the column's DataType class
+    :param precision: the column precision, from ResultSetMetaData
+    :param scale: the column scale, from ResultSetMetaData
+    :return: a pyarrow.DataType
+    """
+    if dt.column == 'DECIMAL':
+        if 0 < precision <= 38:
+            return pa.decimal128(precision, scale)
+        return pa.decimal256(precision if 0 < precision <= 76 else 76, scale)
+    if dt.column == 'STRING':
+        return pa.string()
+    if dt.column == 'BYTES':
+        return pa.binary()
+    if dt.column == 'DATE':
+        return pa.date32()
+    if dt.column == 'TIME':
+        return pa.time32('ms')
+    if dt.column == 'TIMESTAMP':
+        return pa.timestamp('us')
+    return pa.type_for_alias(dt.dtype)
+
+
+def arrow_schema(description):
+    """
+    Create an Arrow schema for a query result.
+
+    :param description: the cursor description
+    :return: a pyarrow.Schema
+    """
+    pa = _import('pyarrow')
+    return pa.schema([
+        pa.field(name, arrow_type(pa, dt, precision, scale), nullable=bool(null_ok))
+        for name, dt, _, _, precision, scale, null_ok in description
+    ])
+
+
+def to_arrow_array(dt, field_type, count, buffers):
+    """
+    Create an Arrow array from the buffers of a fetched column.
+
+    The buffers are used as they are, only numeric types narrower than
+    the fetched longs and doubles are cast.  Decimal buffers already hold
+    the unscaled values in the decimal128 or decimal256 layout.
+
+    :param dt: the column's DataType class
+    :param field_type: the Arrow data type of the column
+    :param count: the number of rows
+    :param buffers: a py2jdbc.columns.ColumnBuffers
+    :return: a pyarrow.Array
+    """
+    pa = _import('pyarrow')
+    data, offsets, nulls = buffers
+    validity = pa.py_buffer(bytes(nulls).translate(_INVERT)) if any(nulls) else None
+    if offsets is not None:
+        starts = array.array('i', [0])
+        starts.extend(offsets)
+        return pa.Array.from_buffers(
+            field_type,
+            count,
+            [validity, pa.py_buffer(starts), pa.py_buffer(data)]
+        )
+    if dt.column == 'DECIMAL':
+        return pa.Array.from_buffers(field_type, count, [validity, pa.py_buffer(data)])
+    if dt.column == 'DOUBLE':
+        base = pa.float64()
+    elif dt.column == 'TIMESTAMP':
+        base = pa.timestamp('us')
+    else:
+        base = pa.int64()
+    result = pa.Array.from_buffers(base, count, [validity, pa.py_buffer(data)])
+    if dt.column in ('DATE', 'TIME'):
+        result = result.cast(pa.int32())
+    if result.type != field_type:
+        result = result.cast(field_type)
+    return result
+
+
+def to_record_batch(schema, description, count, buffers):
+    """
+    Create an Arrow record batch from the buffers of fetched columns.
+
+    :param schema: the Arrow schema, from arrow_schema
+    :param description: the cursor description
+    :param count: the number of rows
+    :param buffers: a sequence of py2jdbc.columns.ColumnBuffers, one per column
+    :return: a pyarrow.RecordBatch
+    """
+    pa = _import('pyarrow')
+    return pa.RecordBatch.from_arrays([
+        to_arrow_array(desc[1], field.type, count, column)
+        for desc, field, column in zip(description, schema, buffers)
+    ], schema=schema)
+
+
+def to_arrow_table(schema, batches):
+    """
+    Combine Arrow record batches into a table.
+
+    :param schema: the Arrow schema, from arrow_schema
+    :param batches: a sequence of pyarrow.RecordBatch objects
+    :return: a pyarrow.Table
+    """
+    pa = _import('pyarrow')
+    return pa.Table.from_batches(batches, schema=schema)
@@ -5,6 +5,7 @@ import logging
 import os
 import signal
 import six
+import threading
 
 from ctypes import (
     c_void_p, c_char_p,
@@ -12,7 +13,7 @@ from ctypes import (
     c_float, c_double,
     Structure, Union,
     CDLL, CFUNCTYPE, POINTER,
-    byref
+    byref, cast, string_at
 )
 from py2jdbc.jvm import CP_SEP, find_libjvm, get_classpath
 import py2jdbc.mutf8
@@ -310,9 +311,25 @@ class JNIEnv(Structure):
     """
     Wrap JNIEnv function calls, including some Python symantics.
     See the JNI specifications for functions that don't add anything.
+
+    Functions are called through `dispatch`, which holds the function pointers
+    read from the JNI function table, instead of reading them from the table
+    structure on every call.
     """
     _fields_ = [('functions', POINTER(JNINativeInterface_))]
 
+    def __getattr__(self, name):
+        """
+        Look up the dispatch table the first time it's used.
+
+        :param name: the attribute name
+        :return: the JNIDispatch instance for this environment's function table
+        """
+        if name != 'dispatch':
+            raise AttributeError(name)
+        self.dispatch = get_dispatch(self.functions)
+        return self.dispatch
+
     def GetVersion(self):
         """
         Returns the version of the native method interface.
@@ -320,7 +337,7 @@ class JNIEnv(Structure):
         :return: the major version number in the higher 16 bits and the minor version number
                 in the lower 16 bits.
         """
-        return self.functions[0].GetVersion(self)
+        return self.dispatch.GetVersion(self)
 
     @property
     def version(self):
@@ -344,7 +361,17 @@ class JNIEnv(Structure):
         :param buflen: buffer length.
         :return: Returns a Java class object or NULL if an error occurs.
         """
-        return self.functions[0].DefineClass(self, encode(name), loader, buf, buflen)
+        class_object = self.dispatch.DefineClass(
+            self,
+            encode(name.replace('.', '/')),
+            loader,
+            buf,
+            buflen
+        )
+        self.check_exception()
+        if class_object is None:
+            raise NullResultException(self, name)
+        return class_object
 
     def FindClass(self, name):
         """
@@ -355,7 +382,7 @@ class JNIEnv(Structure):
         :param name: The class name
         :return: the jclass object pointer
         """
-        class_object = self.functions[0].FindClass(self, encode(name.replace('.', '/')))
+        class_object = self.dispatch.FindClass(self, encode(name.replace('.', '/')))
         self.check_exception()
         if class_object is None:
             raise NullResultException(self, name)
@@ -369,7 +396,7 @@ class JNIEnv(Structure):
         :param method: the java.lang.reflect.X object
         :return: the methodID
         """
-        mid = self.functions[0].FromReflectedMethod(self, method)
+        mid = self.dispatch.FromReflectedMethod(self, method)
         self.check_exception()
         if mid is None:
             raise NullResultException(self, method)
@@ -382,7 +409,7 @@ class JNIEnv(Structure):
         :param field: the java.lang.reflect.Field object
         :return: the fieldID
         """
-        fid = self.functions[0].FromReflectedField(self, field)
+        fid = self.dispatch.FromReflectedField(self, field)
         self.check_exception()
         if fid is None:
             raise NullResultException(self, field)
@@ -399,7 +426,7 @@ class JNIEnv(Structure):
         :param is_static: JNI_TRUE if the method is static
         :return: the java.lang.reflect.X method object
         """
-        obj = self.functions[0].ToReflectedMethod(self, clazz, mid, is_static)
+        obj = self.dispatch.ToReflectedMethod(self, clazz, mid, is_static)
         self.check_exception()
         if obj is None:
             raise NullResultException(self, clazz, mid, is_static)
@@ -416,7 +443,7 @@ class JNIEnv(Structure):
         :param clazz: a Java class object.
         :return: the superclass of the class represented by clazz, or NULL.
         """
-        return self.functions[0].GetSuperclass(self, clazz)
+        return self.dispatch.GetSuperclass(self, clazz)
 
     def IsAssignableFrom(self, clazz1, clazz2):
         """
@@ -426,7 +453,7 @@ class JNIEnv(Structure):
         :param clazz2: the second class argument.
         :return: True if the class can be cast
         """
-        return self.functions[0].IsAssignableFrom(self, clazz1, clazz2)
+        return self.dispatch.IsAssignableFrom(self, clazz1, clazz2)
 
     def ToReflectedField(self, clazz, fid, is_static):
         """
@@ -439,7 +466,7 @@ class JNIEnv(Structure):
         :param is_static: whether this field is static
         :return: a java.lang.reflect.Field object or 0 if it fails
         """
-        return self.functions[0].ToReflectedField(self, clazz, fid, is_static)
+        return self.dispatch.ToReflectedField(self, clazz, fid, is_static)
 
     def Throw(self, obj):
         """
@@ -450,7 +477,7 @@ class JNIEnv(Structure):
         :raises: JavaException on exception
                 RuntimeError if exception couldn't be thrown
         """
-        result = self.functions[0].Throw(self, obj)
+        result = self.dispatch.Throw(self, obj)
         self.check_exception()
         if result != 0:
             raise RuntimeError("couldn't throw exception")
@@ -464,7 +491,7 @@ class JNIEnv(Structure):
         :param msg:  the message used to construct the java.lang.Throwable object.
         :return: 0 on success; a negative value on failure.
         """
-        return self.functions[0].ThrowNew(self, clazz, encode(msg))
+        return self.dispatch.ThrowNew(self, clazz, encode(msg))
 
     def ExceptionOccurred(self):
         """
@@ -474,29 +501,32 @@ class JNIEnv(Structure):
         :return: the exception object that is currently in the process of being thrown, or
             None if no exception is currently being thrown.
         """
-        return self.functions[0].ExceptionOccurred(self)
+        return self.dispatch.ExceptionOccurred(self)
 
     def ExceptionDescribe(self):
         """
         Prints an exception and a backtrace of the stack to a system error-reporting channel,
         such as stderr. This is a convenience routine provided for debugging.
         """
-        self.functions[0].ExceptionDescribe(self)
+        self.dispatch.ExceptionDescribe(self)
 
     def ExceptionClear(self):
         """
         Clears any exception that is currently being thrown. If no exception is currently
         being thrown, this routine has no effect.
         """
-        self.functions[0].ExceptionClear(self)
+        self.dispatch.ExceptionClear(self)
 
     def check_exception(self):
         """
         Utility for checking if an exception occurred, and if so, raise
         a Python exception containing the Throwable object.
+
+        ExceptionCheck doesn't create a local reference, so the throwable is only
+        fetched when there is one.
         """
-        throwable = self.ExceptionOccurred()
-        if throwable:
+        if self.dispatch.ExceptionCheck(self):
+            throwable = self.ExceptionOccurred()
             if log.getEffectiveLevel() == logging.DEBUG:
                 self.ExceptionDescribe()
             self.ExceptionClear()
@@ -510,7 +540,7 @@ class JNIEnv(Structure):
         :param msg: an error message
         :return:
         """
-        self.functions[0].FatalError(self, encode(msg))
+        self.dispatch.FatalError(self, encode(msg))
 
     def PushLocalFrame(self, capacity):
         """
@@ -521,7 +551,7 @@ class JNIEnv(Structure):
         :return: 0 on success, a negative number
         :raises: OutOfMemoryError
         """
-        return self.functions[0].PushLocalFrame(self, capacity)
+        return self.dispatch.PushLocalFrame(self, capacity)
 
     def PopLocalFrame(self, result=None):
         """
@@ -532,7 +562,7 @@ class JNIEnv(Structure):
         :param result: look for reference from of result object
         :return: local reference in the previous local reference frame
         """
-        return self.functions[0].PopLocalFrame(self, result)
+        return self.dispatch.PopLocalFrame(self, result)
 
     def NewGlobalRef(self, lobj):
         """
@@ -543,7 +573,7 @@ class JNIEnv(Structure):
         :param lobj: a global or local reference.
         :return: Returns a global reference, or NULL if the system runs out of memory.
         """
-        return self.functions[0].NewGlobalRef(self, lobj)
+        return self.dispatch.NewGlobalRef(self, lobj)
 
     def DeleteGlobalRef(self, gref):
         """
@@ -552,7 +582,7 @@ class JNIEnv(Structure):
         :param gref: a global reference.
         :return:
         """
-        self.functions[0].DeleteGlobalRef(self, gref)
+        self.dispatch.DeleteGlobalRef(self, gref)
 
     def DeleteLocalRef(self, obj):
         """
@@ -560,7 +590,7 @@ class JNIEnv(Structure):
 
         :param obj: a local reference.
         """
-        self.functions[0].DeleteLocalRef(self, obj)
+        self.dispatch.DeleteLocalRef(self, obj)
 
     def IsSameObject(self, obj1, obj2):
         """
@@ -570,7 +600,7 @@ class JNIEnv(Structure):
         :param obj2: a Java object
         :return: True if references are to same object; otherwise False
         """
-        return self.functions[0].IsSameObject(self, obj1, obj2) == JNI_TRUE
+        return self.dispatch.IsSameObject(self, obj1, obj2) == JNI_TRUE
 
     def NewLocalRef(self, ref=None):
         """
@@ -579,7 +609,7 @@ class JNIEnv(Structure):
         :param ref: a global or local reference
         :return: None if ref refers to None
         """
-        return self.functions[0].NewLocalRef(self, ref)
+        return self.dispatch.NewLocalRef(self, ref)
 
     def EnsureLocalCapacity(self, capacity):
         """
@@ -590,7 +620,7 @@ class JNIEnv(Structure):
         :return: 0 on success; otherwise a negative number
         :raises: OutOfMemoryError
         """
-        return self.functions[0].EnsureLocalCapacity(self, capacity)
+        return self.dispatch.EnsureLocalCapacity(self, capacity)
 
     def AllocObject(self, clazz):
         """
@@ -599,7 +629,7 @@ class JNIEnv(Structure):
         :param clazz: Any class except array classes.
         :return: a reference to the object.
         """
-        obj = self.functions[0].AllocObject(self, clazz)
+        obj = self.dispatch.AllocObject(self, clazz)
         self.check_exception()
         return obj
 
@@ -612,7 +642,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of parameters
         :return: the created object.
         """
-        obj = self.functions[0].NewObjectA(self, clazz, mid, args)
+        obj = self.dispatch.NewObjectA(self, clazz, mid, args)
         self.check_exception()
         if obj is None:
             raise NullResultException(self, clazz, mid, args)
@@ -624,7 +654,7 @@ class JNIEnv(Structure):
         :param obj: the object
         :return: the class for the given object
         """
-        return self.functions[0].GetObjectClass(self, obj)
+        return self.dispatch.GetObjectClass(self, obj)
 
     def IsInstanceOf(self, obj, clazz):
         """
@@ -634,7 +664,7 @@ class JNIEnv(Structure):
         :param clazz: the class
         :return: True if object is instance, otherwise False
         """
-        return self.functions[0].IsInstanceOf(self, obj, clazz) == JNI_TRUE
+        return self.dispatch.IsInstanceOf(self, obj, clazz) == JNI_TRUE
 
     def GetMethodID(self, clazz, name, sig):
         """
@@ -647,7 +677,7 @@ class JNIEnv(Structure):
         :param sig: the signature name
         :return: a method ID or None if the method can't be found
         """
-        mid = self.functions[0].GetMethodID(self, clazz, encode(name), encode(sig))
+        mid = self.dispatch.GetMethodID(self, clazz, encode(name), encode(sig))
         self.check_exception()
         if mid is None:
             raise NullResultException(self, clazz, name, sig)
@@ -662,7 +692,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: a jobject reference to the object returned by the method
         """
-        result = self.functions[0].CallObjectMethodA(self, obj, mid, args)
+        result = self.dispatch.CallObjectMethodA(self, obj, mid, args)
         self.check_exception()
         return result
 
@@ -675,7 +705,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: a jboolean returned by the method
         """
-        result = self.functions[0].CallBooleanMethodA(self, obj, mid, args)
+        result = self.dispatch.CallBooleanMethodA(self, obj, mid, args)
         self.check_exception()
         return result
 
@@ -688,7 +718,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: a jbyte returned by the method
         """
-        result = self.functions[0].CallByteMethodA(self, obj, mid, args)
+        result = self.dispatch.CallByteMethodA(self, obj, mid, args)
         self.check_exception()
         return result
 
@@ -701,7 +731,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: a jchar returned by the method
         """
-        result = self.functions[0].CallCharMethodA(self, obj, mid, args)
+        result = self.dispatch.CallCharMethodA(self, obj, mid, args)
         self.check_exception()
         return result
 
@@ -714,7 +744,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: a jshort returned by the method
         """
-        result = self.functions[0].CallShortMethodA(self, obj, mid, args)
+        result = self.dispatch.CallShortMethodA(self, obj, mid, args)
         self.check_exception()
         return result
 
@@ -727,7 +757,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: a jint returned by the method
         """
-        result = self.functions[0].CallIntMethodA(self, obj, mid, args)
+        result = self.dispatch.CallIntMethodA(self, obj, mid, args)
         self.check_exception()
         return result
 
@@ -740,7 +770,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: a jlong returned by the method
         """
-        result = self.functions[0].CallLongMethodA(self, obj, mid, args)
+        result = self.dispatch.CallLongMethodA(self, obj, mid, args)
         self.check_exception()
         return result
 
@@ -753,7 +783,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: a jfloat returned by the method
         """
-        result = self.functions[0].CallFloatMethodA(self, obj, mid, args)
+        result = self.dispatch.CallFloatMethodA(self, obj, mid, args)
         self.check_exception()
         return result
 
@@ -766,7 +796,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: a jdouble returned by the method
         """
-        result = self.functions[0].CallDoubleMethodA(self, obj, mid, args)
+        result = self.dispatch.CallDoubleMethodA(self, obj, mid, args)
         self.check_exception()
         return result
 
@@ -778,7 +808,7 @@ class JNIEnv(Structure):
         :param mid: the method ID
         :param args: a jvalue array of method arguments
         """
-        self.functions[0].CallVoidMethodA(self, obj, mid, args)
+        self.dispatch.CallVoidMethodA(self, obj, mid, args)
         self.check_exception()
 
     def CallNonvirtualObjectMethodA(self, obj, clazz, mid, args):
@@ -791,7 +821,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: the Object return value
         """
-        result = self.functions[0].CallNonvirtualObjectMethodA(self, obj, clazz, mid, args)
+        result = self.dispatch.CallNonvirtualObjectMethodA(self, obj, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -805,7 +835,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: the jboolean return value
         """
-        result = self.functions[0].CallNonvirtualBooleanMethodA(self, obj, clazz, mid, args)
+        result = self.dispatch.CallNonvirtualBooleanMethodA(self, obj, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -819,7 +849,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: the byte return value
         """
-        result = self.functions[0].CallNonvirtualByteMethodA(self, obj, clazz, mid, args)
+        result = self.dispatch.CallNonvirtualByteMethodA(self, obj, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -833,7 +863,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: the jchar return value
         """
-        result = self.functions[0].CallNonvirtualCharMethodA(self, obj, clazz, mid, args)
+        result = self.dispatch.CallNonvirtualCharMethodA(self, obj, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -847,7 +877,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: the short return value
         """
-        result = self.functions[0].CallNonvirtualShortMethodA(self, obj, clazz, mid, args)
+        result = self.dispatch.CallNonvirtualShortMethodA(self, obj, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -861,7 +891,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: the int return value
         """
-        result = self.functions[0].CallNonvirtualIntMethodA(self, obj, clazz, mid, args)
+        result = self.dispatch.CallNonvirtualIntMethodA(self, obj, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -875,7 +905,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: the long return value
         """
-        result = self.functions[0].CallNonvirtualLongMethodA(self, obj, clazz, mid, args)
+        result = self.dispatch.CallNonvirtualLongMethodA(self, obj, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -889,7 +919,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: the float return value
         """
-        result = self.functions[0].CallNonvirtualFloatMethodA(self, obj, clazz, mid, args)
+        result = self.dispatch.CallNonvirtualFloatMethodA(self, obj, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -903,7 +933,7 @@ class JNIEnv(Structure):
         :param args: a jvalue array of method arguments
         :return: the double return value
         """
-        result = self.functions[0].CallNonvirtualDoubleMethodA(self, obj, clazz, mid, args)
+        result = self.dispatch.CallNonvirtualDoubleMethodA(self, obj, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -916,7 +946,7 @@ class JNIEnv(Structure):
         :param mid: the method ID
         :param args: a jvalue array of method arguments
         """
-        self.functions[0].CallNonvirtualVoidMethodA(self, obj, clazz, mid, args)
+        self.dispatch.CallNonvirtualVoidMethodA(self, obj, clazz, mid, args)
         self.check_exception()
 
     def GetFieldID(self, clazz, name, sig):
@@ -931,7 +961,7 @@ class JNIEnv(Structure):
         :param sig: the signature of the field
         :return: the fieldID object or None if the operation fails.
         """
-        fid = self.functions[0].GetFieldID(self, clazz, encode(name), encode(sig))
+        fid = self.dispatch.GetFieldID(self, clazz, encode(name), encode(sig))
         self.check_exception()
         if fid is None:
             raise NullResultException(clazz, name, sig)
@@ -945,7 +975,7 @@ class JNIEnv(Structure):
         :param fid: The fieldID from GetFieldID
         :return: the jobject reference to the field value.
         """
-        return self.functions[0].GetObjectField(self, obj, fid)
+        return self.dispatch.GetObjectField(self, obj, fid)
 
     def GetBooleanField(self, obj, fid):
         """
@@ -955,7 +985,7 @@ class JNIEnv(Structure):
         :param fid: The fieldID from GetFieldID
         :return: the boolean field value.
         """
-        return self.functions[0].GetBooleanField(self, obj, fid)
+        return self.dispatch.GetBooleanField(self, obj, fid)
 
     def GetByteField(self, obj, fid):
         """
@@ -965,7 +995,7 @@ class JNIEnv(Structure):
         :param fid: The fieldID from GetFieldID
         :return: the byte field value.
         """
-        return self.functions[0].GetByteField(self, obj, fid)
+        return self.dispatch.GetByteField(self, obj, fid)
 
     def GetCharField(self, obj, fid):
         """
@@ -975,7 +1005,7 @@ class JNIEnv(Structure):
         :param fid: The fieldID from GetFieldID
         :return: the char field value.
         """
-        return self.functions[0].GetCharField(self, obj, fid)
+        return self.dispatch.GetCharField(self, obj, fid)
 
     def GetShortField(self, obj, fid):
         """
@@ -985,7 +1015,7 @@ class JNIEnv(Structure):
         :param fid: The fieldID from GetFieldID
         :return: the short field value.
         """
-        return self.functions[0].GetShortField(self, obj, fid)
+        return self.dispatch.GetShortField(self, obj, fid)
 
     def GetIntField(self, obj, fid):
         """
@@ -995,7 +1025,7 @@ class JNIEnv(Structure):
         :param fid: The fieldID from GetFieldID
         :return: the int field value.
         """
-        return self.functions[0].GetIntField(self, obj, fid)
+        return self.dispatch.GetIntField(self, obj, fid)
 
     def GetLongField(self, obj, fid):
         """
@@ -1005,7 +1035,7 @@ class JNIEnv(Structure):
         :param fid: The fieldID from GetFieldID
         :return: the long field value.
         """
-        return self.functions[0].GetLongField(self, obj, fid)
+        return self.dispatch.GetLongField(self, obj, fid)
 
     def GetFloatField(self, obj, fid):
         """
@@ -1015,7 +1045,7 @@ class JNIEnv(Structure):
         :param fid: The fieldID from GetFieldID
         :return: the float field value.
         """
-        return self.functions[0].GetFloatField(self, obj, fid)
+        return self.dispatch.GetFloatField(self, obj, fid)
 
     def GetDoubleField(self, obj, fid):
         """
@@ -1025,7 +1055,7 @@ class JNIEnv(Structure):
         :param fid: The fieldID from GetFieldID
         :return: the double field value.
         """
-        return self.functions[0].GetDoubleField(self, obj, fid)
+        return self.dispatch.GetDoubleField(self, obj, fid)
 
     def SetObjectField(self, obj, fid, val):
         """
@@ -1035,7 +1065,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetFieldID
         :param val: the object reference new value
         """
-        self.functions[0].SetObjectField(self, obj, fid, val)
+        self.dispatch.SetObjectField(self, obj, fid, val)
 
     def SetBooleanField(self, obj, fid, val):
         """
@@ -1045,7 +1075,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetFieldID
         :param val: the boolean new value
         """
-        self.functions[0].SetBooleanField(self, obj, fid, val)
+        self.dispatch.SetBooleanField(self, obj, fid, val)
 
     def SetByteField(self, obj, fid, val):
         """
@@ -1055,7 +1085,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetFieldID
         :param val: the byte new value
         """
-        return self.functions[0].SetByteField(self, obj, fid, val)
+        return self.dispatch.SetByteField(self, obj, fid, val)
 
     def SetCharField(self, obj, fid, val):
         """
@@ -1065,7 +1095,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetFieldID
         :param val: the object reference of the field of an instance
         """
-        return self.functions[0].SetCharField(self, obj, fid, val)
+        return self.dispatch.SetCharField(self, obj, fid, val)
 
     def SetShortField(self, obj, fid, val):
         """
@@ -1075,7 +1105,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetFieldID
         :param val: the object reference of the field of an instance
         """
-        return self.functions[0].SetShortField(self, obj, fid, val)
+        return self.dispatch.SetShortField(self, obj, fid, val)
 
     def SetIntField(self, obj, fid, val):
         """
@@ -1085,7 +1115,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetFieldID
         :param val: the object reference of the field of an instance
         """
-        return self.functions[0].SetIntField(self, obj, fid, val)
+        return self.dispatch.SetIntField(self, obj, fid, val)
 
     def SetLongField(self, obj, fid, val):
         """
@@ -1095,7 +1125,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetFieldID
         :param val: the object reference of the field of an instance
         """
-        return self.functions[0].SetLongField(self, obj, fid, val)
+        return self.dispatch.SetLongField(self, obj, fid, val)
 
     def SetFloatField(self, obj, fid, val):
         """
@@ -1105,7 +1135,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetFieldID
         :param val: the object reference of the field of an instance
         """
-        return self.functions[0].SetFloatField(self, obj, fid, val)
+        return self.dispatch.SetFloatField(self, obj, fid, val)
 
     def SetDoubleField(self, obj, fid, val):
         """
@@ -1115,7 +1145,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetFieldID
         :param val: the object reference of the field of an instance
         """
-        return self.functions[0].SetDoubleField(self, obj, fid, val)
+        return self.dispatch.SetDoubleField(self, obj, fid, val)
 
     def GetStaticMethodID(self, clazz, name, signature):
         """
@@ -1127,7 +1157,7 @@ class JNIEnv(Structure):
         :param signature: the static method signature
         :return: a method ID or None if operation fails
         """
-        mid = self.functions[0].GetStaticMethodID(
+        mid = self.dispatch.GetStaticMethodID(
             self,
             clazz,
             encode(name),
@@ -1147,7 +1177,7 @@ class JNIEnv(Structure):
         :param args: an array of jvalue method arguments
         :return: an object reference
         """
-        result = self.functions[0].CallStaticObjectMethodA(self, clazz, mid, args)
+        result = self.dispatch.CallStaticObjectMethodA(self, clazz, mid, args)
         self.check_exception()
         if result is None:
             raise NullResultException(self, clazz, mid, args)
@@ -1162,7 +1192,7 @@ class JNIEnv(Structure):
         :param args: an array of jvalue method arguments
         :return: a jboolean
         """
-        result = self.functions[0].CallStaticBooleanMethodA(self, clazz, mid, args)
+        result = self.dispatch.CallStaticBooleanMethodA(self, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -1175,7 +1205,7 @@ class JNIEnv(Structure):
         :param args: an array of jvalue method arguments
         :return: a jbyte
         """
-        result = self.functions[0].CallStaticByteMethodA(self, clazz, mid, args)
+        result = self.dispatch.CallStaticByteMethodA(self, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -1188,7 +1218,7 @@ class JNIEnv(Structure):
         :param args: an array of jvalue method arguments
         :return: a jchar
         """
-        result = self.functions[0].CallStaticCharMethodA(self, clazz, mid, args)
+        result = self.dispatch.CallStaticCharMethodA(self, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -1201,7 +1231,7 @@ class JNIEnv(Structure):
         :param args: an array of jvalue method arguments
         :return: a jshort
         """
-        result = self.functions[0].CallStaticShortMethodA(self, clazz, mid, args)
+        result = self.dispatch.CallStaticShortMethodA(self, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -1214,7 +1244,7 @@ class JNIEnv(Structure):
         :param args: an array of jvalue method arguments
         :return: a jint
         """
-        result = self.functions[0].CallStaticIntMethodA(self, clazz, mid, args)
+        result = self.dispatch.CallStaticIntMethodA(self, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -1227,7 +1257,7 @@ class JNIEnv(Structure):
         :param args: an array of jvalue method arguments
         :return: a jlong
         """
-        result = self.functions[0].CallStaticLongMethodA(self, clazz, mid, args)
+        result = self.dispatch.CallStaticLongMethodA(self, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -1240,7 +1270,7 @@ class JNIEnv(Structure):
         :param args: an array of jvalue method arguments
         :return: a jfloat
         """
-        result = self.functions[0].CallStaticFloatMethodA(self, clazz, mid, args)
+        result = self.dispatch.CallStaticFloatMethodA(self, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -1253,7 +1283,7 @@ class JNIEnv(Structure):
         :param args: an array of jvalue method arguments
         :return: a jdouble
         """
-        result = self.functions[0].CallStaticDoubleMethodA(self, clazz, mid, args)
+        result = self.dispatch.CallStaticDoubleMethodA(self, clazz, mid, args)
         self.check_exception()
         return result
 
@@ -1265,7 +1295,7 @@ class JNIEnv(Structure):
         :param mid: the static method ID from GetStaticMethodID
         :param args: an array of jvalue method arguments
         """
-        self.functions[0].CallStaticVoidMethodA(self, clazz, mid, args)
+        self.dispatch.CallStaticVoidMethodA(self, clazz, mid, args)
         self.check_exception()
 
     def GetStaticFieldID(self, clazz, name, sig):
@@ -1278,7 +1308,7 @@ class JNIEnv(Structure):
         :param sig: the static field signature
         :return: a field ID or None if the static field cannot be found.
         """
-        fid = self.functions[0].GetStaticFieldID(self, clazz, encode(name), encode(sig))
+        fid = self.dispatch.GetStaticFieldID(self, clazz, encode(name), encode(sig))
         self.check_exception()
         if fid is None:
             raise NullResultException(self, clazz, name, sig)
@@ -1292,7 +1322,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetStaticFieldID
         :return: the jobject reference to the field value.
         """
-        return self.functions[0].GetStaticObjectField(self, clazz, fid)
+        return self.dispatch.GetStaticObjectField(self, clazz, fid)
 
     def GetStaticBooleanField(self, clazz, fid):
         """
@@ -1302,7 +1332,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetStaticFieldID
         :return: the jboolean field value.
         """
-        return self.functions[0].GetStaticBooleanField(self, clazz, fid)
+        return self.dispatch.GetStaticBooleanField(self, clazz, fid)
 
     def GetStaticByteField(self, clazz, fid):
         """
@@ -1312,7 +1342,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetStaticFieldID
         :return: the jbyte field value.
         """
-        return self.functions[0].GetStaticByteField(self, clazz, fid)
+        return self.dispatch.GetStaticByteField(self, clazz, fid)
 
     def GetStaticCharField(self, clazz, fid):
         """
@@ -1322,7 +1352,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetStaticFieldID
         :return: the jchar field value.
         """
-        return self.functions[0].GetStaticCharField(self, clazz, fid)
+        return self.dispatch.GetStaticCharField(self, clazz, fid)
 
     def GetStaticShortField(self, clazz, fid):
         """
@@ -1332,7 +1362,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetStaticFieldID
         :return: the jshort field value.
         """
-        return self.functions[0].GetStaticShortField(self, clazz, fid)
+        return self.dispatch.GetStaticShortField(self, clazz, fid)
 
     def GetStaticIntField(self, clazz, fid):
         """
@@ -1342,7 +1372,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetStaticFieldID
         :return: the jint field value.
         """
-        return self.functions[0].GetStaticIntField(self, clazz, fid)
+        return self.dispatch.GetStaticIntField(self, clazz, fid)
 
     def GetStaticLongField(self, clazz, fid):
         """
@@ -1352,7 +1382,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetStaticFieldID
         :return: the jlong field value.
         """
-        return self.functions[0].GetStaticLongField(self, clazz, fid)
+        return self.dispatch.GetStaticLongField(self, clazz, fid)
 
     def GetStaticFloatField(self, clazz, fid):
         """
@@ -1362,7 +1392,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetStaticFieldID
         :return: the jfloat reference to the field value.
         """
-        return self.functions[0].GetStaticFloatField(self, clazz, fid)
+        return self.dispatch.GetStaticFloatField(self, clazz, fid)
 
     def GetStaticDoubleField(self, clazz, fid):
         """
@@ -1372,7 +1402,7 @@ class JNIEnv(Structure):
         :param fid: the fieldID from GetStaticFieldID
         :return: the jdouble field value.
         """
-        return self.functions[0].GetStaticDoubleField(self, clazz, fid)
+        return self.dispatch.GetStaticDoubleField(self, clazz, fid)
 
     def SetStaticObjectField(self, clazz, fid, value):
         """
@@ -1382,7 +1412,7 @@ class JNIEnv(Structure):
         :param fid: the static fieldID from GetStaticFieldID
         :param value: the new object reference value
         """
-        self.functions[0].SetStaticObjectField(self, clazz, fid, value)
+        self.dispatch.SetStaticObjectField(self, clazz, fid, value)
 
     def SetStaticBooleanField(self, clazz, fid, value):
         """
@@ -1392,7 +1422,7 @@ class JNIEnv(Structure):
         :param fid: the static fieldID from GetStaticFieldID
         :param value: the new jboolean value
         """
-        self.functions[0].SetStaticBooleanField(self, clazz, fid, value)
+        self.dispatch.SetStaticBooleanField(self, clazz, fid, value)
 
     def SetStaticByteField(self, clazz, fid, value):
         """
@@ -1402,7 +1432,7 @@ class JNIEnv(Structure):
         :param fid: the static fieldID from GetStaticFieldID
         :param value: the new jbyte value
         """
-        self.functions[0].SetStaticByteField(self, clazz, fid, value)
+        self.dispatch.SetStaticByteField(self, clazz, fid, value)
 
     def SetStaticCharField(self, clazz, fid, value):
         """
@@ -1412,7 +1442,7 @@ class JNIEnv(Structure):
         :param fid: the static fieldID from GetStaticFieldID
         :param value: the new jchar value
         """
-        self.functions[0].SetStaticCharField(self, clazz, fid, value)
+        self.dispatch.SetStaticCharField(self, clazz, fid, value)
 
     def SetStaticShortField(self, clazz, fid, value):
         """
@@ -1422,7 +1452,7 @@ class JNIEnv(Structure):
         :param fid: the static fieldID from GetStaticFieldID
         :param value: the new jshort value
         """
-        self.functions[0].SetStaticShortField(self, clazz, fid, value)
+        self.dispatch.SetStaticShortField(self, clazz, fid, value)
 
     def SetStaticIntField(self, clazz, fid, value):
         """
@@ -1432,7 +1462,7 @@ class JNIEnv(Structure):
         :param fid: the static fieldID from GetStaticFieldID
         :param value: the new jint value
         """
-        self.functions[0].SetStaticIntField(self, clazz, fid, value)
+        self.dispatch.SetStaticIntField(self, clazz, fid, value)
 
     def SetStaticLongField(self, clazz, fid, value):
         """
@@ -1442,7 +1472,7 @@ class JNIEnv(Structure):
         :param fid: the static fieldID from GetStaticFieldID
         :param value: the new jlong value
         """
-        self.functions[0].SetStaticLongField(self, clazz, fid, value)
+        self.dispatch.SetStaticLongField(self, clazz, fid, value)
 
     def SetStaticFloatField(self, clazz, fid, value):
         """
@@ -1452,7 +1482,7 @@ class JNIEnv(Structure):
         :param fid: the static fieldID from GetStaticFieldID
         :param value: the new jfloat value
         """
-        self.functions[0].SetStaticFloatField(self, clazz, fid, value)
+        self.dispatch.SetStaticFloatField(self, clazz, fid, value)
 
     def SetStaticDoubleField(self, clazz, fid, value):
         """
@@ -1462,7 +1492,7 @@ class JNIEnv(Structure):
         :param fid: the static fieldID from GetStaticFieldID
         :param value: the new double value
         """
-        return self.functions[0].SetStaticDoubleField(self, clazz, fid, value)
+        return self.dispatch.SetStaticDoubleField(self, clazz, fid, value)
 
     def NewString(self, p_unicode, p_len):
         """
@@ -1472,7 +1502,7 @@ class JNIEnv(Structure):
         :param p_len: length of unicode string
         :return: a Java string object, or None if the string cannot be constructed.
         """
-        obj = self.functions[0].NewString(self, p_unicode, p_len)
+        obj = self.dispatch.NewString(self, p_unicode, p_len)
         self.check_exception()
         if obj is None:
             raise NullResultException(self, p_unicode, p_len)
@@ -1485,7 +1515,7 @@ class JNIEnv(Structure):
         :param p_str: a Java string object.
         :return:  the length in unicode characters.
         """
-        return self.functions[0].GetStringLength(self, p_str)
+        return self.dispatch.GetStringLength(self, p_str)
 
     def GetStringChars(self, p_str, is_copy=None):
         """
@@ -1496,7 +1526,7 @@ class JNIEnv(Structure):
         :param is_copy: a pointer to a jboolean
         :return: a pointer to Unicode string or None if operation fails.
         """
-        return self.functions[0].GetStringChars(self, p_str, is_copy)
+        return self.dispatch.GetStringChars(self, p_str, is_copy)
 
     def ReleaseStringChars(self, p_str, chars):
         """
@@ -1505,7 +1535,7 @@ class JNIEnv(Structure):
         :param p_str: a Java string object
         :param chars: the chars obtained from GetStringChars.
         """
-        self.functions[0].ReleaseStringChars(self, p_str, chars)
+        self.dispatch.ReleaseStringChars(self, p_str, chars)
 
     def NewStringUTF(self, utf):
         """
@@ -1515,7 +1545,7 @@ class JNIEnv(Structure):
         :param utf: string to encode, (these will automatically be encoded if unicode).
         :return: a reference to the new java.lang.String
         """
-        return self.functions[0].NewStringUTF(self, encode(utf))
+        return self.dispatch.NewStringUTF(self, encode(utf))
 
     def GetStringUTFLength(self, p_str):
         """
@@ -1523,7 +1553,7 @@ class JNIEnv(Structure):
         :param p_str: a Java string object
         :return: the length in bytes
         """
-        return self.functions[0].GetStringUTFLength(self, p_str)
+        return self.dispatch.GetStringUTFLength(self, p_str)
 
     def GetStringUTFChars(self, p_str, is_copy=None):
         """
@@ -1534,7 +1564,7 @@ class JNIEnv(Structure):
         :param is_copy: a pointer to a jboolean
         :return: a pointer to the modified UTF-8 string or None if the operation fails.
         """
-        return self.functions[0].GetStringUTFChars(self, p_str, is_copy)
+        return self.dispatch.GetStringUTFChars(self, p_str, is_copy)
 
     def ReleaseStringUTFChars(self, p_str, chars):
         """
@@ -1544,7 +1574,7 @@ class JNIEnv(Structure):
         :param p_str: a Java string object
         :param chars: a pointer to the modified UTF-8 bytes
         """
-        self.functions[0].ReleaseStringUTFChars(self, p_str, chars)
+        self.dispatch.ReleaseStringUTFChars(self, p_str, chars)
 
     def GetArrayLength(self, array):
         """
@@ -1553,7 +1583,7 @@ class JNIEnv(Structure):
         :param array: a Java array object.
         :return: the number of elements in the array.
         """
-        return self.functions[0].GetArrayLength(self, array)
+        return self.dispatch.GetArrayLength(self, array)
 
     def NewObjectArray(self, p_len, clazz, init):
         """
@@ -1564,7 +1594,7 @@ class JNIEnv(Structure):
         :param init: initialization value
         :return: a Java array object or None if the array cannot be constructed.
         """
-        return self.functions[0].NewObjectArray(self, p_len, clazz, init)
+        return self.dispatch.NewObjectArray(self, p_len, clazz, init)
 
     def GetObjectArrayElement(self, array, index):
         """
@@ -1574,7 +1604,7 @@ class JNIEnv(Structure):
         :param index: array index
         :return: a reference to the Object element.
         """
-        return self.functions[0].GetObjectArrayElement(self, array, index)
+        return self.dispatch.GetObjectArrayElement(self, array, index)
 
     def SetObjectArrayElement(self, array, index, value):
         """
@@ -1585,7 +1615,7 @@ class JNIEnv(Structure):
         :param value: value of array element.
         :return:
         """
-        self.functions[0].SetObjectArrayElement(self, array, index, value)
+        self.dispatch.SetObjectArrayElement(self, array, index, value)
 
     def NewBooleanArray(self, p_len):
         """
@@ -1594,7 +1624,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements
         :return: a Java array of booleans
         """
-        return self.functions[0].NewBooleanArray(self, p_len)
+        return self.dispatch.NewBooleanArray(self, p_len)
 
     def NewByteArray(self, p_len):
         """
@@ -1603,7 +1633,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements
         :return: a Java array of bytes
         """
-        return self.functions[0].NewByteArray(self, p_len)
+        return self.dispatch.NewByteArray(self, p_len)
 
     def NewCharArray(self, p_len):
         """
@@ -1612,7 +1642,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements
         :return: a Java array of chars
         """
-        return self.functions[0].NewCharArray(self, p_len)
+        return self.dispatch.NewCharArray(self, p_len)
 
     def NewShortArray(self, p_len):
         """
@@ -1621,7 +1651,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements
         :return: a Java array of shorts
         """
-        return self.functions[0].NewShortArray(self, p_len)
+        return self.dispatch.NewShortArray(self, p_len)
 
     def NewIntArray(self, p_len):
         """
@@ -1630,7 +1660,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements
         :return: a Java array of ints
         """
-        return self.functions[0].NewIntArray(self, p_len)
+        return self.dispatch.NewIntArray(self, p_len)
 
     def NewLongArray(self, p_len):
         """
@@ -1639,7 +1669,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements
         :return: a Java array of longs
         """
-        return self.functions[0].NewLongArray(self, p_len)
+        return self.dispatch.NewLongArray(self, p_len)
 
     def NewFloatArray(self, p_len):
         """
@@ -1648,7 +1678,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements
         :return: a Java array of floats
         """
-        return self.functions[0].NewFloatArray(self, p_len)
+        return self.dispatch.NewFloatArray(self, p_len)
 
     def NewDoubleArray(self, p_len):
         """
@@ -1657,7 +1687,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements
         :return: a Java array of doubles
         """
-        return self.functions[0].NewDoubleArray(self, p_len)
+        return self.dispatch.NewDoubleArray(self, p_len)
 
     def GetBooleanArrayElements(self, array, is_copy=None):
         """
@@ -1674,7 +1704,7 @@ class JNIEnv(Structure):
         :param is_copy: a jboolean reference indicating pointer is to a copy or None
         :return: a pointer to jboolean buffer
         """
-        return self.functions[0].GetBooleanArrayElements(self, array, is_copy)
+        return self.dispatch.GetBooleanArrayElements(self, array, is_copy)
 
     def GetByteArrayElements(self, array, is_copy=None):
         """
@@ -1691,7 +1721,7 @@ class JNIEnv(Structure):
         :param is_copy: a jboolean reference indicating pointer is to a copy or None
         :return: a pointer to jbyte buffer
         """
-        return self.functions[0].GetByteArrayElements(self, array, is_copy)
+        return self.dispatch.GetByteArrayElements(self, array, is_copy)
 
     def GetCharArrayElements(self, array, is_copy=None):
         """
@@ -1708,7 +1738,7 @@ class JNIEnv(Structure):
         :param is_copy: a jboolean reference indicating pointer is to a copy or None
         :return: a pointer to jchar buffer
         """
-        return self.functions[0].GetCharArrayElements(self, array, is_copy)
+        return self.dispatch.GetCharArrayElements(self, array, is_copy)
 
     def GetShortArrayElements(self, array, is_copy=None):
         """
@@ -1725,7 +1755,7 @@ class JNIEnv(Structure):
         :param is_copy: a jboolean reference indicating pointer is to a copy or None
         :return: a pointer to jshort buffer
         """
-        return self.functions[0].GetShortArrayElements(self, array, is_copy)
+        return self.dispatch.GetShortArrayElements(self, array, is_copy)
 
     def GetIntArrayElements(self, array, is_copy=None):
         """
@@ -1742,7 +1772,7 @@ class JNIEnv(Structure):
         :param is_copy: a jboolean reference indicating pointer is to a copy or None
         :return: a pointer to jint buffer
         """
-        return self.functions[0].GetIntArrayElements(self, array, is_copy)
+        return self.dispatch.GetIntArrayElements(self, array, is_copy)
 
     def GetLongArrayElements(self, array, is_copy=None):
         """
@@ -1759,7 +1789,7 @@ class JNIEnv(Structure):
         :param is_copy: a jboolean reference indicating pointer is to a copy or None
         :return: a pointer to jlong buffer
         """
-        return self.functions[0].GetLongArrayElements(self, array, is_copy)
+        return self.dispatch.GetLongArrayElements(self, array, is_copy)
 
     def GetFloatArrayElements(self, array, is_copy=None):
         """
@@ -1776,7 +1806,7 @@ class JNIEnv(Structure):
         :param is_copy: a jboolean reference indicating pointer is to a copy or None
         :return: a pointer to jfloat buffer
         """
-        return self.functions[0].GetFloatArrayElements(self, array, is_copy)
+        return self.dispatch.GetFloatArrayElements(self, array, is_copy)
 
     def GetDoubleArrayElements(self, array, is_copy=None):
         """
@@ -1793,7 +1823,7 @@ class JNIEnv(Structure):
         :param is_copy: a jboolean reference indicating pointer is to a copy or None
         :return: a pointer to jdouble buffer
         """
-        return self.functions[0].GetDoubleArrayElements(self, array, is_copy)
+        return self.dispatch.GetDoubleArrayElements(self, array, is_copy)
 
     def ReleaseBooleanArrayElements(self, array, elems, mode):
         """
@@ -1807,7 +1837,7 @@ class JNIEnv(Structure):
             JNI_COMMIT: copy back the contents but do not free
             JNI_ABORT: free the buffer without copying back the changes
         """
-        self.functions[0].ReleaseBooleanArrayElements(self, array, elems, mode)
+        self.dispatch.ReleaseBooleanArrayElements(self, array, elems, mode)
 
     def ReleaseByteArrayElements(self, array, elems, mode):
         """
@@ -1821,7 +1851,7 @@ class JNIEnv(Structure):
             JNI_COMMIT: copy back the contents but do not free
             JNI_ABORT: free the buffer without copying back the changes
         """
-        self.functions[0].ReleaseByteArrayElements(self, array, elems, mode)
+        self.dispatch.ReleaseByteArrayElements(self, array, elems, mode)
 
     def ReleaseCharArrayElements(self, array, elems, mode):
         """
@@ -1835,7 +1865,7 @@ class JNIEnv(Structure):
             JNI_COMMIT: copy back the contents but do not free
             JNI_ABORT: free the buffer without copying back the changes
         """
-        self.functions[0].ReleaseCharArrayElements(self, array, elems, mode)
+        self.dispatch.ReleaseCharArrayElements(self, array, elems, mode)
 
     def ReleaseShortArrayElements(self, array, elems, mode):
         """
@@ -1849,7 +1879,7 @@ class JNIEnv(Structure):
             JNI_COMMIT: copy back the contents but do not free
             JNI_ABORT: free the buffer without copying back the changes
         """
-        self.functions[0].ReleaseShortArrayElements(self, array, elems, mode)
+        self.dispatch.ReleaseShortArrayElements(self, array, elems, mode)
 
     def ReleaseIntArrayElements(self, array, elems, mode):
         """
@@ -1863,7 +1893,7 @@ class JNIEnv(Structure):
             JNI_COMMIT: copy back the contents but do not free
             JNI_ABORT: free the buffer without copying back the changes
         """
-        self.functions[0].ReleaseIntArrayElements(self, array, elems, mode)
+        self.dispatch.ReleaseIntArrayElements(self, array, elems, mode)
 
     def ReleaseLongArrayElements(self, array, elems, mode):
         """
@@ -1877,7 +1907,7 @@ class JNIEnv(Structure):
             JNI_COMMIT: copy back the contents but do not free
             JNI_ABORT: free the buffer without copying back the changes
         """
-        self.functions[0].ReleaseLongArrayElements(self, array, elems, mode)
+        self.dispatch.ReleaseLongArrayElements(self, array, elems, mode)
 
     def ReleaseFloatArrayElements(self, array, elems, mode):
         """
@@ -1891,7 +1921,7 @@ class JNIEnv(Structure):
             JNI_COMMIT: copy back the contents but do not free
             JNI_ABORT: free the buffer without copying back the changes
         """
-        self.functions[0].ReleaseFloatArrayElements(self, array, elems, mode)
+        self.dispatch.ReleaseFloatArrayElements(self, array, elems, mode)
 
     def ReleaseDoubleArrayElements(self, array, elems, mode):
         """
@@ -1905,7 +1935,7 @@ class JNIEnv(Structure):
             JNI_COMMIT: copy back the contents but do not free
             JNI_ABORT: free the buffer without copying back the changes
         """
-        self.functions[0].ReleaseDoubleArrayElements(self, array, elems, mode)
+        self.dispatch.ReleaseDoubleArrayElements(self, array, elems, mode)
 
     def GetBooleanArrayRegion(self, array, start, p_len, buf):
         """
@@ -1916,7 +1946,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements to copy
         :param buf: the destination buffer
         """
-        self.functions[0].GetBooleanArrayRegion(self, array, start, p_len, buf)
+        self.dispatch.GetBooleanArrayRegion(self, array, start, p_len, buf)
 
     def GetByteArrayRegion(self, array, start, p_len, buf):
         """
@@ -1927,7 +1957,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements to copy
         :param buf: the destination buffer
         """
-        self.functions[0].GetByteArrayRegion(self, array, start, p_len, buf)
+        self.dispatch.GetByteArrayRegion(self, array, start, p_len, buf)
 
     def GetCharArrayRegion(self, array, start, p_len, buf):
         """
@@ -1938,7 +1968,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements to copy
         :param buf: the destination buffer
         """
-        self.functions[0].GetCharArrayRegion(self, array, start, p_len, buf)
+        self.dispatch.GetCharArrayRegion(self, array, start, p_len, buf)
 
     def GetShortArrayRegion(self, array, start, p_len, buf):
         """
@@ -1949,7 +1979,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements to copy
         :param buf: the destination buffer
         """
-        self.functions[0].GetShortArrayRegion(self, array, start, p_len, buf)
+        self.dispatch.GetShortArrayRegion(self, array, start, p_len, buf)
 
     def GetIntArrayRegion(self, array, start, p_len, buf):
         """
@@ -1960,7 +1990,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements to copy
         :param buf: the destination buffer
         """
-        self.functions[0].GetIntArrayRegion(self, array, start, p_len, buf)
+        self.dispatch.GetIntArrayRegion(self, array, start, p_len, buf)
 
     def GetLongArrayRegion(self, array, start, p_len, buf):
         """
@@ -1971,7 +2001,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements to copy
         :param buf: the destination buffer
         """
-        self.functions[0].GetLongArrayRegion(self, array, start, p_len, buf)
+        self.dispatch.GetLongArrayRegion(self, array, start, p_len, buf)
 
     def GetFloatArrayRegion(self, array, start, p_len, buf):
         """
@@ -1982,7 +2012,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements to copy
         :param buf: the destination buffer
         """
-        self.functions[0].GetFloatArrayRegion(self, array, start, p_len, buf)
+        self.dispatch.GetFloatArrayRegion(self, array, start, p_len, buf)
 
     def GetDoubleArrayRegion(self, array, start, p_len, buf):
         """
@@ -1993,7 +2023,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements to copy
         :param buf: the destination buffer
         """
-        self.functions[0].GetDoubleArrayRegion(self, array, start, p_len, buf)
+        self.dispatch.GetDoubleArrayRegion(self, array, start, p_len, buf)
 
     def SetBooleanArrayRegion(self, array, start, p_len, buf):
         """
@@ -2004,7 +2034,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements to copy
         :param buf: the source buffer
         """
-        self.functions[0].SetBooleanArrayRegion(self, array, start, p_len, buf)
+        self.dispatch.SetBooleanArrayRegion(self, array, start, p_len, buf)
 
     def SetByteArrayRegion(self, array, start, p_len, buf):
         """
@@ -2015,7 +2045,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements to copy
         :param buf: the source buffer
         """
-        self.functions[0].SetByteArrayRegion(self, array, start, p_len, buf)
+        self.dispatch.SetByteArrayRegion(self, array, start, p_len, buf)
 
     def SetCharArrayRegion(self, array, start, p_len, buf):
         """
@@ -2026,7 +2056,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements to copy
         :param buf: the source buffer
         """
-        self.functions[0].SetCharArrayRegion(self, array, start, p_len, buf)
+        self.dispatch.SetCharArrayRegion(self, array, start, p_len, buf)
 
     def SetShortArrayRegion(self, array, start, p_len, buf):
         """
@@ -2037,7 +2067,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements to copy
         :param buf: the source buffer
         """
-        self.functions[0].SetShortArrayRegion(self, array, start, p_len, buf)
+        self.dispatch.SetShortArrayRegion(self, array, start, p_len, buf)
 
     def SetIntArrayRegion(self, array, start, p_len, buf):
         """
@@ -2048,7 +2078,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements to copy
         :param buf: the source buffer
         """
-        self.functions[0].SetIntArrayRegion(self, array, start, p_len, buf)
+        self.dispatch.SetIntArrayRegion(self, array, start, p_len, buf)
 
     def SetLongArrayRegion(self, array, start, p_len, buf):
         """
@@ -2059,7 +2089,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements to copy
         :param buf: the source buffer
         """
-        self.functions[0].SetLongArrayRegion(self, array, start, p_len, buf)
+        self.dispatch.SetLongArrayRegion(self, array, start, p_len, buf)
 
     def SetFloatArrayRegion(self, array, start, p_len, buf):
         """
@@ -2070,7 +2100,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements to copy
         :param buf: the source buffer
         """
-        self.functions[0].SetFloatArrayRegion(self, array, start, p_len, buf)
+        self.dispatch.SetFloatArrayRegion(self, array, start, p_len, buf)
 
     def SetDoubleArrayRegion(self, array, start, p_len, buf):
         """
@@ -2081,7 +2111,7 @@ class JNIEnv(Structure):
         :param p_len: the number of elements to copy
         :param buf: the source buffer
         """
-        self.functions[0].SetDoubleArrayRegion(self, array, start, p_len, buf)
+        self.dispatch.SetDoubleArrayRegion(self, array, start, p_len, buf)
 
     def RegisterNatives(self, clazz, methods, n_methods):
         """
@@ -2096,7 +2126,7 @@ class JNIEnv(Structure):
         :param n_methods: the number of native methods in the class
         :return: 0 on success, a negative value on failure.
         """
-        return self.functions[0].RegisterNatives(self, clazz, methods, n_methods)
+        return self.dispatch.RegisterNatives(self, clazz, methods, n_methods)
 
     def UnregisterNatives(self, clazz):
         """
@@ -2109,7 +2139,7 @@ class JNIEnv(Structure):
         :param clazz: a Java class object
         :return: 0 on success, a negative value on falure.
         """
-        return self.functions[0].UnregisterNatives(self, clazz)
+        return self.dispatch.UnregisterNatives(self, clazz)
 
     def MonitorEnter(self, obj):
         """
@@ -2118,7 +2148,7 @@ class JNIEnv(Structure):
         :param obj: a normal Java object or class object.
         :return: 0 on success, a negative value on failure
         """
-        return self.functions[0].MonitorEnter(self, obj)
+        return self.dispatch.MonitorEnter(self, obj)
 
     def MonitorExit(self, obj):
         """
@@ -2130,7 +2160,7 @@ class JNIEnv(Structure):
         :param obj: a normal Java ovject or class object
         :return: 0 on success, a negative value on failure.
         """
-        return self.functions[0].MonitorExit(self, obj)
+        return self.dispatch.MonitorExit(self, obj)
 
     def GetJavaVM(self, p_vm):
         """
@@ -2141,7 +2171,7 @@ class JNIEnv(Structure):
         :param p_vm: a pointer to where the result should be placed
         :return: 0 on success, a negative value n failure
         """
-        return self.functions[0].GetJavaVM(self, p_vm)
+        return self.dispatch.GetJavaVM(self, p_vm)
 
     def GetStringRegion(self, p_str, start, p_len, buf):
         """
@@ -2153,7 +2183,7 @@ class JNIEnv(Structure):
         :param p_len: number of characters to copy
         :param buf: jchar buffer to receive copy of characters
         """
-        self.functions[0].GetStringRegion(self, p_str, start, p_len, buf)
+        self.dispatch.GetStringRegion(self, p_str, start, p_len, buf)
 
     def GetStringUTFRegion(self, p_str, start, p_len, buf):
         """
@@ -2165,13 +2195,13 @@ class JNIEnv(Structure):
         :param p_len: number of characters to copy
         :param buf: a char buffer to receive copy of translated characters
         """
-        self.functions[0].GetStringUTFRegion(self, p_str, start, p_len, buf)
+        self.dispatch.GetStringUTFRegion(self, p_str, start, p_len, buf)
 
     def GetPrimitiveArrayCritical(self, array, is_copy=None):
-        return self.functions[0].GetPrimitiveArrayCritical(self, array, is_copy)
+        return self.dispatch.GetPrimitiveArrayCritical(self, array, is_copy)
 
     def ReleasePrimitiveArrayCritical(self, array, carray, is_copy=None):
-        self.functions[0].ReleasePrimitiveArrayCritical(self, array, carray, is_copy)
+        self.dispatch.ReleasePrimitiveArrayCritical(self, array, carray, is_copy)
 
     def GetStringCritical(self, string, is_copy=None):
         """
@@ -2185,7 +2215,7 @@ class JNIEnv(Structure):
         :param is_copy: a pointer to a jboolean to indicate whether this is a copy
         :return: a pointer to the jchar buffer of the string
         """
-        return self.functions[0].GetStringCritical(self, string, is_copy)
+        return self.dispatch.GetStringCritical(self, string, is_copy)
 
     def ReleaseStringCritical(self, string, cstring):
         """
@@ -2194,7 +2224,7 @@ class JNIEnv(Structure):
         :param string: a Java string reference
         :param cstring: the jchar buffer pointer retrieved from GetStringCritical
         """
-        self.functions[0].ReleaseStringCritical(self, string, cstring)
+        self.dispatch.ReleaseStringCritical(self, string, cstring)
 
     def NewWeakGlobalRef(self, obj):
         """
@@ -2204,7 +2234,7 @@ class JNIEnv(Structure):
         :return: None if obj refers to None, or if the VM runs out of memory.
         :raises: OutOfMemoryError
         """
-        return self.functions[0].NewWeakGlobalRef(self, obj)
+        return self.dispatch.NewWeakGlobalRef(self, obj)
 
     def DeleteWeakGlobalRef(self, ref):
         """
@@ -2212,7 +2242,7 @@ class JNIEnv(Structure):
 
         :param ref: the weak global reference
         """
-        self.functions[0].DeleteWeakGlobalRef(self, ref)
+        self.dispatch.DeleteWeakGlobalRef(self, ref)
 
     def ExceptionCheck(self):
         """
@@ -2221,7 +2251,7 @@ class JNIEnv(Structure):
 
         :return: JNI_TRUE when there is a pending exception; otherwise, returns JNI_FALSE.
         """
-        return self.functions[0].ExceptionCheck(self)
+        return self.dispatch.ExceptionCheck(self)
 
     def NewDirectByteBuffer(self, address, capacity):
         """
@@ -2232,7 +2262,7 @@ class JNIEnv(Structure):
         :param capacity: the size in bytes of the memory region
         :return:
         """
-        return self.functions[0].NewDirectByteBuffer(self, address, capacity)
+        return self.dispatch.NewDirectByteBuffer(self, address, capacity)
 
     def GetDirectBufferAddress(self, buf):
         """
@@ -2243,10 +2273,10 @@ class JNIEnv(Structure):
         :return: the starting address of the memory region referened by the buffer.
             Returns None if the memory region is undfined.
         """
-        return self.functions[0].GetDirectBufferAddress(self, buf)
+        return self.dispatch.GetDirectBufferAddress(self, buf)
 
     def GetDirectBufferCapacity(self, buf):
-        return self.functions[0].GetDirectBufferCapacity(self, buf)
+        return self.dispatch.GetDirectBufferCapacity(self, buf)
 
     def GetObjectRefType(self, obj):
         """
@@ -2259,7 +2289,7 @@ class JNIEnv(Structure):
             JNIGlobalRefType = 2
             JNIWeakGlobalRefType = 3
         """
-        return self.functions[0].GetObjectRefType(self, obj)
+        return self.dispatch.GetObjectRefType(self, obj)
 
     def GetModule(self, clazz):
         """
@@ -2272,7 +2302,7 @@ class JNIEnv(Structure):
         :param clazz: a Java class object, must not be None
         :return: the module that the class or interface is a member of.
         """
-        return self.functions[0].GetModule(self, clazz)
+        return self.dispatch.GetModule(self, clazz)
 
 
 JNIEnv_p = POINTER(JNIEnv)
@@ -2592,6 +2622,40 @@ JNINativeInterface_._fields_ = tuple(map_fields(
 ))
 
 
+class JNIDispatch(object):
+    """
+    The functions of a JNI function table, read into attributes once, so each
+    call is a single attribute lookup.
+    """
+    def __init__(self, table):
+        """
+        :param table: a JNINativeInterface_ structure
+        """
+        for name, _ in JNINativeInterface_._fields_:
+            setattr(self, name, getattr(table, name))
+
+
+# dispatch tables, by function table address
+_dispatch = {}
+
+
+def get_dispatch(functions):
+    """
+    Find the dispatch table for a JNI function table.
+
+    Every thread of a JVM usually shares the same function table, so the
+    table is only read once.
+
+    :param functions: a pointer to the JNINativeInterface_ function table
+    :return: a JNIDispatch instance
+    """
+    key = cast(functions, c_void_p).value
+    dispatch = _dispatch.get(key)
+    if dispatch is None:
+        dispatch = _dispatch[key] = JNIDispatch(functions[0])
+    return dispatch
+
+
 class JavaVMOption(Structure):
     _fields_ = (
         ('optionString', c_char_p),
@@ -2637,6 +2701,11 @@ JNI_VERSION_10 = 0x000a0000
 
 vm = JavaVM_p()
 ENCODING = py2jdbc.mutf8.NAME
+UTF16 = 'utf-16-le'
+UTF16_ERRORS = 'surrogatepass' if six.PY3 else 'strict'
+# the length, in chars, of the buffer each thread reuses to read strings, (see get_string)
+STRING_BUFFER_SIZE = 0x10000
+_chars = threading.local()
 
 
 def encode(s):
@@ -2663,6 +2732,43 @@ def decode(s):
     )
 
 
+def get_string(env, p_str):
+    """
+    Copy a Java string into a Python unicode string.
+
+    The characters are copied with GetStringRegion into a jchar buffer, which
+    is reused by the thread for strings up to STRING_BUFFER_SIZE characters,
+    (longer strings get a temporary buffer), then decoded with Python's UTF-16 codec, so
+    nothing has to be released afterwards.
+
+    :param env: the JNIEnv environment
+    :param p_str: a Java string object
+    :return: the unicode string
+    """
+    length = env.GetStringLength(p_str)
+    if length > STRING_BUFFER_SIZE:
+        buf = (jchar * length)()
+    else:
+        buf = getattr(_chars, 'buf', None)
+        if buf is None or len(buf) < length:
+            size = min(max(length, 2 * len(buf or ()), 256), STRING_BUFFER_SIZE)
+            buf = _chars.buf = (jchar * size)()
+    env.GetStringRegion(p_str, 0, length, buf)
+    return string_at(buf, 2 * length).decode(UTF16, UTF16_ERRORS)
+
+
+def new_string(env, s):
+    """
+    Create a Java string from a Python string, encoded as UTF-16 for NewString.
+
+    :param env: the JNIEnv environment
+    :param s: a unicode string, or bytes in Java's modified UTF-8
+    :return: a reference to the new java.lang.String
+    """
+    data = decode(s).encode(UTF16, UTF16_ERRORS)
+    return env.NewString(cast(c_char_p(data), jchar_p), len(data) // 2)
+
+
 def get_env(**kwargs):
     """
     Create or Fetch the JNIEnv pointer for this thread.
@@ -2724,12 +2830,39 @@ def get_env(**kwargs):
     return _env[0]
 
 
+def attached_env(version=JNI_VERSION_1_2):
+    """
+    Fetch the JNIEnv pointer for this thread, without attaching it.
+
+    :param version: the requested JNI version
+    :return: the local JNIEnv pointer, or None if there's no JVM or the thread
+        isn't attached to it.
+    """
+    if not vm:
+        return None
+    _env = JNIEnv_p()
+    if vm[0].GetEnv(byref(_env), version) != JNI_OK:
+        return None
+    return _env[0]
+
+
+def detach_thread():
+    """
+    Detach the current thread from the JVM.
+
+    Threads attached by get_env must be detached before they exit, except
+    the thread which created the JVM, which is detached by destroy_vm.
+    """
+    if vm:
+        vm[0].DetachCurrentThread()
+
+
 def destroy_vm():
     global vm
     if vm:
         vm[0].DetachCurrentThread()
         vm[0].DestroyJavaVM()
-        vm.values = None
+        vm = JavaVM_p()
 
 
 def get_class_name(env, obj):
@@ -2747,12 +2880,12 @@ def get_class_name(env, obj):
     class2 = env.GetObjectClass(obj2)
     mid_get_name = env.GetMethodID(class2, 'getName', '()Ljava/lang/String;')
     s = env.CallObjectMethodA(class1, mid_get_name, args)
-    chars = env.GetStringUTFChars(s, None)
+    name = get_string(env, s)
     env.DeleteLocalRef(class1)
     env.DeleteLocalRef(obj2)
     env.DeleteLocalRef(class2)
     env.DeleteLocalRef(s)
-    return decode(chars)
+    return name
 
 
 atexit.register(destroy_vm)
@@ -1,12 +1,52 @@
 # -*- coding: utf8 -*-
+import functools
 import logging
+import weakref
 import six
+import py2jdbc.jni
 from py2jdbc.jni import JNI_TRUE
-from py2jdbc.wrap import JClass
+from py2jdbc.wrap import BindMethods, JClass, JInstanceMethod, current_env
 
 
 log = logging.getLogger(__name__)
 
+# the instances holding global references, (see Object.BaseInstance.keep), by id,
+# as a weak reference to the instance and the global reference
+_kept = {}
+
+# global references of kept instances collected on threads that aren't attached
+# to the JVM, deleted by the next keep or release on an attached thread
+_dropped = []
+
+
+def _release_kept(key, *args):
+    """
+    Delete the global reference of a kept instance, when it's released or
+    garbage collected.  The garbage collector can run on any thread, which
+    mustn't be attached to the JVM here, so if it isn't, the reference is
+    queued in `_dropped` instead.
+
+    :param key: the id of the instance
+    :param args: the weak reference, when called back by the garbage collector
+    """
+    item = _kept.pop(key, None)
+    if item is not None and py2jdbc.jni.vm:
+        env = py2jdbc.jni.attached_env()
+        if env is None:
+            _dropped.append(item[1])
+        else:
+            env.DeleteGlobalRef(item[1])
+
+
+def _release_dropped(env):
+    """
+    Delete the global references queued by `_release_kept`.
+
+    :param env: the JNIEnv environment of the current thread
+    """
+    while _dropped:
+        env.DeleteGlobalRef(_dropped.pop())
+
 
 class MsgException(Exception):
     def __init__(self, message):
@@ -30,25 +70,84 @@ class Object(JClass):
     """
     class_name = 'java.lang.Object'
 
-    class Instance(object):
+    class BaseInstance(six.with_metaclass(BindMethods, object)):
         """
-        Wrapper for an instance of java.lang.Object
+        The methods of every instance wrapper, without the `cls` and `obj` slots,
+        so Throwable wrappers can also be Python exceptions.
         """
+        __slots__ = ()
+        clone = JInstanceMethod('clone')
+        equals = JInstanceMethod('equals')
+        getClass = JInstanceMethod('getClass')
+        hashCode = JInstanceMethod('hashCode')
+        notify = JInstanceMethod('notify')
+        notifyAll = JInstanceMethod('notifyAll')
+        toString = JInstanceMethod('toString')
+
         def __init__(self, cls, obj):
             self.cls = cls
             self.obj = obj
-            self.clone = lambda o=obj: cls.clone(o)
-            self.equals = lambda other, o=obj: cls.equals(o, other)
-            self.getClass = lambda o=obj: cls.getClass(o)
-            self.hashCode = lambda o=obj: cls.hashCode(o)
-            self.notify = lambda o=obj: cls.notify(o)
-            self.notifyAll = lambda o=obj: cls.notifyAll(o)
-            self.toString = lambda o=obj: cls.toString(o)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            self.release()
 
         @property
         def env(self):
             return self.cls.env
 
+        def keep(self):
+            """
+            Hold the object with a global reference instead of its local reference,
+            so it stays valid after the local frame it was returned in, and on other
+            threads.  Objects returned by method calls are local references, which
+            attached Python threads only free when they're deleted.
+
+            The global reference is deleted by `release`, or when the wrapper is
+            garbage collected.
+
+            :return: this instance
+            """
+            key = id(self)
+            if key not in _kept and self.obj:
+                env = self.env.env
+                _release_dropped(env)
+                ref = env.NewGlobalRef(self.obj)
+                env.DeleteLocalRef(self.obj)
+                self.obj = ref
+                _kept[key] = (weakref.ref(self, functools.partial(_release_kept, key)), ref)
+            return self
+
+        @property
+        def on_own_thread(self):
+            """
+            True on the thread whose ThreadEnv created the wrapper, which is the
+            only thread that can use it, unless it's kept.
+            """
+            return current_env() is self.cls.env
+
+        @property
+        def kept(self):
+            """
+            True if the object is held with a global reference, (see `keep`).
+            """
+            return id(self) in _kept
+
+        def release(self):
+            """
+            Delete the object's reference, global if it was kept, or local.
+            The wrapper can't be used after this.
+            """
+            obj, self.obj = self.obj, None
+            if _dropped:
+                _release_dropped(self.env.env)
+            if id(self) in _kept:
+                _release_kept(id(self))
+            elif obj and py2jdbc.jni.vm:
+                self.env.env.DeleteLocalRef(obj)
+
         def __eq__(self, other):
             return self.equals(other.obj)
 
@@ -68,6 +167,12 @@ class Object(JClass):
             else:
                 raise ValueError("invalid number of arguments: %r" % args)
 
+    class Instance(BaseInstance):
+        """
+        Wrapper for an instance of java.lang.Object
+        """
+        __slots__ = ('cls', 'obj', '__weakref__')
+
     def __init__(self, env):
         super(Object, self).__init__(env)
         if self.class_name == Object.class_name:
@@ -109,9 +214,8 @@ class Class(Object):
         """
         Wrapper for an instance of java.lang.Class
         """
-        def __init__(self, cls, obj):
-            super(Class.Instance, self).__init__(cls, obj)
-            self.getName = lambda o=obj: cls.getName(o)
+        __slots__ = ()
+        getName = JInstanceMethod('getName')
 
         def getDeclaredField(self, name):
             cls = self.env.get('java.lang.reflect.Field')
@@ -152,12 +256,11 @@ class StackTraceElement(Object):
         """
         Wrapper for an instance of java.lang.StackTraceElement
         """
-        def __init__(self, cls, obj):
-            super(StackTraceElement.Instance, self).__init__(cls, obj)
-            self.getClassName = lambda o=obj, *a: cls.getClassName(o, *a)
-            self.getFileName = lambda o=obj, *a: cls.getFileName(o, *a)
-            self.getLineNumber = lambda o=obj, *a: cls.getLineNumber(o, *a)
-            self.getMethodName = lambda o=obj, *a: cls.getMethodName(o, *a)
+        __slots__ = ()
+        getClassName = JInstanceMethod('getClassName')
+        getFileName = JInstanceMethod('getFileName')
+        getLineNumber = JInstanceMethod('getLineNumber')
+        getMethodName = JInstanceMethod('getMethodName')
 
     def __init__(self, env):
         super(StackTraceElement, self).__init__(env)
@@ -173,22 +276,35 @@ class Throwable(Object):
     """
     class_name = 'java.lang.Throwable'
 
-    class Instance(Object.Instance, Exception):
+    class Instance(Object.BaseInstance, Exception):
         """
         Wrapper for java.lang.Throwable object instance
         """
-        def __init__(self, cls, obj):
-            super(Throwable.Instance, self).__init__(cls, obj)
-            self.getMessage = lambda o=obj: cls.getMessage(o)
-            self.getStackTrace = lambda o=obj: cls.getStackTrace(o)
-            # gather exception message
-            ste = cls.env.get('java.lang.StackTraceElement')
+        getMessage = JInstanceMethod('getMessage')
+        getStackTrace = JInstanceMethod('getStackTrace')
+
+        @property
+        def message(self):
+            """
+            The exception message, followed by the classes in the stack trace.
+
+            It's built the first time it's read, (it takes a JNI call per stack
+            frame), so exceptions which are caught and handled stay cheap.
+
+            :return: the message text
+            """
+            try:
+                return self._message
+            except AttributeError:
+                pass
+            ste = self.env.get('java.lang.StackTraceElement')
             message = [self.getMessage()]
             stack_trace = self.getStackTrace()
             for elem in stack_trace:
                 name = ste(elem).getClassName()
                 message.append(name)
-            self.message = '\n    at '.join(message)
+            self._message = '\n    at '.join(message)
+            return self._message
 
     def __init__(self, env):
         super(Throwable, self).__init__(env)
@@ -219,9 +335,8 @@ class Boolean(Object):
         """
         Wrapper for java.lang.Boolean object instance
         """
-        def __init__(self, cls, obj):
-            super(Boolean.Instance, self).__init__(cls, obj)
-            self.booleanValue = lambda o=obj: cls.booleanValue(o)
+        __slots__ = ()
+        booleanValue = JInstanceMethod('booleanValue')
 
         def __bool__(self):
             return self.booleanValue() == JNI_TRUE
@@ -262,16 +377,15 @@ class Character(Object):
     class_name = 'java.lang.Character'
 
     class Instance(Object.Instance):
-        def __init__(self, cls, obj):
-            super(Character.Instance, self).__init__(cls, obj)
-            self.charValue = lambda o=obj: cls.charValue(o)
+        __slots__ = ()
+        charValue = JInstanceMethod('charValue')
 
     def __init__(self, env):
         super(Character, self).__init__(env)
         if self.class_name == Character.class_name:
             self.cons = self.constructor('C')
         self.charValue = self.method('charValue', '()C')
-        self._MAX_VALUE = self.static_field('MAX_VALUE', 'C')
+        self._MAX_VALUE = self.constant('MAX_VALUE', 'C')
 
     @property
     def MAX_VALUE(self):
@@ -293,14 +407,13 @@ class Number(Object):
         """
         Wrapper for java.lang.Number object instance
         """
-        def __init__(self, cls, obj):
-            super(Number.Instance, self).__init__(cls, obj)
-            self.byteValue = lambda o=obj: cls.byteValue(o)
-            self.doubleValue = lambda o=obj: cls.doubleValue(o)
-            self.floatValue = lambda o=obj: cls.floatValue(o)
-            self.intValue = lambda o=obj: cls.intValue(o)
-            self.longValue = lambda o=obj: cls.longValue(o)
-            self.shortValue = lambda o=obj: cls.shortValue(o)
+        __slots__ = ()
+        byteValue = JInstanceMethod('byteValue')
+        doubleValue = JInstanceMethod('doubleValue')
+        floatValue = JInstanceMethod('floatValue')
+        intValue = JInstanceMethod('intValue')
+        longValue = JInstanceMethod('longValue')
+        shortValue = JInstanceMethod('shortValue')
 
         def __int__(self):
             return self.longValue()
@@ -335,8 +448,7 @@ class Byte(Number):
         """
         Wrapper for java.lang.Byte object instance
         """
-        def __init__(self, cls, obj):
-            super(Byte.Instance, self).__init__(cls, obj)
+        __slots__ = ()
 
         def __int__(self):
             return self.byteValue()
@@ -346,9 +458,9 @@ class Byte(Number):
         if self.class_name == Byte.class_name:
             self.cons_s = self.constructor('Ljava/lang/String;')
             self.cons_b = self.constructor('B')
-        self._MAX_VALUE = self.static_field('MAX_VALUE', 'B')
-        self._MIN_VALUE = self.static_field('MIN_VALUE', 'B')
-        self._SIZE = self.static_field('SIZE', 'I')
+        self._MAX_VALUE = self.constant('MAX_VALUE', 'B')
+        self._MIN_VALUE = self.constant('MIN_VALUE', 'B')
+        self._SIZE = self.constant('SIZE', 'I')
         self.compare = self.static_method('compare', '(BB)I')
 
     @property
@@ -382,8 +494,7 @@ class Short(Number):
         """
         Wrapper for java.lang.Short object instance
         """
-        def __init__(self, cls, obj):
-            super(Short.Instance, self).__init__(cls, obj)
+        __slots__ = ()
 
         def __int__(self):
             return self.shortValue()
@@ -393,9 +504,9 @@ class Short(Number):
         if self.class_name == Short.class_name:
             self.cons_str = self.constructor('Ljava/lang/String;')
             self.cons_s = self.constructor('S')
-        self._MAX_VALUE = self.static_field('MAX_VALUE', 'S')
-        self._MIN_VALUE = self.static_field('MIN_VALUE', 'S')
-        self._SIZE = self.static_field('SIZE', 'I')
+        self._MAX_VALUE = self.constant('MAX_VALUE', 'S')
+        self._MIN_VALUE = self.constant('MIN_VALUE', 'S')
+        self._SIZE = self.constant('SIZE', 'I')
 
     @property
     def MAX_VALUE(self):
@@ -428,8 +539,7 @@ class Integer(Number):
         """
         Wrapper for java.lang.Integer object instance
         """
-        def __init__(self, cls, obj):
-            super(Integer.Instance, self).__init__(cls, obj)
+        __slots__ = ()
 
         def __int__(self):
             return self.intValue()
@@ -439,9 +549,9 @@ class Integer(Number):
         if self.class_name == Integer.class_name:
             self.cons_s = self.constructor('Ljava/lang/String;')
             self.cons_i = self.constructor('I')
-        self._MAX_VALUE = self.static_field('MAX_VALUE', 'I')
-        self._MIN_VALUE = self.static_field('MIN_VALUE', 'I')
-        self._SIZE = self.static_field('SIZE', 'I')
+        self._MAX_VALUE = self.constant('MAX_VALUE', 'I')
+        self._MIN_VALUE = self.constant('MIN_VALUE', 'I')
+        self._SIZE = self.constant('SIZE', 'I')
         self._valueOf = self.static_method(
             'valueOf',
             '(Ljava/lang/String;)Ljava/lang/Integer;'
@@ -481,8 +591,7 @@ class Long(Number):
         """
         Wrapper for java.lang.Integer object instance
         """
-        def __init__(self, cls, obj):
-            super(Long.Instance, self).__init__(cls, obj)
+        __slots__ = ()
 
         def __int__(self):
             return self.longValue()
@@ -492,9 +601,9 @@ class Long(Number):
         if self.class_name == Long.class_name:
             self.cons_s = self.constructor('Ljava/lang/String;')
             self.cons_j = self.constructor('J')
-        self._MAX_VALUE = self.static_field('MAX_VALUE', 'J')
-        self._MIN_VALUE = self.static_field('MIN_VALUE', 'J')
-        self._SIZE = self.static_field('SIZE', 'I')
+        self._MAX_VALUE = self.constant('MAX_VALUE', 'J')
+        self._MIN_VALUE = self.constant('MIN_VALUE', 'J')
+        self._SIZE = self.constant('SIZE', 'I')
 
     @property
     def MAX_VALUE(self):
@@ -527,8 +636,7 @@ class Float(Number):
         """
         Wrapper for java.lang.Float object instance
         """
-        def __init__(self, cls, obj):
-            super(Float.Instance, self).__init__(cls, obj)
+        __slots__ = ()
 
         def __float__(self):
             return self.floatValue()
@@ -538,15 +646,15 @@ class Float(Number):
         if self.class_name == Float.class_name:
             self.cons_d = self.constructor('D')
             self.cons_s = self.constructor('Ljava/lang/String;')
-        self._MAX_EXPONENT = self.static_field('MAX_EXPONENT', 'I')
-        self._MAX_VALUE = self.static_field('MAX_VALUE', 'F')
-        self._MIN_EXPONENT = self.static_field('MIN_EXPONENT', 'I')
-        self._MIN_NORMAL = self.static_field('MIN_NORMAL', 'F')
-        self._MIN_VALUE = self.static_field('MIN_VALUE', 'F')
-        self._NaN = self.static_field('NaN', 'F')
-        self._NEGATIVE_INFINITY = self.static_field('NEGATIVE_INFINITY', 'F')
-        self._POSITIVE_INFINITY = self.static_field('POSITIVE_INFINITY', 'F')
-        self._SIZE = self.static_field('SIZE', 'I')
+        self._MAX_EXPONENT = self.constant('MAX_EXPONENT', 'I')
+        self._MAX_VALUE = self.constant('MAX_VALUE', 'F')
+        self._MIN_EXPONENT = self.constant('MIN_EXPONENT', 'I')
+        self._MIN_NORMAL = self.constant('MIN_NORMAL', 'F')
+        self._MIN_VALUE = self.constant('MIN_VALUE', 'F')
+        self._NaN = self.constant('NaN', 'F')
+        self._NEGATIVE_INFINITY = self.constant('NEGATIVE_INFINITY', 'F')
+        self._POSITIVE_INFINITY = self.constant('POSITIVE_INFINITY', 'F')
+        self._SIZE = self.constant('SIZE', 'I')
 
     @property
     def MAX_EXPONENT(self):
@@ -603,8 +711,7 @@ class Double(Number):
         """
         Wrapper for java.lang.Double object instance
         """
-        def __init__(self, cls, obj):
-            super(Double.Instance, self).__init__(cls, obj)
+        __slots__ = ()
 
         def __float__(self):
             return self.doubleValue()
@@ -614,15 +721,15 @@ class Double(Number):
         if self.class_name == Double.class_name:
             self.cons_d = self.constructor('D')
             self.cons_s = self.constructor('Ljava/lang/String;')
-        self._MAX_EXPONENT = self.static_field('MAX_EXPONENT', 'I')
-        self._MAX_VALUE = self.static_field('MAX_VALUE', 'D')
-        self._MIN_EXPONENT = self.static_field('MIN_EXPONENT', 'I')
-        self._MIN_NORMAL = self.static_field('MIN_NORMAL', 'D')
-        self._MIN_VALUE = self.static_field('MIN_VALUE', 'D')
-        self._NaN = self.static_field('NaN', 'D')
-        self._NEGATIVE_INFINITY = self.static_field('NEGATIVE_INFINITY', 'D')
-        self._POSITIVE_INFINITY = self.static_field('POSITIVE_INFINITY', 'D')
-        self._SIZE = self.static_field('SIZE', 'I')
+        self._MAX_EXPONENT = self.constant('MAX_EXPONENT', 'I')
+        self._MAX_VALUE = self.constant('MAX_VALUE', 'D')
+        self._MIN_EXPONENT = self.constant('MIN_EXPONENT', 'I')
+        self._MIN_NORMAL = self.constant('MIN_NORMAL', 'D')
+        self._MIN_VALUE = self.constant('MIN_VALUE', 'D')
+        self._NaN = self.constant('NaN', 'D')
+        self._NEGATIVE_INFINITY = self.constant('NEGATIVE_INFINITY', 'D')
+        self._POSITIVE_INFINITY = self.constant('POSITIVE_INFINITY', 'D')
+        self._SIZE = self.constant('SIZE', 'I')
 
     @property
     def MAX_EXPONENT(self):
@@ -673,14 +780,13 @@ class String(Object):
     class_name = 'java.lang.String'
 
     class Instance(Object.Instance):
-        def __init__(self, cls, obj):
-            super(String.Instance, self).__init__(cls, obj)
-            self.charAt = lambda i, o=obj: cls.charAt(o, i)
-            self.compareTo = lambda s, o=obj: cls.compareTo(o, s)
-            self.compareToIgnoreCase = lambda s, o=obj: cls.compareToIgnoreCase(o, s)
-            self.concat = lambda s, o=obj: cls.concat(o, s)
-            self.endsWith = lambda s, o=obj: cls.endsWith(o, s)
-            self.length = lambda o=obj: cls.length(o)
+        __slots__ = ()
+        charAt = JInstanceMethod('charAt')
+        compareTo = JInstanceMethod('compareTo')
+        compareToIgnoreCase = JInstanceMethod('compareToIgnoreCase')
+        concat = JInstanceMethod('concat')
+        endsWith = JInstanceMethod('endsWith')
+        length = JInstanceMethod('length')
 
         def __len__(self):
             return self.length()
@@ -0,0 +1,550 @@
+# -*- coding: utf8 -*-
+"""
+Streaming LOB values between Python and the JVM.
+
+File-like readers for BLOB and CLOB values read the value in chunks
+through java.sql.Blob.getBytes and java.sql.Clob.getSubString, instead of
+copying the whole value into the JVM heap and Python at once.
+
+Readers are only valid while the result set they were read from is open,
+(drivers free LOBs when the transaction ends).
+
+In the other direction, BufferInputStream lets drivers read Python file
+objects and buffers as a java.io.InputStream, (or Reader), without copying
+the whole value into a Java array first.
+"""
+import base64
+from ctypes import CFUNCTYPE, addressof, c_char, c_void_p, cast
+import io
+import itertools
+import logging
+import six
+import py2jdbc.jni
+from py2jdbc.exc import OperationalError
+from py2jdbc.jni import JNINativeMethod, jint, jlong
+from py2jdbc.lang import LangException, Object
+
+log = logging.getLogger(__name__)
+
+# the default number of bytes, or chars, copied from the JVM at a time
+CHUNK_SIZE = 1 << 16
+
+
+class _LobReader(object):
+    """
+    Position and chunking shared by BlobReader and ClobReader.
+
+    Positions are offsets from the start of the value, in bytes for BLOB values,
+    and in Java chars, (UTF-16 code units), for CLOB values.
+    """
+    def _init(self, lob, length, chunksize):
+        """
+        :param lob: a py2jdbc.sql.Blob or Clob instance
+        :param length: the length of the value
+        :param chunksize: the size of the chunks to read
+        """
+        self.lob = lob
+        self.length = length
+        self.chunksize = chunksize
+        self.pos = 0
+
+    def __len__(self):
+        return self.length
+
+    def seekable(self):
+        return True
+
+    def readable(self):
+        return True
+
+    def tell(self):
+        self._check()
+        return self.pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """
+        Move to a new position in the value.
+
+        :param offset: the offset, relative to `whence`
+        :param whence: io.SEEK_SET, io.SEEK_CUR or io.SEEK_END
+        :return: the new position
+        """
+        self._check()
+        if whence == io.SEEK_CUR:
+            offset += self.pos
+        elif whence == io.SEEK_END:
+            offset += self.length
+        elif whence != io.SEEK_SET:
+            raise ValueError("invalid whence (%r)" % whence)
+        if offset < 0:
+            raise ValueError("negative seek position %r" % offset)
+        self.pos = offset
+        return self.pos
+
+    def _check(self):
+        if self.closed:
+            raise ValueError("I/O operation on closed reader")
+
+    def _count(self, size):
+        """
+        The number of units to read for a read request.
+
+        :param size: the requested size, negative or None for the rest of the value
+        :return: the number to read
+        """
+        remaining = max(0, self.length - self.pos)
+        if size is None or size < 0:
+            return remaining
+        return min(size, remaining)
+
+    def keep(self):
+        """
+        Hold the LOB with a global reference, so the reader can be used after
+        the local frame it was created in ends.
+        """
+        self.lob.keep()
+
+    def _free(self):
+        """
+        Free the LOB in the driver, and delete its reference.
+
+        Readers are closed by the garbage collector on any thread, which can't
+        use the LOB through the JNIEnv of the thread that read it, so the LOB is
+        only freed on that thread.  Elsewhere, only a kept global reference is
+        released, (local references can only be deleted by their own thread).
+        """
+        lob, self.lob = self.lob, None
+        if lob is None or not py2jdbc.jni.vm:
+            return
+        env = py2jdbc.jni.attached_env()
+        if env is None or addressof(env) != addressof(lob.env.env):
+            if lob.kept:
+                lob.release()
+            return
+        try:
+            lob.free()
+        except LangException.Instance:
+            pass
+        finally:
+            lob.release()
+
+
+class BlobReader(_LobReader, io.RawIOBase):
+    """
+    A seekable binary file-like reader for a BLOB value.
+    """
+    def __init__(self, blob, length, chunksize=CHUNK_SIZE):
+        """
+        :param blob: a py2jdbc.sql.Blob instance, owned by the reader
+        :param length: the length of the value
+        :param chunksize: the number of bytes read from the driver at a time
+        """
+        io.RawIOBase.__init__(self)
+        self._init(blob, length, chunksize)
+
+    def _read(self, count):
+        """
+        Read bytes at the current position in one call to the driver.
+
+        :param count: the number of bytes
+        :return: the bytes
+        """
+        try:
+            data = self.lob.getBytes(self.pos + 1, count)
+        except LangException.Instance as e:
+            raise OperationalError.from_java(e)
+        self.pos += len(data)
+        return data
+
+    def read(self, size=-1):
+        """
+        Read up to `size` bytes, or the rest of the value.
+
+        :param size: the maximum number of bytes
+        :return: the bytes read, empty at the end of the value
+        """
+        self._check()
+        count = self._count(size)
+        chunks = []
+        while count > 0:
+            chunk = self._read(min(count, self.chunksize))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            count -= len(chunk)
+        return b''.join(chunks)
+
+    readall = read
+
+    def readinto(self, b):
+        """
+        Read bytes into a writable buffer, up to the chunk size.
+
+        :param b: a bytearray, memoryview or other writable buffer
+        :return: the number of bytes read, 0 at the end of the value
+        """
+        self._check()
+        view = memoryview(b)
+        if view.format != 'B':
+            view = view.cast('B')
+        count = self._count(min(view.nbytes, self.chunksize))
+        if not count:
+            return 0
+        data = self._read(count)
+        view[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._free()
+        io.RawIOBase.close(self)
+
+
+class ClobReader(_LobReader, io.TextIOBase):
+    """
+    A seekable text file-like reader for a CLOB value.
+    """
+    def __init__(self, clob, length, chunksize=CHUNK_SIZE):
+        """
+        :param clob: a py2jdbc.sql.Clob instance, owned by the reader
+        :param length: the length of the value, in Java chars
+        :param chunksize: the number of chars read from the driver at a time
+        """
+        io.TextIOBase.__init__(self)
+        self._init(clob, length, chunksize)
+        self._pending = six.u('')
+
+    def tell(self):
+        return super(ClobReader, self).tell() - self._units(self._pending)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset, whence = offset + self.tell(), io.SEEK_SET
+        self._pending = six.u('')
+        return super(ClobReader, self).seek(offset, whence)
+
+    @staticmethod
+    def _units(text):
+        """
+        The length of text in Java chars, counting supplementary characters twice.
+
+        :param text: unicode text
+        :return: the number of UTF-16 code units
+        """
+        return len(text.encode('utf-16-le', 'surrogatepass')) // 2 if six.PY3 else len(text)
+
+    def _read(self, count):
+        """
+        Read chars at the current position in one call to the driver, leaving
+        a surrogate pair split at the end for the next read.
+
+        :param count: the number of chars
+        :return: the text read
+        """
+        try:
+            text = self.lob.getSubString(self.pos + 1, count)
+        except LangException.Instance as e:
+            raise OperationalError.from_java(e)
+        if len(text) > 1 and self.pos + count < self.length and six.u('\ud800') <= text[-1] <= six.u('\udbff'):
+            text = text[:-1]
+            count -= 1
+        self.pos += count
+        return text
+
+    def read(self, size=-1):
+        """
+        Read up to `size` chars, or the rest of the value.
+
+        :param size: the maximum number of chars
+        :return: the text read, empty at the end of the value
+        """
+        self._check()
+        text, self._pending = self._pending, six.u('')
+        if size is not None and 0 <= size <= len(text):
+            text, self._pending = text[:size], text[size:]
+            return text
+        chunks, have = [text], len(text)
+        while size is None or size < 0 or have < size:
+            count = self._count(self.chunksize if size is None or size < 0 else min(self.chunksize, size - have))
+            if not count:
+                break
+            chunks.append(self._read(count))
+            have += len(chunks[-1])
+        return six.u('').join(chunks)
+
+    def readline(self, size=-1):
+        """
+        Read until the end of a line, or `size` chars.
+
+        :param size: the maximum number of chars
+        :return: the line, including the newline, empty at the end of the value
+        """
+        self._check()
+        text = self._pending
+        while six.u('\n') not in text and (size is None or size < 0 or len(text) < size):
+            count = self._count(self.chunksize)
+            if not count:
+                break
+            text += self._read(count)
+        end = text.find(six.u('\n')) + 1 or len(text)
+        if size is not None and size >= 0:
+            end = min(end, size)
+        text, self._pending = text[:end], text[end:]
+        return text
+
+    def close(self):
+        if not self.closed:
+            self._free()
+        io.TextIOBase.close(self)
+
+
+# the Python sources read by BufferInputStream.fill, by source number
+_sources = {}
+_source_numbers = itertools.count(1)
+
+
+@CFUNCTYPE(jint, c_void_p, c_void_p, jlong)
+def _fill(env, cls, source):
+    """
+    The native py2jdbc.BufferInputStream.fill method, which reads the next
+    chunk of a Python source into the stream's buffer.
+
+    Exceptions can't be raised through the JVM, so they're logged, and the
+    stream throws an IOException instead.
+
+    :param env: the JNIEnv pointer of the calling thread
+    :param cls: the BufferInputStream class
+    :param source: the source number
+    :return: the number of bytes read, -1 at the end, or -2 on errors
+    """
+    try:
+        return _sources[source].fill()
+    except Exception:
+        log.exception("error reading stream source %d", source)
+        return -2
+
+
+class StreamSource(object):
+    """
+    A Python file object, or read-only buffer, which is read in chunks into
+    the direct buffer of a BufferInputStream.
+
+    Text files are read as characters, and encoded as UTF-16LE for the
+    stream's reader.
+    """
+    def __init__(self, data, chunksize=CHUNK_SIZE, text=False):
+        """
+        :param data: a file object, or a memoryview of bytes
+        :param chunksize: the size of the buffer, in bytes
+        :param text: True if `data` is a text file
+        """
+        self.data = data
+        self.text = text
+        self.pos = 0
+        self.chunk = bytearray(chunksize)
+        self.number = next(_source_numbers)
+        _sources[self.number] = self
+
+    def fill(self):
+        """
+        Read the next chunk into the buffer.
+
+        :return: the number of bytes read, -1 at the end of the data
+        """
+        chunk = self.chunk
+        if self.text:
+            data = self.data.read(len(chunk) // 4)
+            if not data:
+                return -1
+            data = data.encode('utf-16-le', 'surrogatepass') if six.PY3 else data.encode('utf-16-le')
+            count = len(data)
+            chunk[:count] = data
+        elif isinstance(self.data, memoryview):
+            count = min(len(chunk), self.data.nbytes - self.pos)
+            chunk[:count] = self.data[self.pos:self.pos + count]
+            self.pos += count
+        elif hasattr(self.data, 'readinto'):
+            count = self.data.readinto(memoryview(chunk))
+        else:
+            data = self.data.read(len(chunk))
+            count = len(data)
+            chunk[:count] = data
+        return count or -1
+
+    def close(self):
+        _sources.pop(self.number, None)
+
+
+def _stream_length(f):
+    """
+    The number of bytes left in a binary file, if it can be found.
+
+    :param f: a binary file object
+    :return: the number of bytes from the current position to the end, or None
+    """
+    try:
+        if not f.seekable():
+            return None
+        pos = f.tell()
+        end = f.seek(0, io.SEEK_END)
+        f.seek(pos)
+    except (AttributeError, IOError, OSError, ValueError):
+        return None
+    return max(0, end - pos)
+
+
+class BufferInputStream(Object):
+    """
+    Wrapper for the py2jdbc.BufferInputStream helper class, a java.io.InputStream
+    over a direct ByteBuffer of Python memory.
+
+    Writable buffers, (like bytearray or a writable mmap), are read by the
+    driver in place.  Other buffers and file objects are copied in chunks
+    into a buffer which the stream refills through the native fill method.
+
+    The class isn't shipped in a jar, it's defined from the bytecode below,
+    which is compiled from src/py2jdbc/BufferInputStream.java.
+    """
+    class_name = 'py2jdbc.BufferInputStream'
+    # the native methods are registered once, on the class shared by all threads
+    registered = False
+    bytecode = base64.b64decode(
+        b'yv66vgAAADIAaQEAGXB5MmpkYmMvQnVmZmVySW5wdXRTdHJlYW0HAAEBABNqYXZhL2lvL0lucHV0'
+        b'U3RyZWFtBwADAQAKU291cmNlRmlsZQEAFkJ1ZmZlcklucHV0U3RyZWFtLmphdmEBAARmaWxsAQAE'
+        b'KEopSQEABnJlYWR5JAEAHihMcHkyamRiYy9CdWZmZXJJbnB1dFN0cmVhbTspWgEACkV4Y2VwdGlv'
+        b'bnMBABNqYXZhL2lvL0lPRXhjZXB0aW9uBwAMAQAGYnVmZmVyAQAVTGphdmEvbmlvL0J5dGVCdWZm'
+        b'ZXI7DAAOAA8JAAIAEAEAE2phdmEvbmlvL0J5dGVCdWZmZXIHABIBAA9qYXZhL25pby9CdWZmZXIH'
+        b'ABQBAAxoYXNSZW1haW5pbmcBAAMoKVoMABYAFwoAFQAYAQADZW9mAQABWgwAGgAbCQACABwBAAZz'
+        b'b3VyY2UBAAFKDAAeAB8JAAIAIAwABwAICgACACIBABxlcnJvciByZWFkaW5nIFB5dGhvbiBzb3Vy'
+        b'Y2UgCAAkAQAQamF2YS9sYW5nL1N0cmluZwcAJgEAB3ZhbHVlT2YBACYoTGphdmEvbGFuZy9PYmpl'
+        b'Y3Q7KUxqYXZhL2xhbmcvU3RyaW5nOwwAKAApCgAnACoBABUoSilMamF2YS9sYW5nL1N0cmluZzsM'
+        b'ACgALAoAJwAtAQAGY29uY2F0AQAmKExqYXZhL2xhbmcvU3RyaW5nOylMamF2YS9sYW5nL1N0cmlu'
+        b'ZzsMAC8AMAoAJwAxAQAGPGluaXQ+AQAVKExqYXZhL2xhbmcvU3RyaW5nOylWDAAzADQKAA0ANQEA'
+        b'BWNsZWFyAQAXKClMamF2YS9uaW8vQnl0ZUJ1ZmZlcjsMADcAOAoAEwA5AQAFbGltaXQBABgoSSlM'
+        b'amF2YS9uaW8vQnl0ZUJ1ZmZlcjsMADsAPAoAEwA9AQAPTGluZU51bWJlclRhYmxlAQANU3RhY2tN'
+        b'YXBUYWJsZQEABENvZGUBAARyZWFkAQADKClJDAAJAAoKAAIARAEAA2dldAEAAygpQgwARgBHCgAT'
+        b'AEgBAAcoW0JJSSlJAQACW0IHAEsBAAlyZW1haW5pbmcMAE0AQwoAFQBOAQAOamF2YS9sYW5nL01h'
+        b'dGgHAFABAANtaW4BAAUoSUkpSQwAUgBTCgBRAFQBABsoW0JJSSlMamF2YS9uaW8vQnl0ZUJ1ZmZl'
+        b'cjsMAEYAVgoAEwBXAQAJYXZhaWxhYmxlAQAGcmVhZGVyAQASKClMamF2YS9pby9SZWFkZXI7AQAZ'
+        b'amF2YS9pby9JbnB1dFN0cmVhbVJlYWRlcgcAXAEACFVURi0xNkxFCABeAQAqKExqYXZhL2lvL0lu'
+        b'cHV0U3RyZWFtO0xqYXZhL2xhbmcvU3RyaW5nOylWDAAzAGAKAF0AYQEADmphdmEvaW8vUmVhZGVy'
+        b'BwBjAQAZKExqYXZhL25pby9CeXRlQnVmZmVyO0opVgEAAygpVgwAMwBmCgAEAGcAIQACAAQAAAAD'
+        b'ABAADgAPAAAAEAAeAB8AAAAAABoAGwAAAAcBCAAHAAgAAAAIAAkACgACAAsAAAAEAAEADQBBAAAA'
+        b'rwAFAAIAAABZpwBNKrQAHZkABQOsKrQAIbgAIzwbAqIAGrsADVkSJbgAKyq0ACG4AC62ADK3ADa/'
+        b'GwKgAAoqBLUAHQOsKrQAEbYAOlcqtAARG7YAPlcqtAARtgAZmf+vBKwAAAACAD8AAAAyAAwAAwAl'
+        b'AAoAJgAMACgAFAApABkAKgAwACwANQAtADoALgA8ADAARAAxAE0AJABXADMAQAAAAAwABQMI/AAj'
+        b'AQv6ABAAAQBCAEMAAgALAAAABAABAA0AQQAAADoAAgABAAAAFyq4AEWZABEqtAARtgBJEQD/fqcA'
+        b'BAKsAAAAAgA/AAAABgABAAAANwBAAAAABQACFUABAAEAQgBKAAIACwAAAAQAAQANAEEAAABmAAQA'
+        b'BQAAACwdA6AABQOsKrgARZoABQKsHSq0ABG2AE+4AFU2BCq0ABErHBUEtgBYVxUErAAAAAIAPwAA'
+        b'AB4ABwAAADsABQA8AAcAPgAOAD8AEABBAB0AQgApAEMAQAAAAAQAAgcIAAEAWQBDAAEAQQAAACAA'
+        b'AQABAAAACCq0ABG2AE+sAAAAAQA/AAAABgABAAAARwABAFoAWwACAAsAAAAEAAEADQBBAAAAIwAE'
+        b'AAEAAAALuwBdWSoSX7cAYrAAAAABAD8AAAAGAAEAAABOAAEAMwBlAAEAQQAAAIgABQAEAAAALCq3'
+        b'AGgqK7UAESogtQAhKiADhZSZAAcDpwAEBLUAHSADhZSZAAkrA7YAPlexAAAAAgA/AAAAHgAHAAAA'
+        b'GAAEABkACQAaAA4AGwAeABwAJQAdACsAGABAAAAAJgAD/wAaAAMHAAIHABMEAAEHAAL/AAAAAwcA'
+        b'AgcAEwQAAgcAAgEPAAEABQAAAAIABg=='
+    )
+
+    class Instance(Object.Instance):
+        """
+        Wrapper for an instance of py2jdbc.BufferInputStream
+        """
+        __slots__ = ('length', 'text', 'buffer', 'source', '_reader')
+
+        def __init__(self, cls, obj):
+            super(BufferInputStream.Instance, self).__init__(cls, obj)
+            self.length = None
+            self.text = False
+            self.buffer = None
+            self.source = None
+            self._reader = None
+
+        def reader(self):
+            """
+            The stream as a java.io.Reader, for text sources.
+
+            :return: a java.io.Reader object pointer
+            """
+            if self._reader is None:
+                self._reader = self.cls.reader(self.obj)
+            return self._reader
+
+        def close(self):
+            """
+            Stop reading the source, and delete the local references.
+
+            The stream must not be read again, once it's closed.
+            """
+            if self.source is not None:
+                self.source.close()
+                self.source = None
+            if not py2jdbc.jni.vm:
+                return
+            env = self.env.env
+            if self._reader is not None:
+                env.DeleteLocalRef(self._reader)
+                self._reader = None
+            if self.buffer is not None:
+                env.DeleteLocalRef(self.buffer[0])
+                self.buffer = None
+            env.DeleteLocalRef(self.obj)
+
+    def __init__(self, env):
+        super(BufferInputStream, self).__init__(env)
+        self.cons = self.constructor('Ljava/nio/ByteBuffer;J')
+        self.reader = self.method('reader', '()Ljava/io/Reader;')
+        if not BufferInputStream.registered:
+            methods = (JNINativeMethod * 1)(
+                JNINativeMethod(b'fill', b'(J)I', cast(_fill, c_void_p))
+            )
+            if env.env.RegisterNatives(self.cls, methods, 1) != 0:
+                raise RuntimeError("can't register native methods of %s" % self.class_name)
+            BufferInputStream.registered = True
+
+    def new(self, value, chunksize=CHUNK_SIZE):
+        """
+        Create a stream which reads a Python file object or buffer.
+
+        Buffers and binary files with a known size set the stream's `length`,
+        and text files set `text`, to be read through `reader()`.  The value
+        must not change until the stream is closed.
+
+        :param value: a buffer, (memoryview, mmap, etc.), or a binary or text file object
+        :param chunksize: the number of bytes copied from files at a time
+        :return: a BufferInputStream instance
+        """
+        text = isinstance(value, io.TextIOBase)
+        length = source = view = None
+        if not text:
+            try:
+                view = memoryview(value)
+            except TypeError:
+                pass
+        if view is not None:
+            if not view.c_contiguous:
+                view = memoryview(view.tobytes())
+            view = view.cast('B')
+            length = view.nbytes
+            if view.readonly:
+                source = StreamSource(view, chunksize)
+            else:
+                memory = (c_char * length).from_buffer(view)
+        else:
+            if not text:
+                length = _stream_length(value)
+            source = StreamSource(value, chunksize, text)
+        if source is not None:
+            memory = (c_char * len(source.chunk)).from_buffer(source.chunk)
+        env = self.env.env
+        buf = env.NewDirectByteBuffer(addressof(memory), len(memory))
+        try:
+            stream = self.cons(buf, 0 if source is None else source.number)
+        except LangException.Instance:
+            env.DeleteLocalRef(buf)
+            if source is not None:
+                source.close()
+            raise
+        stream.length = length
+        stream.text = text
+        stream.buffer = (buf, memory)
+        stream.source = source
+        return stream
@@ -1,6 +1,66 @@
 # -*- coding: utf8 -*-
+import binascii
+import decimal
 import six
 from py2jdbc.lang import Number
+from py2jdbc.wrap import JInstanceMethod
+
+MIN_LONG = -0x8000000000000000
+MAX_LONG = 0x7fffffffffffffff
+
+
+def from_twos_complement(data):
+    """
+    Convert a big-endian two's complement byte string, (as returned by
+    java.math.BigInteger.toByteArray), to a Python integer.
+
+    :param data: the bytes
+    :return: an int
+    """
+    if six.PY3:
+        return int.from_bytes(data, 'big', signed=True)
+    if not data:
+        return 0
+    value = int(binascii.hexlify(data), 16)
+    if ord(data[0]) & 0x80:
+        value -= 1 << (8 * len(data))
+    return value
+
+
+def to_decimal(unscaled, scale):
+    """
+    Create an exact Python Decimal from an unscaled integer and a Java scale.
+
+    :param unscaled: the unscaled integer value
+    :param scale: the number of digits to the right of the decimal point
+    :return: a decimal.Decimal equal to unscaled * 10 ** -scale
+    """
+    return decimal.Decimal('%dE%d' % (unscaled, -scale))
+
+
+class BigInteger(Number):
+    """
+    Wrapper for java.math.BigInteger java class
+    """
+    class_name = 'java.math.BigInteger'
+
+    class Instance(Number.Instance):
+        __slots__ = ()
+        toByteArray = JInstanceMethod('toByteArray')
+
+        def to_python(self):
+            return from_twos_complement(self.toByteArray())
+
+    def __init__(self, env):
+        super(BigInteger, self).__init__(env)
+        if self.class_name == BigInteger.class_name:
+            self.cons_s = self.constructor('Ljava/lang/String;')
+        self.toByteArray = self.method('toByteArray', '()[B')
+
+    def new(self, *args):
+        if len(args) == 1:
+            return self.cons_s(str(args[0]))
+        return super(BigInteger, self).new(*args)
 
 
 class BigDecimal(Number):
@@ -10,9 +70,9 @@ class BigDecimal(Number):
     class_name = 'java.math.BigDecimal'
 
     class Instance(Number.Instance):
-        def __init__(self, cls, obj):
-            super(BigDecimal.Instance, self).__init__(cls, obj)
-            self._abs = lambda o=obj: cls.abs(o)
+        __slots__ = ()
+        _abs = JInstanceMethod('abs')
+        scale = JInstanceMethod('scale')
 
         def abs(self):
             return self.cls(self._abs())
@@ -23,23 +83,41 @@ class BigDecimal(Number):
         def __float__(self):
             return self.doubleValue()
 
+        def to_python(self):
+            """
+            Convert to an exact Python Decimal, from the unscaled value's bytes
+            and the scale, without formatting the number as a string in Java.
+
+            :return: a decimal.Decimal
+            """
+            unscaled = self.cls.unscaledValue(self.obj)
+            try:
+                data = self.cls.toByteArray(unscaled)
+            finally:
+                self.env.env.DeleteLocalRef(unscaled)
+            return to_decimal(from_twos_complement(data), self.scale())
+
     def __init__(self, env):
         super(BigDecimal, self).__init__(env)
         if self.class_name == BigDecimal.class_name:
             self.cons_s = self.constructor('Ljava/lang/String;')
             self.cons_j = self.constructor('J')
         self._ONE = self.static_field('ONE', 'Ljava/math/BigDecimal;')
-        self._ROUND_CEILING = self.static_field('ROUND_CEILING', 'I')
-        self._ROUND_DOWN = self.static_field('ROUND_DOWN', 'I')
-        self._ROUND_FLOOR = self.static_field('ROUND_FLOOR', 'I')
-        self._ROUND_HALF_DOWN = self.static_field('ROUND_HALF_DOWN', 'I')
-        self._ROUND_HALF_EVEN = self.static_field('ROUND_HALF_EVEN', 'I')
-        self._ROUND_HALF_UP = self.static_field('ROUND_HALF_UP', 'I')
-        self._ROUND_UNNECESSARY = self.static_field('ROUND_UNNECESSARY', 'I')
-        self._ROUND_UP = self.static_field('ROUND_UP', 'I')
+        self._ROUND_CEILING = self.constant('ROUND_CEILING', 'I')
+        self._ROUND_DOWN = self.constant('ROUND_DOWN', 'I')
+        self._ROUND_FLOOR = self.constant('ROUND_FLOOR', 'I')
+        self._ROUND_HALF_DOWN = self.constant('ROUND_HALF_DOWN', 'I')
+        self._ROUND_HALF_EVEN = self.constant('ROUND_HALF_EVEN', 'I')
+        self._ROUND_HALF_UP = self.constant('ROUND_HALF_UP', 'I')
+        self._ROUND_UNNECESSARY = self.constant('ROUND_UNNECESSARY', 'I')
+        self._ROUND_UP = self.constant('ROUND_UP', 'I')
         self._TEN = self.static_field('TEN', 'Ljava/math/BigDecimal;')
         self._ZERO = self.static_field('ZERO', 'Ljava/math/BigDecimal;')
         self.abs = self.method('abs', '()Ljava/math/BigDecimal;')
+        self.scale = self.method('scale', '()I')
+        self.toByteArray = self.env.get('java.math.BigInteger').toByteArray
+        self.unscaledValue = self.method('unscaledValue', '()Ljava/math/BigInteger;')
+        self.valueOf = self.static_method('valueOf', '(JI)Ljava/math/BigDecimal;')
 
     @property
     def ONE(self):
@@ -92,3 +170,25 @@ class BigDecimal(Number):
             else:
                 return self.cons_j(args[0])
         return super(BigDecimal, self).new(*args)
+
+    def from_python(self, value):
+        """
+        Convert a Python Decimal to a BigDecimal, exactly.
+
+        :param value: a decimal.Decimal, or anything BigDecimal.new accepts
+        :return: a BigDecimal instance
+        :raises: ValueError for infinite and NaN values
+        """
+        if not isinstance(value, decimal.Decimal):
+            return self.new(value)
+        if not value.is_finite():
+            raise ValueError("can't convert %r to BigDecimal" % value)
+        sign, digits, exponent = value.as_tuple()
+        unscaled = 0
+        for digit in digits:
+            unscaled = unscaled * 10 + digit
+        if sign:
+            unscaled = -unscaled
+        if MIN_LONG <= unscaled <= MAX_LONG:
+            return self(self.valueOf(unscaled, -exponent))
+        return self.new(str(value))
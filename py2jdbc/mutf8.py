@@ -1,126 +1,41 @@
 # -*- coding: utf8 -*-
+"""
+Java Modified UTF-8 codec.
+
+Text without supplementary characters or surrogates, (almost everything
+passed through JNI), is encoded and decoded by Python's built-in UTF-8 codec,
+only changing how the zero character is written.  The rest goes through a
+slower path, which handles the 6-byte sequences character by character.
+"""
 import logging
 import codecs
+import re
+import sys
 import six
 
 log = logging.getLogger(__name__)
 NAME = 'mutf8'      # not cesu-8, which uses a different zero-byte
 
-
-def mutf8_unichr(value):
-    return chr(value) if six.PY3 else six.u('\\U%08x' % value)
-
-
-def _bytes(*vals):
-    """
-    This is a private utility function which takes a list of byte values
-    and creates a binary string appropriate for the current Python version.
-    It will return a `str` type in Python 2, but a `bytes` value in Python 3.
-
-    Values should be in byte range, (0x00-0xff)::
-
-        _bytes(1, 2, 3) == six.b('\\x01\\x02\\x03')
-
-    :param vals: arguments are a list of unsigned bytes.
-    :return: a `str` in Python 2, or `bytes` in Python 3
-    """
-    return six.b('').join(six.int2byte(v) for v in vals)
+# characters which need the slow path to encode
+if sys.maxunicode > 0xffff:
+    _SLOW_TEXT = re.compile(u'[\ud800-\udfff%s-%s]' % (six.unichr(0x10000), six.unichr(sys.maxunicode)))
+else:
+    _SLOW_TEXT = re.compile(u'[\ud800-\udfff]')
 
 
-def encoder(text):
+def _isascii(value):
     """
-    This generator processes a string and generates a sequence of bytes
-    in the Modified UTF-8 encoding.
+    Check whether a string only has ASCII characters, (always False before Python 3.7).
 
-    Automatically handle UTF-16 "surrogate pairs" if being used from "narrow Python",
-    where unicode characters are indexed as 2 surrogates.
-
-    :param text: a string, usually unicode
-    :return: a string of bytes in Modified UTF-8 encoding.
+    :param value: a unicode or byte string
+    :return: True if all the characters are ASCII
     """
-    it = iter(enumerate(ord(c) for c in text))
-    for i, x in it:
-        if 0xd800 <= x <= 0xdbff:       # high surrogate
-            j, x2 = next(it)
-            if not 0xd800 <= x2 <= 0xdfff:  # low surrogate
-                raise UnicodeEncodeError(
-                    NAME,
-                    text,
-                    i,
-                    j + 1,
-                    'bad surrogate pair (high)'
-                )
-            x = 0x10000 | ((x & 0x3ff) << 10) | (x2 & 0x3ff)
-        if x == 0:
-            yield _bytes(0xc0, 0x80)
-        elif x <= 0x7f:
-            yield _bytes(x)
-        elif x <= 0x07ff:
-            yield _bytes(
-                0xc0 | (x >> 6),
-                0x80 | (x & 0x3f)
-            )
-        elif x <= 0xffff:
-            yield _bytes(
-                0xe0 | (x >> 12),
-                0x80 | ((x >> 6) & 0x3f),
-                0x80 | (x & 0x3f)
-            )
-        elif x <= 0xfffff:
-            yield _bytes(
-                0xed,
-                0xa0 | (x >> 16),
-                0x80 | ((x >> 10) & 0x3f),
-                0xed,
-                0xb0 | ((x >> 6) & 0x0f),
-                0x80 | (x & 0x3f)
-            )
-        else:
-            raise UnicodeEncodeError(
-                NAME,
-                text,
-                i,
-                i + 1,
-                'ordinal not in range(%d)' % 0xfffff
-            )
+    isascii = getattr(value, 'isascii', None)
+    return isascii is not None and isascii()
 
 
-def encode(text, errors='strict'):
-    """
-    Encodes the input unicode text and returns a tuple, (output
-    bytes, length consumed).
-
-    :param text: unicode text to be encoded
-    :param errors: how to handle encoding errors: strict, ignore, replace, etc.
-    :return: a string of bytes in Modified UTF-8
-    """
-    value, length = six.b(''), 0
-    it = iter(encoder(text))
-    while True:
-        try:
-            b = next(it)
-            value += b
-            length += 1
-        except StopIteration:
-            break
-        except UnicodeEncodeError as e:
-            if errors == 'strict':
-                raise e
-            elif errors == 'ignore':
-                pass
-            elif errors == 'replace':
-                value += six.b('?')
-                length += 1
-            elif errors == 'xmlcharrefreplace':
-                v = six.b('&#{};'.format(ord(e.object[e.start])))
-                value += v
-                length += len(v)
-            elif errors == 'backslashreplace':
-                v = six.b('\\')
-                v += six.b('U{:08X}'.format(ord(e.object[e.start])))
-                value += v
-                length += len(v)
-    return value, length
+def mutf8_unichr(value):
+    return chr(value) if six.PY3 else six.u('\\U%08x' % value)
 
 
 class DecodeMap(object):
@@ -203,66 +118,155 @@ DECODE_MAP = dict(
 )
 
 
-def decoder(data):
+def _encode_plain(text):
     """
-    This generator processes a sequence of bytes in Modified UTF-8 encoding and produces
-    a sequence of unicode string characters.  It takes bits from the byte until it matches
-    one of the known encoding serquences.
+    Encode text without surrogates or supplementary characters, which
+    only differs from UTF-8 for the zero character.
+
+    :param text: unicode text
+    :return: the encoded bytes
+    """
+    data = text.encode('utf-8')
+    if b'\0' in data:
+        data = data.replace(b'\0', b'\xc0\x80')
+    return data
 
-    It uses `DecodeMap` to mask, compare and generate values.
 
-    :param data: a string of bytes in Modified UTF-8 encoding.
-    :return: a generator producing a string of unicode characters
-    :raises: `UnicodeDecodeError` if unrecognized byte in sequence is encountered.
+def _encode_special(x):
     """
-    def next_byte(_it, start, count):
-        try:
-            return next(_it)[1]
-        except StopIteration:
-            raise UnicodeDecodeError(
-                NAME, data, start, start + count,
-                "incomplete byte sequence"
-            )
+    Encode a surrogate or supplementary character, (after combining surrogate pairs).
 
-    it = iter(enumerate(six.iterbytes(data)))
-    for i, d in it:
-        if d == 0x00:               # 00000000
-            raise UnicodeDecodeError(
-                NAME, data, i, i + 1,
-                "embedded zero-byte not allowed"
-            )
-        elif d & 0x80:              # 1xxxxxxx
-            if d & 0x40:            # 11xxxxxx
-                if d & 0x20:        # 111xxxxx
-                    if d & 0x10:    # 1111xxxx
-                        raise UnicodeDecodeError(
-                            NAME, data, i, i + 1,
-                            "invalid encoding character"
-                        )
-                    elif d == 0xed:
-                        value = 0
-                        for i1, dm in enumerate(DECODE_MAP[6]):
-                            d1 = next_byte(it, i, i1 + 1)
-                            value = dm.apply(d1, value, data, i, i1 + 1)
-                    else:           # 1110xxxx
-                        value = d & 0x0f
-                        for i1, dm in enumerate(DECODE_MAP[3]):
-                            d1 = next_byte(it, i, i1 + 1)
-                            value = dm.apply(d1, value, data, i, i1 + 1)
-                else:               # 110xxxxx
-                    value = d & 0x1f
-                    for i1, dm in enumerate(DECODE_MAP[2]):
-                        d1 = next_byte(it, i, i1 + 1)
-                        value = dm.apply(d1, value, data, i, i1 + 1)
-            else:                   # 10xxxxxx
-                raise UnicodeDecodeError(
-                    NAME, data, i, i + 1,
-                    "misplaced continuation character"
-                )
-        else:                       # 0xxxxxxx
-            value = d
-        # noinspection PyCompatibility
-        yield mutf8_unichr(value)
+    :param x: the character ordinal, up to 0xfffff
+    :return: the encoded bytes
+    """
+    if x <= 0xffff:
+        return bytes(bytearray((
+            0xe0 | (x >> 12),
+            0x80 | ((x >> 6) & 0x3f),
+            0x80 | (x & 0x3f)
+        )))
+    return bytes(bytearray((
+        0xed,
+        0xa0 | (x >> 16),
+        0x80 | ((x >> 10) & 0x3f),
+        0xed,
+        0xb0 | ((x >> 6) & 0x0f),
+        0x80 | (x & 0x3f)
+    )))
+
+
+def encode(text, errors='strict'):
+    """
+    Encodes the input unicode text and returns a tuple, (output
+    bytes, length consumed).
+
+    Automatically handle UTF-16 "surrogate pairs" if being used from "narrow Python",
+    where unicode characters are indexed as 2 surrogates.
+
+    As before, encoding stops at the first character which can't be encoded,
+    unless `errors` is strict.
+
+    :param text: unicode text to be encoded
+    :param errors: how to handle encoding errors: strict, ignore, replace, etc.
+    :return: a string of bytes in Modified UTF-8
+    """
+    if _isascii(text) and u'\0' not in text:
+        return text.encode('ascii'), len(text)
+    if not _SLOW_TEXT.search(text):
+        return _encode_plain(text), len(text)
+    chunks = []
+    i, n = 0, len(text)
+    try:
+        while i < n:
+            match = _SLOW_TEXT.search(text, i)
+            if match is None:
+                chunks.append(_encode_plain(text[i:]))
+                break
+            if match.start() > i:
+                chunks.append(_encode_plain(text[i:match.start()]))
+            i = match.start()
+            x, j = ord(text[i]), i + 1
+            if 0xd800 <= x <= 0xdbff:       # high surrogate
+                if j >= n or not 0xd800 <= ord(text[j]) <= 0xdfff:  # low surrogate
+                    raise UnicodeEncodeError(NAME, text, i, j + 1, 'bad surrogate pair (high)')
+                x = 0x10000 | ((x & 0x3ff) << 10) | (ord(text[j]) & 0x3ff)
+                j += 1
+            if x > 0xfffff:
+                raise UnicodeEncodeError(NAME, text, i, j, 'ordinal not in range(%d)' % 0xfffff)
+            chunks.append(_encode_special(x))
+            i = j
+    except UnicodeEncodeError as e:
+        if errors == 'strict':
+            raise e
+        elif errors == 'replace':
+            chunks.append(b'?')
+        elif errors == 'xmlcharrefreplace':
+            chunks.append(six.b('&#{};'.format(ord(e.object[e.start]))))
+        elif errors == 'backslashreplace':
+            chunks.append(six.b('\\U{:08X}'.format(ord(e.object[e.start]))))
+    return b''.join(chunks), n
+
+
+def _decode(data, errors='strict', final=True):
+    """
+    Decode Modified UTF-8 bytes, stopping before an incomplete sequence at
+    the end of the data unless `final` is set.
+
+    :param data: a string of bytes in Modified UTF-8
+    :param errors: handle decoding errors
+    :param final: whether there is no more data to come
+    :return: unicode text and the number of bytes consumed
+    :raises: `UnicodeDecodeError` if sequence is invalid.
+    """
+    data = bytes(data)
+    if b'\0' not in data:
+        if _isascii(data):
+            return data.decode('ascii'), len(data)
+        try:
+            text = data.replace(b'\xc0\x80', b'\0').decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+        else:
+            if not _SLOW_TEXT.search(text):
+                return text, len(data)
+    chars = []
+    buf = bytearray(data)
+    i, n = 0, len(buf)
+    try:
+        while i < n:
+            d = buf[i]
+            if d & 0x80 == 0:                   # 0xxxxxxx
+                if d == 0x00:
+                    raise UnicodeDecodeError(NAME, data, i, i + 1, "embedded zero-byte not allowed")
+                chars.append(six.unichr(d))
+                i += 1
+                continue
+            if d & 0x40 == 0:                   # 10xxxxxx
+                raise UnicodeDecodeError(NAME, data, i, i + 1, "misplaced continuation character")
+            if d & 0x20 == 0:                   # 110xxxxx
+                value, maps = d & 0x1f, DECODE_MAP[2]
+            elif d & 0x10:                      # 1111xxxx
+                raise UnicodeDecodeError(NAME, data, i, i + 1, "invalid encoding character")
+            elif d == 0xed and not (i + 1 < n and buf[i + 1] & 0xe0 == 0x80):
+                value, maps = 0, DECODE_MAP[6]
+            else:                               # 1110xxxx
+                value, maps = d & 0x0f, DECODE_MAP[3]
+            count = len(maps) + 1
+            if i + count > n:
+                if not final:
+                    break
+                raise UnicodeDecodeError(NAME, data, i, n, "incomplete byte sequence")
+            for k, dm in enumerate(maps):
+                value = dm.apply(buf[i + k + 1], value, data, i, k + 2)
+            chars.append(mutf8_unichr(value))
+            i += count
+    except UnicodeDecodeError as e:
+        if errors == 'strict':
+            raise e
+        elif errors == 'replace':
+            chars.append(six.u('\uFFFD'))
+        i = n
+    return six.u('').join(chars), i
 
 
 def decode(data, errors='strict'):
@@ -270,28 +274,59 @@ def decode(data, errors='strict'):
     Decodes a sequence of bytes to a unicode text and length using Modified UTF-8.
     This function is designed to be used with Python `codecs` module.
 
+    As before, decoding stops at the first invalid sequence, unless `errors` is strict.
+
     :param data: a string of bytes in Modified UTF-8
     :param errors: handle decoding errors
     :return: unicode text and length
     :raises: `UnicodeDecodeError` if sequence is invalid.
     """
-    value, length = six.u(''), 0
-    it = iter(decoder(data))
-    while True:
-        try:
-            value += next(it)
-            length += 1
-        except StopIteration:
-            break
-        except UnicodeDecodeError as e:
-            if errors == 'strict':
-                raise e
-            elif errors == 'ignore':
-                pass
-            elif errors == 'replace':
-                value += six.u('\uFFFD')
-                length += 1
-    return value, length
+    return _decode(data, errors, True)
+
+
+class IncrementalEncoder(codecs.IncrementalEncoder):
+    """
+    Encodes text in chunks, keeping a high surrogate at the end of a chunk
+    until the low surrogate arrives.
+    """
+    def __init__(self, errors='strict'):
+        codecs.IncrementalEncoder.__init__(self, errors)
+        self.pending = six.u('')
+
+    def encode(self, text, final=False):
+        text = self.pending + text
+        self.pending = six.u('')
+        if not final and text and 0xd800 <= ord(text[-1]) <= 0xdbff:
+            text, self.pending = text[:-1], text[-1]
+        return encode(text, self.errors)[0]
+
+    def reset(self):
+        self.pending = six.u('')
+
+    def getstate(self):
+        return ord(self.pending) if self.pending else 0
+
+    def setstate(self, state):
+        self.pending = six.unichr(state) if state else six.u('')
+
+
+class IncrementalDecoder(codecs.BufferedIncrementalDecoder):
+    """
+    Decodes bytes in chunks, keeping an incomplete sequence at the end of
+    a chunk until the rest of it arrives.
+    """
+    def _buffer_decode(self, data, errors, final):
+        return _decode(data, errors, final)
+
+
+class StreamWriter(codecs.StreamWriter):
+    def encode(self, text, errors='strict'):
+        return encode(text, errors)
+
+
+class StreamReader(codecs.StreamReader):
+    def decode(self, data, errors='strict'):
+        return _decode(data, errors, False)
 
 
 def info(name):
@@ -305,7 +340,15 @@ def info(name):
     :return: this module's codec, if the name is mutf8 or mutf-8.
     """
     if name in ('mutf8', 'mutf-8'):
-        return codecs.CodecInfo(encode, decode, name=NAME)
+        return codecs.CodecInfo(
+            encode,
+            decode,
+            name=NAME,
+            incrementalencoder=IncrementalEncoder,
+            incrementaldecoder=IncrementalDecoder,
+            streamreader=StreamReader,
+            streamwriter=StreamWriter
+        )
 
 
 def mutf8_encode(text, **kwargs):
@@ -1,6 +1,7 @@
 # -*- coding: utf8 -*-
 import logging
 from py2jdbc.lang import Object
+from py2jdbc.wrap import JInstanceMethod
 
 
 log = logging.getLogger(__name__)
@@ -11,18 +12,18 @@ class ReflectModifier(Object):
 
     def __init__(self, env):
         super(ReflectModifier, self).__init__(env)
-        self._ABSTRACT = self.static_field('ABSTRACT', 'I')
-        self._FINAL = self.static_field('FINAL', 'I')
-        self._INTERFACE = self.static_field('INTERFACE', 'I')
-        self._NATIVE = self.static_field('NATIVE', 'I')
-        self._PRIVATE = self.static_field('PRIVATE', 'I')
-        self._PROTECTED = self.static_field('PROTECTED', 'I')
-        self._PUBLIC = self.static_field('PUBLIC', 'I')
-        self._STATIC = self.static_field('STATIC', 'I')
-        self._STRICT = self.static_field('STRICT', 'I')
-        self._SYNCHRONIZED = self.static_field('SYNCHRONIZED', 'I')
-        self._TRANSIENT = self.static_field('TRANSIENT', 'I')
-        self._VOLATILE = self.static_field('VOLATILE', 'I')
+        self._ABSTRACT = self.constant('ABSTRACT', 'I')
+        self._FINAL = self.constant('FINAL', 'I')
+        self._INTERFACE = self.constant('INTERFACE', 'I')
+        self._NATIVE = self.constant('NATIVE', 'I')
+        self._PRIVATE = self.constant('PRIVATE', 'I')
+        self._PROTECTED = self.constant('PROTECTED', 'I')
+        self._PUBLIC = self.constant('PUBLIC', 'I')
+        self._STATIC = self.constant('STATIC', 'I')
+        self._STRICT = self.constant('STRICT', 'I')
+        self._SYNCHRONIZED = self.constant('SYNCHRONIZED', 'I')
+        self._TRANSIENT = self.constant('TRANSIENT', 'I')
+        self._VOLATILE = self.constant('VOLATILE', 'I')
 
         self.classModifiers = self.static_method('classModifiers', '()I')
         self.constructorModifiers = self.static_method('constructorModifiers', '()I')
@@ -95,10 +96,9 @@ class ReflectField(Object):
     class_name = 'java.lang.reflect.Field'
 
     class Instance(Object.Instance):
-        def __init__(self, cls, obj):
-            super(ReflectField.Instance, self).__init__(cls, obj)
-            self.getModifiers = lambda o=obj: cls.getModifiers(o)
-            self.getName = lambda o=obj: cls.getName(o)
+        __slots__ = ()
+        getModifiers = JInstanceMethod('getModifiers')
+        getName = JInstanceMethod('getName')
 
         def getType(self):
             cls = self.env.get('java.lang.Class')
@@ -115,10 +115,9 @@ class ReflectMethod(Object):
     class_name = 'java.lang.reflect.Method'
 
     class Instance(Object.Instance):
-        def __init__(self, cls, obj):
-            super(ReflectMethod.Instance, self).__init__(cls, obj)
-            self.getModifiers = lambda o=obj: cls.getModifiers(o)
-            self.getName = lambda o=obj: cls.getName(o)
+        __slots__ = ()
+        getModifiers = JInstanceMethod('getModifiers')
+        getName = JInstanceMethod('getName')
 
         def getReturnType(self):
             cls = self.env.get('java.lang.Class')
@@ -1,7 +1,25 @@
 # -*- coding: utf8 -*-
+import array
+from ctypes import POINTER, c_char, c_char_p, cast, create_string_buffer, sizeof
+import struct
+import sys
 import six
 import py2jdbc.jni
 
+# byte order prefixes of native buffer formats
+_NATIVE = '@=' + ('<' if sys.byteorder == 'little' else '>')
+
+
+def _formats(ctype, formats):
+    """
+    Filter buffer formats with the same size as a Java primitive type.
+
+    :param ctype: the jni type
+    :param formats: candidate struct format characters
+    :return: the format characters with the same size
+    """
+    return ''.join(f for f in formats if struct.calcsize(f) == sizeof(ctype))
+
 
 class JSigType(type):
     """
@@ -24,12 +42,16 @@ class JSig(six.with_metaclass(JSigType)):
 
     Base classes map actual JNIEnv functions to call when the type is
     referenced.
+
+    Signature types don't change once they're created, (whether a value needs
+    releasing depends only on the value `py2j` returned), so one instance is
+    shared by every method and field of the environment with the same type,
+    (see `type_signature`).
     """
     code = None
 
     def __init__(self, env):
         self.env = env
-        self._release = False
 
     @property
     def name(self):
@@ -44,7 +66,7 @@ class JSig(six.with_metaclass(JSigType)):
 
     def release(self, value):
         """
-        Release memory from a bound value.
+        Release memory from a value returned by `py2j`.
 
         :param value: the bound value
         """
@@ -162,7 +184,9 @@ class JSigScalar(JSig):
         :param fid: the fieldID of the field
         :param value: the Python value to assign to the field
         """
-        self._fn_set(obj, fid, self.py2j(value))
+        value = self.py2j(value)
+        self._fn_set(obj, fid, value)
+        self.release(value)
 
     def get_static(self, cls, fid):
         """
@@ -183,7 +207,9 @@ class JSigScalar(JSig):
         :param fid: the fieldID of the field
         :param value: the Python value to assign to the field
         """
-        self._fn_set_static(cls, fid, self.py2j(value))
+        value = self.py2j(value)
+        self._fn_set_static(cls, fid, value)
+        self.release(value)
 
     def call(self, obj, mid, argtypes, *args):
         """
@@ -199,9 +225,7 @@ class JSigScalar(JSig):
         value = self._fn_call(obj, mid, _args)
         for _a, _at in zip(_args, argtypes):
             _at.release(_a.l)
-        result = self.j2py(value)
-        self.release(value)
-        return result
+        return self.j2py(value)
 
     def call_static(self, cls, mid, argtypes, *args):
         """
@@ -217,9 +241,7 @@ class JSigScalar(JSig):
         value = self._fn_call_static(cls, mid, _args)
         for _a, _at in zip(_args, argtypes):
             _at.release(_a.l)
-        result = self.j2py(value)
-        self.release(value)
-        return result
+        return self.j2py(value)
 
 
 class JSigBoolean(JSigScalar):
@@ -397,9 +419,9 @@ class JSigObject(JSigScalar):
         if self.env.IsSameObject(value, None):
             return None
         if self.classname == 'java/lang/String':
-            chars = self.env.GetStringUTFChars(value)
+            result = py2jdbc.jni.get_string(self.env, value)
             self.env.DeleteLocalRef(value)
-            return py2jdbc.jni.decode(chars)
+            return result
         return super(JSigObject, self).j2py(value)
 
     def py2j(self, value):
@@ -414,8 +436,7 @@ class JSigObject(JSigScalar):
         """
         if self.classname == 'java/lang/String':
             if value is not None:
-                value = self.env.NewStringUTF(value)
-                self._release = True
+                value = py2jdbc.jni.new_string(self.env, value)
             return value
         return super(JSigObject, self).py2j(value)
 
@@ -437,12 +458,14 @@ class JSigObject(JSigScalar):
 
     def release(self, value):
         """
-        Delete the local reference for java strings.
-        :param value: the original java object
+        Delete the local reference of a java string created by `py2j`.
+
+        Other objects belong to the caller.
+
+        :param value: the value returned by `py2j`
         """
-        if self._release:
+        if value and self.classname == 'java/lang/String':
             self.env.DeleteLocalRef(value)
-            self._release = False
 
 
 class JSigArray(JSig):
@@ -452,12 +475,18 @@ class JSigArray(JSig):
     Instances can map a jarray to a Python list of ints,
     or convert back from a Python sequence of ints back into a jbyteArray,
     for example.
+
+    Elements are copied in bulk with the Get/Set<Type>ArrayRegion functions,
+    straight to and from `array.array` objects, or any object supporting the
+    buffer protocol with a matching element format, (`formats`).
     """
+    typecode = None
+    formats = ''
+
     def __init__(self, env):
         super(JSigArray, self).__init__(env)
-        self._fn_get_elements = getattr(env, 'Get{}Elements'.format(self.name))
-        self._fn_release_elements = getattr(env, 'Release{}Elements'.format(self.name))
         self._fn_new = getattr(env, 'New{}'.format(self.name))
+        self._fn_get_region = getattr(env, 'Get{}Region'.format(self.name))
         self._fn_set_region = getattr(env, 'Set{}Region'.format(self.name))
         self._fn_call = env.CallObjectMethodA
         self._fn_call_static = env.CallStaticObjectMethodA
@@ -489,20 +518,101 @@ class JSigArray(JSig):
         """
         return value
 
-    def j2py(self, value):
+    def buffer(self, value, writable=False):
+        """
+        Find a pointer to the elements of a Python object, without copying them.
+
+        Byte strings, `array.array` objects with the same typecode, and objects
+        supporting the buffer protocol with a matching format are used in place,
+        (read-only buffers are copied if `writable` isn't set).
+
+        :param value: a Python object
+        :param writable: whether the elements will be written to
+        :return: a pointer to the elements and their count, or None if the object
+            isn't a compatible buffer
+        """
+        ptype = POINTER(self.jtype)
+        size = sizeof(self.jtype)
+        if isinstance(value, array.array):
+            if self.formats is not None and value.typecode != self.typecode:
+                return None
+            return cast(value.buffer_info()[0], ptype), len(value) * value.itemsize // size
+        if isinstance(value, six.binary_type) and not writable and size == 1:
+            return cast(c_char_p(value), ptype), len(value)
+        try:
+            view = memoryview(value)
+        except TypeError:
+            return None
+        if not getattr(view, 'c_contiguous', False):
+            return None
+        if self.formats is not None and view.format.lstrip(_NATIVE) not in self.formats:
+            return None
+        count = view.nbytes // size
+        if view.nbytes == 0:
+            return ptype(), 0
+        if view.format != 'B':
+            view = view.cast('B')
+        if view.readonly:
+            if writable:
+                return None
+            data = (c_char * view.nbytes).from_buffer_copy(view)
+        else:
+            data = (c_char * view.nbytes).from_buffer(view)
+        return cast(data, ptype), count
+
+    def from_sequence(self, value):
+        """
+        Convert a Python sequence of values to an `array.array` of Java primitive
+        values, applying `elem_py2j` to each element.
+
+        :param value: a Python sequence, (list, tuple, generator, etc).
+        :return: an array.array
+        """
+        return array.array(self.typecode, [self.elem_py2j(v) for v in value])
+
+    def j2py_array(self, value):
         """
-        Convert a Java array to a Python list by applying `elem_j2py`
-        to each element.
+        Copy the elements of a Java array to a Python `array.array`.
 
         :param value: a Java array object
-        :return: a Python list of values
+        :return: an array.array of the elements
         """
-        _len = self.env.GetArrayLength(value)
-        _values = self._fn_get_elements(value, None)
-        result = [self.elem_j2py(_values[i]) for i in range(_len)]
-        self._fn_release_elements(value, _values, py2jdbc.jni.JNI_ABORT)
+        result = array.array(self.typecode, [0]) * self.env.GetArrayLength(value)
+        self.j2py_into(value, result)
         return result
 
+    def j2py_into(self, value, buf, start=0):
+        """
+        Copy the elements of a Java array into a writable Python buffer,
+        like a `bytearray`, `array.array` or `memoryview`, similar to
+        `io.RawIOBase.readinto`.
+
+        :param value: a Java array object
+        :param buf: a writable Python buffer
+        :param start: the index of the first element to copy
+        :return: the number of elements copied, which is less than the size of the
+            buffer if the array doesn't have enough elements.
+        """
+        pointer = self.buffer(buf, writable=True)
+        if pointer is None:
+            raise TypeError("expected a writable buffer of {} values".format(self.name[:-5].lower()))
+        data, size = pointer
+        count = max(0, min(size, self.env.GetArrayLength(value) - start))
+        if count:
+            self._fn_get_region(value, start, count, data)
+        return count
+
+    def j2py(self, value):
+        """
+        Convert a Java array to a Python list of values.
+
+        :param value: a Java array object
+        :return: a Python list of values, or None for null arrays
+        """
+        if self.env.IsSameObject(value, None):
+            return None
+        return self.j2py_array(value).tolist()
+
     def elem_py2j(self, value):
         """
         Convert a python element value to a Java primitive value.
@@ -515,15 +625,21 @@ class JSigArray(JSig):
 
     def py2j(self, value):
         """
-        Convert a Python sequence of values to a Java array type.
+        Convert a Python sequence of values, or a buffer, to a Java array type.
 
-        :param value: a Python sequence, (list, tuple, generator, etc).
+        :param value: a Python sequence, (list, tuple, generator, etc), or buffer
         :return: a Java array value
         """
-        _len = len(value)
+        if value is None:
+            return None
+        pointer = self.buffer(value)
+        if pointer is None:
+            value = self.from_sequence(value)
+            pointer = self.buffer(value)
+        data, _len = pointer
         result = self._fn_new(_len)
-        _values = self.jtype.__mul__(_len)(*(self.elem_py2j(v) for v in value))
-        self._fn_set_region(result, 0, _len, _values)
+        if _len:
+            self._fn_set_region(result, 0, _len, data)
         return result
 
     def call(self, obj, mid, argtypes, *args):
@@ -577,6 +693,8 @@ class JSigBooleanArray(JSigArray):
     A Signature type for boolean arrays.
     """
     code = '[Z'
+    typecode = 'B'
+    formats = _formats(py2jdbc.jni.jboolean, '?bB')
 
     def elem_j2py(self, value):
         """
@@ -587,6 +705,16 @@ class JSigBooleanArray(JSigArray):
         """
         return value == py2jdbc.jni.JNI_TRUE
 
+    def j2py(self, value):
+        """
+        Convert a Java boolean array to a Python list of booleans.
+
+        :param value: a Java booleanArray object
+        :return: a Python list of booleans, or None for null arrays
+        """
+        values = super(JSigBooleanArray, self).j2py(value)
+        return values if values is None else list(map(self.elem_j2py, values))
+
     def elem_py2j(self, value):
         """
         Convert each element of a Python list to a jboolean
@@ -600,8 +728,12 @@ class JSigBooleanArray(JSigArray):
 class JSigByteArray(JSigArray):
     """
     A Signature Type for byte arrays.
+
+    Any buffer is accepted, whatever its format, as raw bytes.
     """
     code = '[B'
+    typecode = 'b'
+    formats = None
 
     def j2py(self, value):
         """
@@ -609,28 +741,27 @@ class JSigByteArray(JSigArray):
         That would be `bytes` in Python 3 or `str` in Python 2.
 
         :param value: a Java byteArray object
-        :return: a Python single-byte string
+        :return: a Python single-byte string, or None for null arrays
         """
+        if self.env.IsSameObject(value, None):
+            return None
         _len = self.env.GetArrayLength(value)
-        _values = self._fn_get_elements(value, None)
-        result = b''.join(six.int2byte(_values[i] & 0xff) for i in range(_len))
-        self._fn_release_elements(value, _values, py2jdbc.jni.JNI_ABORT)
-        return result
+        result = create_string_buffer(_len)
+        if _len:
+            self._fn_get_region(value, 0, _len, cast(result, POINTER(py2jdbc.jni.jbyte)))
+        return result.raw
 
-    def py2j(self, value):
+    def from_sequence(self, value):
         """
-        Convert a Python binary string to a Java byteArray
+        Convert a Python sequence of ints to bytes, or a Python 3 string of
+        characters below 256.
 
-        :param value: a Python byte string
-        :return: a Java byteArray
+        :param value: a sequence of ints or string
+        :return: a bytearray
         """
-        if six.PY3 and isinstance(value, str):
-            value = map(ord, value)
-        _len = len(value)
-        result = self._fn_new(_len)
-        _values = self.jtype.__mul__(_len)(*value)
-        self._fn_set_region(result, 0, _len, _values)
-        return result
+        if isinstance(value, six.text_type):
+            return value.encode('latin-1')
+        return bytearray(v & 0xff for v in value)
 
 
 class JSigCharArray(JSigArray):
@@ -638,6 +769,8 @@ class JSigCharArray(JSigArray):
     A Signature Type for char arrays.
     """
     code = '[C'
+    typecode = 'H'
+    formats = _formats(py2jdbc.jni.jchar, 'hH')
 
     def elem_j2py(self, value):
         """
@@ -649,6 +782,16 @@ class JSigCharArray(JSigArray):
         # noinspection PyCompatibility
         return six.unichr(value)
 
+    def j2py(self, value):
+        """
+        Convert a Java char array to a Python list of unicode chars.
+
+        :param value: a Java charArray object
+        :return: a Python list of unicode chars, or None for null arrays
+        """
+        values = super(JSigCharArray, self).j2py(value)
+        return values if values is None else list(map(six.unichr, values))
+
     def elem_py2j(self, value):
         """
         Convert each element of a Python unicode sequence to a jchar
@@ -658,12 +801,28 @@ class JSigCharArray(JSigArray):
         """
         return ord(value)
 
+    def from_sequence(self, value):
+        """
+        Convert a Python unicode string, (as UTF-16), or sequence of chars to jchars.
+
+        :param value: a Python unicode string or sequence of chars
+        :return: an array.array of jchars
+        """
+        if isinstance(value, six.text_type):
+            result = array.array(self.typecode)
+            data = value.encode(py2jdbc.jni.UTF16, py2jdbc.jni.UTF16_ERRORS)
+            getattr(result, 'frombytes', getattr(result, 'fromstring', None))(data)
+            return result
+        return super(JSigCharArray, self).from_sequence(value)
+
 
 class JSigShortArray(JSigArray):
     """
     A Signature type for a short array
     """
     code = '[S'
+    typecode = 'h'
+    formats = _formats(py2jdbc.jni.jshort, 'hH')
 
     def elem_py2j(self, value):
         """
@@ -680,6 +839,8 @@ class JSigIntArray(JSigArray):
     A Signature type for an int array
     """
     code = '[I'
+    typecode = 'i'
+    formats = _formats(py2jdbc.jni.jint, 'iIlL')
 
     def elem_py2j(self, value):
         """
@@ -696,6 +857,8 @@ class JSigLongArray(JSigArray):
     A Signature type for a long array
     """
     code = '[J'
+    typecode = 'q' if six.PY3 else 'l'
+    formats = _formats(py2jdbc.jni.jlong, 'qQlL')
 
     def elem_py2j(self, value):
         """
@@ -712,6 +875,8 @@ class JSigFloatArray(JSigArray):
     A Signature type for a float array
     """
     code = '[F'
+    typecode = 'f'
+    formats = 'f'
 
     def elem_py2j(self, value):
         """
@@ -728,6 +893,8 @@ class JSigDoubleArray(JSigArray):
     A Signature type for a double array
     """
     code = '[D'
+    typecode = 'd'
+    formats = 'd'
 
     def elem_py2j(self, value):
         """
@@ -748,7 +915,7 @@ class JSigObjectArray(JSig):
     def __init__(self, env, class_name):
         super(JSigObjectArray, self).__init__(env)
         self.class_name = class_name
-        self.cls = self.env.FindClass(self.class_name)
+        self.cls = _element_class(env, class_name)
         self._fn_get_element = env.GetObjectArrayElement
         self._fn_new = env.NewObjectArray
         self._fn_set_element = env.SetObjectArrayElement
@@ -775,8 +942,9 @@ class JSigObjectArray(JSig):
         :return:
         """
         if self.class_name == 'java/lang/String':
-            value = self.env.GetStringUTFChars(value)
-            return py2jdbc.jni.decode(value)
+            result = py2jdbc.jni.get_string(self.env, value)
+            self.env.DeleteLocalRef(value)
+            return result
         return value
 
     def j2py(self, value):
@@ -799,14 +967,15 @@ class JSigObjectArray(JSig):
         :return: a Java jobject
         """
         if isinstance(value, six.string_types):
-            value = self.env.NewStringUTF(value.encode('utf8'))
-            self._release = True
+            value = py2jdbc.jni.new_string(self.env, value)
         return value
 
     def py2j(self, value):
         """
         Convert a Python sequence of values to a Java objectArray.
 
+        Strings created for the elements are released once they're stored.
+
         :param value: a Python sequence of values
         :return: a Java objectArray
         """
@@ -814,8 +983,17 @@ class JSigObjectArray(JSig):
             return None
         _len = len(value)
         result = self.env.NewObjectArray(_len, self.cls, None)
-        for i, v in enumerate(value):
-            self.env.SetObjectArrayElement(result, i, self.elem_py2j(v))
+        try:
+            for i, v in enumerate(value):
+                elem = self.elem_py2j(v)
+                try:
+                    self.env.SetObjectArrayElement(result, i, elem)
+                finally:
+                    if elem is not v:
+                        self.env.DeleteLocalRef(elem)
+        except BaseException:
+            self.env.DeleteLocalRef(result)
+            raise
         return result
 
     def call(self, obj, mid, argtypes, *args):
@@ -856,55 +1034,98 @@ class JSigObjectArray(JSig):
 
     def release(self, value):
         """
-        Release memory allocated while constructing objectArray values.
+        Delete the local reference of an objectArray value.
 
-        :param value: the original jobjectArray value
+        :param value: the jobjectArray value
         """
-        if self._release:
-            _len = self.env.GetArrayLength(value)
-            for i in range(_len):
-                v = self.env.GetObjectArrayElement(value, i)
-                self.env.DeleteLocalRef(v)
         self.env.DeleteLocalRef(value)
 
 
+# global references to the element classes of object arrays, by name
+_element_classes = {}
+
+
+def _element_class(env, class_name):
+    """
+    Find the element class of an object array, shared by every thread.
+
+    :param env: the current JNI environment
+    :param class_name: the element class name
+    :return: a global reference to the class
+    """
+    cls = _element_classes.get(class_name)
+    if cls is None:
+        local = env.FindClass(class_name)
+        cls = _element_classes[class_name] = env.NewGlobalRef(local)
+        env.DeleteLocalRef(local)
+    return cls
+
+
+def _signatures(env):
+    """
+    The signature types and parsed method signatures of an environment.
+
+    :param env: the current JNI environment
+    :return: a dictionary of signature types by type signature, and tuples of
+        argument and result types by method signature
+    """
+    try:
+        return env.signatures
+    except AttributeError:
+        env.signatures = {}
+        return env.signatures
+
+
+def _new_type(env, signature):
+    """
+    Create the signature type for a single type signature.
+
+    Arrays of arrays are treated as arrays of their element type.
+
+    :param env: the current JNI environment
+    :param signature: the type signature, like 'I' or '[Ljava/lang/String;'
+    :return: a signature type instance
+    """
+    code = signature.lstrip('[')
+    is_array = code != signature
+    if code[0] == 'L':
+        if is_array:
+            return JSigObjectArray(env, code[1:-1])
+        return JSigObject(env, code[1:-1])
+    if is_array:
+        return JSigType.registry['[' + code](env)
+    return JSigType.registry[code](env)
+
+
 def type_signature(env, signature):
     """
     Create a generator which parses a signature and returns
     a sequence of signature types.  This can be used with
     either a return type or a sequence of argument types.
 
+    Signature types are created once for each environment, and shared
+    by every signature with the same type.
+
     :param env: the current JNI environment
     :param signature: the Java signature
     :return: a generator which produces a sequence of matching signature types
     """
-    is_array = False
+    types = _signatures(env)
     i = 0
-    while i < len(signature):
-        if signature[i] == ')':
-            break
-        if signature[i] == 'V':
-            yield JSigVoid(env)
-        elif signature[i] == 'L':
-            j = signature.find(';', i)
-            if j < 0:
+    while i < len(signature) and signature[i] != ')':
+        start = i
+        while signature[i] == '[':
+            i += 1
+        if signature[i] == 'L':
+            i = signature.find(';', i)
+            if i < 0:
                 raise RuntimeError("couldn't find ';' in class id")
-            class_name = signature[i + 1:j]
-            i = j
-            if is_array:
-                yield JSigObjectArray(env, class_name)
-                is_array = False
-            else:
-                yield JSigObject(env, class_name)
-        elif signature[i] == '[':
-            is_array = True
-        else:
-            if is_array:
-                yield JSigType.registry['[' + signature[i]](env)
-                is_array = False
-            else:
-                yield JSigType.registry[signature[i]](env)
         i += 1
+        key = signature[start:i]
+        sigtype = types.get(key)
+        if sigtype is None:
+            sigtype = types[key] = _new_type(env, key)
+        yield sigtype
 
 
 def method_signature(env, signature):
@@ -916,14 +1137,20 @@ def method_signature(env, signature):
     into method arguments, call the appropriate method
     function, then convert the result type back to a Python type.
 
+    Each signature is only parsed once for each environment.
+
     :param env: the current JNI environment
     :param signature: the Java method signature
     :return: a tuple of argument types and a result type
     """
     assert signature[0] == '('
-    argtypes = tuple(type_signature(env, signature[1:]))
-    restype = next(type_signature(env, signature[signature.index(')') + 1:]))
-    return argtypes, restype
+    types = _signatures(env)
+    result = types.get(signature)
+    if result is None:
+        argtypes = tuple(type_signature(env, signature[1:]))
+        restype = next(type_signature(env, signature[signature.index(')') + 1:]))
+        result = types[signature] = argtypes, restype
+    return result
 
 
 def constructor_signature(env, class_name, signature):
@@ -939,7 +1166,7 @@ def constructor_signature(env, class_name, signature):
     :return: a tuple of argument types and a result type
     """
     argtypes = tuple(type_signature(env, signature))
-    restype = JSigObject(env, class_name)
+    restype = next(type_signature(env, 'L{};'.format(class_name.replace('.', '/'))))
     return argtypes, restype
 
 
@@ -958,3 +1185,158 @@ def method_args(argtypes, *args):
     for i in range(len(argtypes)):
         argtypes[i].jval(_args[i], args[i])
     return _args
+
+
+# the kinds of stub, and the JNI functions they call, ({} is the result type name)
+_STUB_FUNCTIONS = {
+    'call': 'Call{}MethodA',
+    'call_static': 'CallStatic{}MethodA',
+    'new': 'NewObjectA',
+}
+
+# the code to convert each kind of argument, ({0} is the argument index)
+_STUB_ARGS = {
+    'Z': '        buf[{0}].z = JNI_TRUE if a{0} else JNI_FALSE',
+    'B': '        buf[{0}].b = int(a{0})',
+    'C': '        buf[{0}].c = ord(a{0})',
+    'S': '        buf[{0}].s = int(a{0})',
+    'I': '        buf[{0}].i = int(a{0})',
+    'J': '        buf[{0}].j = int(a{0})',
+    'F': '        buf[{0}].f = float(a{0})',
+    'D': '        buf[{0}].d = float(a{0})',
+    'Object': '        buf[{0}].l = a{0}',
+    'String': '        j{0} = buf[{0}].l = None if a{0} is None else new_string(env, a{0})',
+    'Array': '        j{0} = buf[{0}].l = argtypes[{0}].py2j(a{0})',
+}
+
+# the code to release each kind of argument after the call, or when a later argument
+# fails to convert, (j{0} is None until the argument is converted)
+_STUB_RELEASES = {
+    'String': '            if j{0} is not None:\n                env.DeleteLocalRef(j{0})',
+    'Array': '            if j{0}:\n                argtypes[{0}].release(j{0})',
+}
+
+# the code to convert each kind of result
+_STUB_RESULTS = {
+    'V': '    return None',
+    'Z': '    return value == JNI_TRUE',
+    'C': '    return unichr(value)',
+    'Object': '    return value or None',
+    'String': (
+        '    if not value:\n'
+        '        return None\n'
+        '    result = get_string(env, value)\n'
+        '    env.DeleteLocalRef(value)\n'
+        '    return result'
+    ),
+    'Array': (
+        '    result = restype.j2py(value)\n'
+        '    restype.release(value)\n'
+        '    return result'
+    ),
+}
+
+# compiled stub factories, by kind and argument and result kinds
+_stub_factories = {}
+
+
+def _stub_kind(sigtype):
+    """
+    The kind of conversion a signature type needs in a call stub.
+
+    :param sigtype: a signature type instance
+    :return: a primitive type code, 'Object', 'String' or 'Array'
+    """
+    if isinstance(sigtype, JSigObject):
+        return 'String' if sigtype.classname == 'java/lang/String' else 'Object'
+    if isinstance(sigtype, (JSigScalar, JSigVoid)):
+        return sigtype.code
+    return 'Array'
+
+
+def _stub_factory(kind, arg_kinds, result_kind):
+    """
+    Compile the function which creates call stubs for a kind of call and signature.
+
+    :param kind: 'call', 'call_static' or 'new'
+    :param arg_kinds: a tuple of argument kinds, (see `_stub_kind`)
+    :param result_kind: the result kind, (ignored for 'new')
+    :return: a function taking (env, fn, argtypes, restype), which returns a stub
+    """
+    key = (kind, arg_kinds, result_kind)
+    factory = _stub_factories.get(key)
+    if factory is not None:
+        return factory
+    names = ''.join(', a{}'.format(i) for i in range(len(arg_kinds)))
+    releases = [
+        _STUB_RELEASES[arg_kind].format(i)
+        for i, arg_kind in enumerate(arg_kinds)
+        if arg_kind in _STUB_RELEASES
+    ]
+    lines = [
+        'def factory(env, fn, argtypes, restype):',
+        '  buf = (jvalue * {})()'.format(max(len(arg_kinds), 1)),
+        '  def stub(target, mid{}):'.format(names),
+    ]
+    args = [_STUB_ARGS[arg_kind].format(i) for i, arg_kind in enumerate(arg_kinds)]
+    if releases:
+        lines.extend(
+            '        j{} = None'.format(i)
+            for i, arg_kind in enumerate(arg_kinds)
+            if arg_kind in _STUB_RELEASES
+        )
+        lines.append('        try:')
+        lines.extend('    ' + line for line in args)
+        lines.extend(['            value = fn(target, mid, buf)', '        finally:'])
+        lines.extend(releases)
+    else:
+        lines.extend(args)
+        lines.append('        value = fn(target, mid, buf)')
+    if kind == 'new' or result_kind not in _STUB_RESULTS:
+        lines.append('        return value')
+    else:
+        lines.extend('    ' + line for line in _STUB_RESULTS[result_kind].split('\n'))
+    lines.append('  return stub')
+    namespace = {
+        'JNI_FALSE': py2jdbc.jni.JNI_FALSE,
+        'JNI_TRUE': py2jdbc.jni.JNI_TRUE,
+        'get_string': py2jdbc.jni.get_string,
+        'jvalue': py2jdbc.jni.jvalue,
+        'new_string': py2jdbc.jni.new_string,
+        'unichr': six.unichr,
+    }
+    source = '\n'.join(lines) + '\n'
+    six.exec_(compile(source, '<py2jdbc stub {} {}>'.format(kind, key), 'exec'), namespace)
+    factory = _stub_factories[key] = namespace['factory']
+    return factory
+
+
+def call_stub(env, kind, argtypes, restype):
+    """
+    Create a function which calls a method or constructor with Python arguments.
+
+    The function is specialised for the signature, (the code is compiled once for
+    each combination of argument and result types): it assigns each argument to its
+    `jvalue` field directly, reuses the same `jvalue` array for every call, only
+    releases string and array arguments, and only converts booleans, chars, strings
+    and arrays in the result.
+
+    The stub is called as `stub(obj, mid, *args)` for methods, and `stub(cls, mid, *args)`
+    for static methods and constructors.  Constructors return the new object reference.
+    Each stub must only be used by the thread of its environment.
+
+    :param env: the current JNI environment
+    :param kind: 'call', 'call_static' or 'new'
+    :param argtypes: the argument signature types, (see `method_signature`)
+    :param restype: the result signature type
+    :return: the stub function
+    """
+    result_kind = _stub_kind(restype)
+    if kind == 'new':
+        name = _STUB_FUNCTIONS[kind]
+    elif result_kind in ('Object', 'String', 'Array'):
+        name = _STUB_FUNCTIONS[kind].format('Object')
+    else:
+        name = _STUB_FUNCTIONS[kind].format(restype.name)
+    factory = _stub_factory(kind, tuple(_stub_kind(a) for a in argtypes), result_kind)
+    return factory(env, getattr(env, name), argtypes, restype)
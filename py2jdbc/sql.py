@@ -1,10 +1,13 @@
 # -*- coding: utf8 -*-
 import datetime
+import decimal
 import logging
+import mmap
 import six
 
 from py2jdbc.lang import LangException, Object, ArgumentError
-from py2jdbc.util import Date
+from py2jdbc.util import DAY, EPOCH, Date
+from py2jdbc.wrap import JInstanceMethod
 
 
 log = logging.getLogger(__name__)
@@ -17,11 +20,9 @@ class SQLException(LangException):
     class_name = 'java.sql.SQLException'
 
     class Instance(LangException.Instance):
-        def __init__(self, cls, obj):
-            super(SQLException.Instance, self).__init__(cls, obj)
-            self.getErrorCode = lambda o=obj: cls.getErrorCode(o)
-            self.getNextException = lambda o=obj: cls.getNextException()
-            self.getSQLState = lambda o=obj: cls.getSQLState(o)
+        getErrorCode = JInstanceMethod('getErrorCode')
+        getNextException = JInstanceMethod('getNextException')
+        getSQLState = JInstanceMethod('getSQLState')
 
     def __init__(self, env):
         super(SQLException, self).__init__(env)
@@ -30,6 +31,50 @@ class SQLException(LangException):
         self.getSQLState = self.method('getSQLState', '()Ljava/lang/String;')
 
 
+class Blob(Object):
+    """
+    Wrapper for java.sql.Blob java class
+    """
+    class_name = 'java.sql.Blob'
+
+    class Instance(Object.Instance):
+        """
+        Wrapper for java.sql.Blob object instance
+        """
+        __slots__ = ()
+        free = JInstanceMethod('free')
+        getBytes = JInstanceMethod('getBytes')
+        length = JInstanceMethod('length')
+
+    def __init__(self, env):
+        super(Blob, self).__init__(env)
+        self.free = self.method('free', '()V')
+        self.getBytes = self.method('getBytes', '(JI)[B')
+        self.length = self.method('length', '()J')
+
+
+class Clob(Object):
+    """
+    Wrapper for java.sql.Clob java class
+    """
+    class_name = 'java.sql.Clob'
+
+    class Instance(Object.Instance):
+        """
+        Wrapper for java.sql.Clob object instance
+        """
+        __slots__ = ()
+        free = JInstanceMethod('free')
+        getSubString = JInstanceMethod('getSubString')
+        length = JInstanceMethod('length')
+
+    def __init__(self, env):
+        super(Clob, self).__init__(env)
+        self.free = self.method('free', '()V')
+        self.getSubString = self.method('getSubString', '(JI)Ljava/lang/String;')
+        self.length = self.method('length', '()J')
+
+
 class Connection(Object):
     """
     Wrapper for java.sql.Connection java class
@@ -37,13 +82,12 @@ class Connection(Object):
     class_name = 'java.sql.Connection'
 
     class Instance(Object.Instance):
-        def __init__(self, cls, obj):
-            super(Connection.Instance, self).__init__(cls, obj)
-            self.close = lambda o=obj: cls.close(o)
-            self.commit = lambda o=obj: cls.commit(o)
-            self.getAutoCommit = lambda o=obj: cls.getAutoCommit(o)
-            self.rollback = lambda o=obj: cls.rollback(o)
-            self.setAutoCommit = lambda v, o=obj: cls.setAutoCommit(o, v)
+        __slots__ = ()
+        close = JInstanceMethod('close')
+        commit = JInstanceMethod('commit')
+        getAutoCommit = JInstanceMethod('getAutoCommit')
+        rollback = JInstanceMethod('rollback')
+        setAutoCommit = JInstanceMethod('setAutoCommit')
 
         def createStatement(self):
             cls = self.env.get('java.sql.Statement')
@@ -57,9 +101,16 @@ class Connection(Object):
             cls = self.env.get('java.sql.CallableStatement')
             return cls(self.cls.prepareCall(self.obj, sql))
 
-        def prepareStatement(self, sql):
+        def prepareStatement(self, sql, resultSetType=None, resultSetConcurrency=None):
             cls = self.env.get('java.sql.PreparedStatement')
-            return cls(self.cls.prepareStatement(self.obj, sql))
+            if resultSetType is None:
+                return cls(self.cls.prepareStatement(self.obj, sql))
+            return cls(self.cls.prepareStatement3(
+                self.obj,
+                sql,
+                resultSetType,
+                resultSetConcurrency
+            ))
 
     def __init__(self, env):
         super(Connection, self).__init__(env)
@@ -76,6 +127,10 @@ class Connection(Object):
             'prepareStatement',
             '(Ljava/lang/String;)Ljava/sql/PreparedStatement;'
         )
+        self.prepareStatement3 = self.method(
+            'prepareStatement',
+            '(Ljava/lang/String;II)Ljava/sql/PreparedStatement;'
+        )
         self.rollback = self.method('rollback', '()V')
         self.setAutoCommit = self.method('setAutoCommit', '(Z)V')
 
@@ -87,6 +142,8 @@ class DatabaseMetaData(Object):
     class_name = 'java.sql.DatabaseMetaData'
 
     class Instance(Object.Instance):
+        __slots__ = ()
+
         def __init__(self, cls, obj):
             super(DatabaseMetaData.Instance, self).__init__(cls, obj)
             if self.cls.ResultSet is None:
@@ -149,69 +206,69 @@ class DatabaseMetaData(Object):
     def __init__(self, env):
         super(DatabaseMetaData, self).__init__(env)
         self.ResultSet = None
-        self._attributeNoNulls = self.static_field('attributeNoNulls', 'S')
-        self._attributeNullable = self.static_field('attributeNullable', 'S')
-        self._attributeNullableUnknown = self.static_field('attributeNullableUnknown', 'S')
-        self._bestRowNotPseudo = self.static_field('bestRowNotPseudo', 'I')
-        self._bestRowPseudo = self.static_field('bestRowPseudo', 'I')
-        self._bestRowSession = self.static_field('bestRowSession', 'I')
-        self._bestRowTemporary = self.static_field('bestRowTemporary', 'I')
-        self._bestRowTransaction = self.static_field('bestRowTransaction', 'I')
-        self._bestRowUnknown = self.static_field('bestRowUnknown', 'I')
-        self._columnNoNulls = self.static_field('columnNoNulls', 'I')
-        self._columnNullable = self.static_field('columnNullable', 'I')
-        self._columnNullableUnknown = self.static_field('columnNullableUnknown', 'I')
-        self._functionColumnIn = self.static_field('functionColumnIn', 'I')
-        self._functionColumnInOut = self.static_field('functionColumnInOut', 'I')
-        self._functionColumnOut = self.static_field('functionColumnOut', 'I')
-        self._functionColumnResult = self.static_field('functionColumnResult', 'I')
-        self._functionColumnUnknown = self.static_field('functionColumnUnknown', 'I')
-        self._functionNoNulls = self.static_field('functionNoNulls', 'I')
-        self._functionNoTable = self.static_field('functionNoTable', 'I')
-        self._functionNullable = self.static_field('functionNullable', 'I')
-        self._functionNullableUnknown = self.static_field('functionNullableUnknown', 'I')
-        self._functionResultUnknown = self.static_field('functionResultUnknown', 'I')
-        self._functionReturn = self.static_field('functionReturn', 'I')
-        self._functionReturnsTable = self.static_field('functionReturnsTable', 'I')
-        self._importedKeyCascade = self.static_field('importedKeyCascade', 'I')
-        self._importedKeyInitiallyDeferred = self.static_field(
+        self._attributeNoNulls = self.constant('attributeNoNulls', 'S')
+        self._attributeNullable = self.constant('attributeNullable', 'S')
+        self._attributeNullableUnknown = self.constant('attributeNullableUnknown', 'S')
+        self._bestRowNotPseudo = self.constant('bestRowNotPseudo', 'I')
+        self._bestRowPseudo = self.constant('bestRowPseudo', 'I')
+        self._bestRowSession = self.constant('bestRowSession', 'I')
+        self._bestRowTemporary = self.constant('bestRowTemporary', 'I')
+        self._bestRowTransaction = self.constant('bestRowTransaction', 'I')
+        self._bestRowUnknown = self.constant('bestRowUnknown', 'I')
+        self._columnNoNulls = self.constant('columnNoNulls', 'I')
+        self._columnNullable = self.constant('columnNullable', 'I')
+        self._columnNullableUnknown = self.constant('columnNullableUnknown', 'I')
+        self._functionColumnIn = self.constant('functionColumnIn', 'I')
+        self._functionColumnInOut = self.constant('functionColumnInOut', 'I')
+        self._functionColumnOut = self.constant('functionColumnOut', 'I')
+        self._functionColumnResult = self.constant('functionColumnResult', 'I')
+        self._functionColumnUnknown = self.constant('functionColumnUnknown', 'I')
+        self._functionNoNulls = self.constant('functionNoNulls', 'I')
+        self._functionNoTable = self.constant('functionNoTable', 'I')
+        self._functionNullable = self.constant('functionNullable', 'I')
+        self._functionNullableUnknown = self.constant('functionNullableUnknown', 'I')
+        self._functionResultUnknown = self.constant('functionResultUnknown', 'I')
+        self._functionReturn = self.constant('functionReturn', 'I')
+        self._functionReturnsTable = self.constant('functionReturnsTable', 'I')
+        self._importedKeyCascade = self.constant('importedKeyCascade', 'I')
+        self._importedKeyInitiallyDeferred = self.constant(
             'importedKeyInitiallyDeferred', 'I')
-        self._importedKeyInitiallyImmediate = self.static_field(
+        self._importedKeyInitiallyImmediate = self.constant(
             'importedKeyInitiallyImmediate', 'I')
-        self._importedKeyNoAction = self.static_field('importedKeyNoAction', 'I')
-        self._importedKeyNotDeferrable = self.static_field('importedKeyNotDeferrable', 'I')
-        self._importedKeyRestrict = self.static_field('importedKeyRestrict', 'I')
-        self._importedKeySetDefault = self.static_field('importedKeySetDefault', 'I')
-        self._importedKeySetNull = self.static_field('importedKeySetNull', 'I')
-        self._procedureColumnIn = self.static_field('procedureColumnIn', 'I')
-        self._procedureColumnInOut = self.static_field('procedureColumnInOut', 'I')
-        self._procedureColumnOut = self.static_field('procedureColumnOut', 'I')
-        self._procedureColumnResult = self.static_field('procedureColumnResult', 'I')
-        self._procedureColumnReturn = self.static_field('procedureColumnReturn', 'I')
-        self._procedureColumnUnknown = self.static_field('procedureColumnUnknown', 'I')
-        self._procedureNoNulls = self.static_field('procedureNoNulls', 'I')
-        self._procedureNoResult = self.static_field('procedureNoResult', 'I')
-        self._procedureNullable = self.static_field('procedureNullable', 'I')
-        self._procedureNullableUnknown = self.static_field('procedureNullableUnknown', 'I')
-        self._procedureResultUnknown = self.static_field('procedureResultUnknown', 'I')
-        self._procedureReturnsResult = self.static_field('procedureReturnsResult', 'I')
-        self._sqlStateSQL = self.static_field('sqlStateSQL', 'I')
-        self._sqlStateSQL99 = self.static_field('sqlStateSQL99', 'I')
-        self._sqlStateXOpen = self.static_field('sqlStateXOpen', 'I')
-        self._tableIndexClustered = self.static_field('tableIndexClustered', 'S')
-        self._tableIndexHashed = self.static_field('tableIndexHashed', 'S')
-        self._tableIndexOther = self.static_field('tableIndexOther', 'S')
-        self._tableIndexStatistic = self.static_field('tableIndexStatistic', 'S')
-        self._typeNoNulls = self.static_field('typeNoNulls', 'I')
-        self._typeNullable = self.static_field('typeNullable', 'I')
-        self._typeNullableUnknown = self.static_field('typeNullableUnknown', 'I')
-        self._typePredBasic = self.static_field('typePredBasic', 'I')
-        self._typePredChar = self.static_field('typePredChar', 'I')
-        self._typePredNone = self.static_field('typePredNone', 'I')
-        self._typeSearchable = self.static_field('typeSearchable', 'I')
-        self._versionColumnNotPseudo = self.static_field('versionColumnNotPseudo', 'I')
-        self._versionColumnPseudo = self.static_field('versionColumnPseudo', 'I')
-        self._versionColumnUnknown = self.static_field('versionColumnUnknown', 'I')
+        self._importedKeyNoAction = self.constant('importedKeyNoAction', 'I')
+        self._importedKeyNotDeferrable = self.constant('importedKeyNotDeferrable', 'I')
+        self._importedKeyRestrict = self.constant('importedKeyRestrict', 'I')
+        self._importedKeySetDefault = self.constant('importedKeySetDefault', 'I')
+        self._importedKeySetNull = self.constant('importedKeySetNull', 'I')
+        self._procedureColumnIn = self.constant('procedureColumnIn', 'I')
+        self._procedureColumnInOut = self.constant('procedureColumnInOut', 'I')
+        self._procedureColumnOut = self.constant('procedureColumnOut', 'I')
+        self._procedureColumnResult = self.constant('procedureColumnResult', 'I')
+        self._procedureColumnReturn = self.constant('procedureColumnReturn', 'I')
+        self._procedureColumnUnknown = self.constant('procedureColumnUnknown', 'I')
+        self._procedureNoNulls = self.constant('procedureNoNulls', 'I')
+        self._procedureNoResult = self.constant('procedureNoResult', 'I')
+        self._procedureNullable = self.constant('procedureNullable', 'I')
+        self._procedureNullableUnknown = self.constant('procedureNullableUnknown', 'I')
+        self._procedureResultUnknown = self.constant('procedureResultUnknown', 'I')
+        self._procedureReturnsResult = self.constant('procedureReturnsResult', 'I')
+        self._sqlStateSQL = self.constant('sqlStateSQL', 'I')
+        self._sqlStateSQL99 = self.constant('sqlStateSQL99', 'I')
+        self._sqlStateXOpen = self.constant('sqlStateXOpen', 'I')
+        self._tableIndexClustered = self.constant('tableIndexClustered', 'S')
+        self._tableIndexHashed = self.constant('tableIndexHashed', 'S')
+        self._tableIndexOther = self.constant('tableIndexOther', 'S')
+        self._tableIndexStatistic = self.constant('tableIndexStatistic', 'S')
+        self._typeNoNulls = self.constant('typeNoNulls', 'I')
+        self._typeNullable = self.constant('typeNullable', 'I')
+        self._typeNullableUnknown = self.constant('typeNullableUnknown', 'I')
+        self._typePredBasic = self.constant('typePredBasic', 'I')
+        self._typePredChar = self.constant('typePredChar', 'I')
+        self._typePredNone = self.constant('typePredNone', 'I')
+        self._typeSearchable = self.constant('typeSearchable', 'I')
+        self._versionColumnNotPseudo = self.constant('versionColumnNotPseudo', 'I')
+        self._versionColumnPseudo = self.constant('versionColumnPseudo', 'I')
+        self._versionColumnUnknown = self.constant('versionColumnUnknown', 'I')
         self.getCatalogs = self.method('getCatalogs', '()Ljava/sql/ResultSet;')
         self.getFunctionColumns = self.method(
             'getFunctionColumns', '({0}{0}{0}{0}){1}'.format(
@@ -548,9 +605,8 @@ class Driver(Object):
         """
         Wrapper for java.sql.Driver object instance
         """
-        def __init__(self, cls, obj):
-            super(Driver.Instance, self).__init__(cls, obj)
-            self.acceptsURL = lambda url, o=obj: cls.acceptsURL(o, url)
+        __slots__ = ()
+        acceptsURL = JInstanceMethod('acceptsURL')
 
     def __init__(self, env):
         super(Driver, self).__init__(env)
@@ -567,27 +623,26 @@ class ParameterMetaData(Object):
         """
         Wrapper for java.sql.ParameterMetaData object instance
         """
-        def __init__(self, cls, obj):
-            super(ParameterMetaData.Instance, self).__init__(cls, obj)
-            self.getParameterClassName = lambda i, o=obj: cls.getParameterClassName(o, i)
-            self.getParameterCount = lambda o=obj: cls.getParameterCount(o)
-            self.getParameterMode = lambda i, o=obj: cls.getParameterMode(o, i)
-            self.getParameterType = lambda i, o=obj: cls.getParameterType(o, i)
-            self.getParameterTypeName = lambda i, o=obj: cls.getParameterTypeName(o, i)
-            self.getPrecision = lambda i, o=obj: cls.getPrecision(o, i)
-            self.getScale = lambda i, o=obj: cls.getScale(o, i)
-            self.isNullable = lambda i, o=obj: cls.isNullable(o, i)
-            self.isSigned = lambda i, o=obj: cls.isSigned(o, i)
+        __slots__ = ()
+        getParameterClassName = JInstanceMethod('getParameterClassName')
+        getParameterCount = JInstanceMethod('getParameterCount')
+        getParameterMode = JInstanceMethod('getParameterMode')
+        getParameterType = JInstanceMethod('getParameterType')
+        getParameterTypeName = JInstanceMethod('getParameterTypeName')
+        getPrecision = JInstanceMethod('getPrecision')
+        getScale = JInstanceMethod('getScale')
+        isNullable = JInstanceMethod('isNullable')
+        isSigned = JInstanceMethod('isSigned')
 
     def __init__(self, env):
         super(ParameterMetaData, self).__init__(env)
-        self._parameterModeIn = self.static_field('parameterModeIn', 'I')
-        self._parameterModeInOut = self.static_field('parameterModeInOut', 'I')
-        self._parameterModeOut = self.static_field('parameterModeOut', 'I')
-        self._parameterModeUnknown = self.static_field('parameterModeUnknown', 'I')
-        self._parameterNoNulls = self.static_field('parameterNoNulls', 'I')
-        self._parameterNullable = self.static_field('parameterNullable', 'I')
-        self._parameterNullableUnknown = self.static_field('parameterNullableUnknown', 'I')
+        self._parameterModeIn = self.constant('parameterModeIn', 'I')
+        self._parameterModeInOut = self.constant('parameterModeInOut', 'I')
+        self._parameterModeOut = self.constant('parameterModeOut', 'I')
+        self._parameterModeUnknown = self.constant('parameterModeUnknown', 'I')
+        self._parameterNoNulls = self.constant('parameterNoNulls', 'I')
+        self._parameterNullable = self.constant('parameterNullable', 'I')
+        self._parameterNullableUnknown = self.constant('parameterNullableUnknown', 'I')
         self.getParameterClassName = self.method(
             'getParameterClassName',
             '(I)Ljava/lang/String;'
@@ -643,23 +698,35 @@ class PreparedStatement(Object):
         """
         Wrapper for java.sql.PreparedStatement object instance
         """
+        __slots__ = ('streams', 'maxrows')
+        addBatch = JInstanceMethod('addBatch')
+        clearParameters = JInstanceMethod('clearParameters')
+        close = JInstanceMethod('close')
+        execute = JInstanceMethod('execute')
+        executeBatch = JInstanceMethod('executeBatch')
+        getFetchSize = JInstanceMethod('getFetchSize')
+        getUpdateCount = JInstanceMethod('getUpdateCount')
+        setBoolean = JInstanceMethod('setBoolean')
+        setByte = JInstanceMethod('setByte')
+        setDouble = JInstanceMethod('setDouble')
+        setFetchSize = JInstanceMethod('setFetchSize')
+        setFloat = JInstanceMethod('setFloat')
+        setInt = JInstanceMethod('setInt')
+        setLargeMaxRows = JInstanceMethod('setLargeMaxRows')
+        setLong = JInstanceMethod('setLong')
+        setMaxRows = JInstanceMethod('setMaxRows')
+        setNull = JInstanceMethod('setNull')
+        setShort = JInstanceMethod('setShort')
+        setString = JInstanceMethod('setString')
+
         def __init__(self, cls, obj):
             super(PreparedStatement.Instance, self).__init__(cls, obj)
-            self.addBatch = lambda o=obj: cls.addBatch(o)
-            self.clearParameters = lambda o=obj: cls.clearParameters(o)
-            self.close = lambda o=obj: cls.close(o)
-            self.execute = lambda o=obj: cls.execute(o)
-            self.executeBatch = lambda o=obj: cls.executeBatch(o)
-            self.getUpdateCount = lambda o=obj: cls.getUpdateCount(o)
-            self.setBoolean = lambda i, v, o=obj: cls.setBoolean(o, i, v)
-            self.setByte = lambda i, v, o=obj: cls.setByte(o, i, v)
-            self.setDouble = lambda i, v, o=obj: cls.setDouble(o, i, v)
-            self.setFloat = lambda i, v, o=obj: cls.setFloat(o, i, v)
-            self.setShort = lambda i, v, o=obj: cls.setShort(o, i, v)
-            self.setInt = lambda i, v, o=obj: cls.setInt(o, i, v)
-            self.setLong = lambda i, v, o=obj: cls.setLong(o, i, v)
-            self.setNull = lambda i, v, o=obj: cls.setNull(o, i, v)
-            self.setString = lambda i, v, o=obj: cls.setString(o, i, v)
+            self.streams = []
+            self.maxrows = 0
+            if cls.BigDecimal is None:
+                cls.BigDecimal = self.env.get('java.math.BigDecimal')
+            if cls.BufferInputStream is None:
+                cls.BufferInputStream = self.env.get('py2jdbc.BufferInputStream')
             if cls.Date is None:
                 cls.Date = self.env.get('java.sql.Date')
             if cls.ParameterMetaData is None:
@@ -688,10 +755,14 @@ class PreparedStatement(Object):
                 self.setLong(i, arg)
             elif isinstance(arg, float):
                 self.setDouble(i, arg)
+            elif isinstance(arg, decimal.Decimal):
+                self.setBigDecimal(i, arg)
             elif isinstance(arg, six.string_types):
                 self.setString(i, arg)
-            elif isinstance(arg, six.binary_type):
+            elif isinstance(arg, (six.binary_type, bytearray)):
                 self.setBytes(i, arg)
+            elif isinstance(arg, (memoryview, mmap.mmap)) or hasattr(arg, 'read'):
+                self.setStream(i, arg)
             elif hasattr(arg, '__getitem__') and isinstance(arg[0], int):
                 self.setBytes(i, arg)
             elif isinstance(arg, (datetime.datetime, self.cls.Timestamp.Instance)):
@@ -703,6 +774,11 @@ class PreparedStatement(Object):
             else:
                 raise RuntimeError("can't bind to python value %r(%r)", arg, type(arg))
 
+        def setBigDecimal(self, i, value):
+            if not isinstance(value, self.cls.BigDecimal.Instance):
+                value = self.cls.BigDecimal.from_python(value)
+            self.cls.setBigDecimal(self.obj, i, value.obj)
+
         def setBytes(self, i, value):
             self.cls.setBytes(self.obj, i, value)
 
@@ -711,6 +787,34 @@ class PreparedStatement(Object):
                 value = self.cls.Date.from_python(value)
             self.cls.setDate(self.obj, i, value.obj)
 
+        def setStream(self, i, value):
+            """
+            Bind a buffer or file object, which the driver reads as a stream
+            when the statement is executed.
+
+            Binary values are bound with setBinaryStream, and text files with
+            setCharacterStream.  The streams are kept until `close_streams()`.
+
+            :param i: the parameter index
+            :param value: a buffer, (memoryview, mmap, etc.), or a binary or text file object
+            """
+            stream = self.cls.BufferInputStream.new(value)
+            self.streams.append(stream)
+            if stream.text:
+                self.cls.setCharacterStream(self.obj, i, stream.reader())
+            elif stream.length is None:
+                self.cls.setBinaryStream(self.obj, i, stream.obj)
+            else:
+                self.cls.setBinaryStreamLength(self.obj, i, stream.obj, stream.length)
+
+        def close_streams(self):
+            """
+            Close the streams bound by `setStream`, once the statement has been executed.
+            """
+            streams, self.streams = self.streams, []
+            for stream in streams:
+                stream.close()
+
         def setTime(self, i, value):
             if not isinstance(value, self.cls.Time.Instance):
                 value = self.cls.Time.from_python(value)
@@ -733,20 +837,30 @@ class PreparedStatement(Object):
             '()Ljava/sql/ParameterMetaData;'
         )
         self.getResultSet = self.method('getResultSet', '()Ljava/sql/ResultSet;')
+        self.getFetchSize = self.method('getFetchSize', '()I')
         self.getUpdateCount = self.method('getUpdateCount', '()I')
+        self.setBigDecimal = self.method('setBigDecimal', '(ILjava/math/BigDecimal;)V')
+        self.setBinaryStream = self.method('setBinaryStream', '(ILjava/io/InputStream;)V')
+        self.setBinaryStreamLength = self.method('setBinaryStream', '(ILjava/io/InputStream;J)V')
         self.setBoolean = self.method('setBoolean', '(IZ)V')
+        self.setCharacterStream = self.method('setCharacterStream', '(ILjava/io/Reader;)V')
         self.setByte = self.method('setByte', '(IB)V')
         self.setBytes = self.method('setBytes', '(I[B)V')
         self.setDate = self.method('setDate', '(ILjava/sql/Date;)V')
         self.setDouble = self.method('setDouble', '(ID)V')
+        self.setFetchSize = self.method('setFetchSize', '(I)V')
         self.setFloat = self.method('setFloat', '(IF)V')
         self.setShort = self.method('setShort', '(IS)V')
         self.setInt = self.method('setInt', '(II)V')
+        self.setLargeMaxRows = self.method('setLargeMaxRows', '(J)V')
         self.setLong = self.method('setLong', '(IJ)V')
+        self.setMaxRows = self.method('setMaxRows', '(I)V')
         self.setNull = self.method('setNull', '(II)V')
         self.setString = self.method('setString', '(ILjava/lang/String;)V')
         self.setTime = self.method('setTime', '(ILjava/sql/Time;)V')
         self.setTimestamp = self.method('setTimestamp', '(ILjava/sql/Timestamp;)V')
+        self.BigDecimal = None
+        self.BufferInputStream = None
         self.Date = None
         self.ParameterMetaData = None
         self.ResultSet = None
@@ -767,26 +881,25 @@ class CallableStatement(PreparedStatement):
         """
         Wrapper for java.sql.CallableStatement object instance
         """
-        def __init__(self, cls, obj):
-            super(CallableStatement.Instance, self).__init__(cls, obj)
-            self.getBoolean = lambda i, o=obj: cls.getBoolean(o, i)
-            self.getBytes = lambda i, o=obj: cls.getBytes(o, i)
-            self.getDouble = lambda i, o=obj: cls.getDouble(o, i)
-            self.getFloat = lambda i, o=obj: cls.getFloat(o, i)
-            self.getInt = lambda i, o=obj: cls.getInt(o, i)
-            self.getLong = lambda i, o=obj: cls.getLong(o, i)
-            self.getString = lambda i, o=obj: cls.getString(o, i)
-            self.registerOutParameter = lambda i, t, o=obj: cls.registerOutParameter(o, i, t)
-            self.setBoolean = lambda n, v, o=obj: cls.setBoolean(o, n, v)
-            self.setBytes = lambda n, v, o=obj: cls.setBytes(o, n, v)
-            self.setDate = lambda n, v, o=obj: cls.setDate(o, n, v)
-            self.setDouble = lambda n, v, o=obj: cls.setDouble(o, n, v)
-            self.setLong = lambda n, v, o=obj: cls.setLong(o, n, v)
-            self.setNull = lambda n, t, o=obj: cls.setNull(o, n, t)
-            self.setString = lambda n, v, o=obj: cls.setString(o, n, v)
-            self.setTime = lambda n, v, o=obj: cls.setTime(o, n, v)
-            self.setTimestamp = lambda n, v, o=obj: cls.setTimestamp(o, n, v)
-            self.wasNull = lambda o=obj: cls.wasNull(o)
+        __slots__ = ()
+        getBoolean = JInstanceMethod('getBoolean')
+        getBytes = JInstanceMethod('getBytes')
+        getDouble = JInstanceMethod('getDouble')
+        getFloat = JInstanceMethod('getFloat')
+        getInt = JInstanceMethod('getInt')
+        getLong = JInstanceMethod('getLong')
+        getString = JInstanceMethod('getString')
+        registerOutParameter = JInstanceMethod('registerOutParameter')
+        setBoolean = JInstanceMethod('setBoolean')
+        setBytes = JInstanceMethod('setBytes')
+        setDate = JInstanceMethod('setDate')
+        setDouble = JInstanceMethod('setDouble')
+        setLong = JInstanceMethod('setLong')
+        setNull = JInstanceMethod('setNull')
+        setString = JInstanceMethod('setString')
+        setTime = JInstanceMethod('setTime')
+        setTimestamp = JInstanceMethod('setTimestamp')
+        wasNull = JInstanceMethod('wasNull')
 
         def getDate(self, i):
             cls = self.env.get('java.sql.Date')
@@ -815,7 +928,7 @@ class CallableStatement(PreparedStatement):
                 self.setDouble(name, arg)
             elif isinstance(arg, six.string_types):
                 self.setString(name, arg)
-            elif isinstance(arg, six.binary_type):
+            elif isinstance(arg, (six.binary_type, bytearray, memoryview)):
                 self.setBytes(name, arg)
             elif isinstance(arg, datetime.datetime):
                 self.setTimestamp(name, arg)
@@ -867,21 +980,32 @@ class ResultSet(Object):
 
         It implements a Python iterator for iteration over rows.
         """
-        def __init__(self, cls, obj):
-            super(ResultSet.Instance, self).__init__(cls, obj)
-            self.close = lambda o=obj: cls.close(o)
-            self.getBoolean = lambda i, o=obj: cls.getBoolean(o, i)
-            self.getBytes = lambda i, o=obj: cls.getBytes(o, i)
-            self.getDouble = lambda i, o=obj: cls.getDouble(o, i)
-            self.getInt = lambda i, o=obj: cls.getInt(o, i)
-            self.getLong = lambda i, o=obj: cls.getLong(o, i)
-            self.getString = lambda i, o=obj: cls.getString(o, i)
-            self._next = lambda o=obj: cls.next(o)
-            self.wasNull = lambda o=obj: cls.wasNull(o)
+        __slots__ = ()
+        _next = JInstanceMethod('next')
+        close = JInstanceMethod('close')
+        getBoolean = JInstanceMethod('getBoolean')
+        getBytes = JInstanceMethod('getBytes')
+        getDouble = JInstanceMethod('getDouble')
+        getInt = JInstanceMethod('getInt')
+        getLong = JInstanceMethod('getLong')
+        getString = JInstanceMethod('getString')
+        wasNull = JInstanceMethod('wasNull')
 
         def __iter__(self):
             return self
 
+        def getBigDecimal(self, i):
+            cls = self.env.get('java.math.BigDecimal')
+            return cls(self.cls.getBigDecimal(self.obj, i))
+
+        def getBlob(self, i):
+            cls = self.env.get('java.sql.Blob')
+            return cls(self.cls.getBlob(self.obj, i))
+
+        def getClob(self, i):
+            cls = self.env.get('java.sql.Clob')
+            return cls(self.cls.getClob(self.obj, i))
+
         def getDate(self, i):
             cls = self.env.get('java.sql.Date')
             return cls(self.cls.getDate(self.obj, i))
@@ -911,9 +1035,14 @@ class ResultSet(Object):
 
     def __init__(self, env):
         super(ResultSet, self).__init__(env)
+        self._CONCUR_READ_ONLY = self.constant('CONCUR_READ_ONLY', 'I')
+        self._TYPE_FORWARD_ONLY = self.constant('TYPE_FORWARD_ONLY', 'I')
         self.close = self.method('close', '()V')
+        self.getBigDecimal = self.method('getBigDecimal', '(I)Ljava/math/BigDecimal;')
+        self.getBlob = self.method('getBlob', '(I)Ljava/sql/Blob;')
         self.getBoolean = self.method('getBoolean', '(I)Z')
         self.getBytes = self.method('getBytes', '(I)[B')
+        self.getClob = self.method('getClob', '(I)Ljava/sql/Clob;')
         self.getDate = self.method('getDate', '(I)Ljava/sql/Date;')
         self.getDouble = self.method('getDouble', '(I)D')
         self.getInt = self.method('getInt', '(I)I')
@@ -925,6 +1054,14 @@ class ResultSet(Object):
         self.next = self.method('next', '()Z')
         self.wasNull = self.method('wasNull', '()Z')
 
+    @property
+    def CONCUR_READ_ONLY(self):
+        return self._CONCUR_READ_ONLY.get(self.cls)
+
+    @property
+    def TYPE_FORWARD_ONLY(self):
+        return self._TYPE_FORWARD_ONLY.get(self.cls)
+
 
 class ResultSetMetaData(Object):
     """
@@ -936,22 +1073,21 @@ class ResultSetMetaData(Object):
         """
         Wrapper for java.sql.ResultSetMetaData object instance
         """
-        def __init__(self, cls, obj):
-            super(ResultSetMetaData.Instance, self).__init__(cls, obj)
-            self.getColumnCount = lambda o=obj: cls.getColumnCount(o)
-            self.getColumnDisplaySize = lambda i, o=obj: cls.getColumnDisplaySize(o, i)
-            self.getColumnName = lambda i, o=obj: cls.getColumnName(o, i)
-            self.getColumnType = lambda i, o=obj: cls.getColumnType(o, i)
-            self.getColumnTypeName = lambda i, o=obj: cls.getColumnTypeName(o, i)
-            self.getPrecision = lambda i, o=obj: cls.getPrecision(o, i)
-            self.getScale = lambda i, o=obj: cls.getScale(o, i)
-            self.isNullable = lambda i, o=obj: cls.isNullable(o, i)
+        __slots__ = ()
+        getColumnCount = JInstanceMethod('getColumnCount')
+        getColumnDisplaySize = JInstanceMethod('getColumnDisplaySize')
+        getColumnName = JInstanceMethod('getColumnName')
+        getColumnType = JInstanceMethod('getColumnType')
+        getColumnTypeName = JInstanceMethod('getColumnTypeName')
+        getPrecision = JInstanceMethod('getPrecision')
+        getScale = JInstanceMethod('getScale')
+        isNullable = JInstanceMethod('isNullable')
 
     def __init__(self, env):
         super(ResultSetMetaData, self).__init__(env)
-        self._columnNoNulls = self.static_field('columnNoNulls', 'I')
-        self._columnNullable = self.static_field('columnNullable', 'I')
-        self._columnNullableUnknown = self.static_field('columnNullableUnknown', 'I')
+        self._columnNoNulls = self.constant('columnNoNulls', 'I')
+        self._columnNullable = self.constant('columnNullable', 'I')
+        self._columnNullableUnknown = self.constant('columnNullableUnknown', 'I')
         self.getColumnCount = self.method('getColumnCount', '()I')
         self.getColumnDisplaySize = self.method('getColumnDisplaySize', '(I)I')
         self.getColumnName = self.method('getColumnName', '(I)Ljava/lang/String;')
@@ -984,26 +1120,17 @@ class SQLDate(Date):
         """
         Wrapper for java.util.Date object instance
         """
-        def __init__(self, cls, obj):
-            super(SQLDate.Instance, self).__init__(cls, obj)
-            self.setTime = lambda value, o=obj: cls.settime(o, value)
+        __slots__ = ()
 
     def __init__(self, env):
         super(SQLDate, self).__init__(env)
         if self.class_name == SQLDate.class_name:
             self.cons_j = self.constructor('J')
-        self.setTime = self.method('setTime', '(J)V')
         self.valueOf = self.static_method(
             'valueOf',
             '(Ljava/lang/String;)Ljava/sql/Date;'
         )
 
-    def new(self, *args):
-        if len(args) == 1:
-            if isinstance(args[0], int):
-                return self.cons_j(args[0])
-        return super(SQLDate, self).new(*args)
-
 
 class Statement(Object):
     """
@@ -1015,11 +1142,10 @@ class Statement(Object):
         """
         Wrapper for java.sql.Statement object instance
         """
-        def __init__(self, cls, obj):
-            super(Statement.Instance, self).__init__(cls, obj)
-            self.addBatch = lambda s, o=obj: cls.addBatch(o, s)
-            self.executeUpdate = lambda s, o=obj: cls.executeUpdate(o, s)
-            self.setQueryTimeout = lambda v, o=obj: cls.setQueryTimeout(o, v)
+        __slots__ = ()
+        addBatch = JInstanceMethod('addBatch')
+        executeUpdate = JInstanceMethod('executeUpdate')
+        setQueryTimeout = JInstanceMethod('setQueryTimeout')
 
         def executeQuery(self, sql):
             cls = self.env.get('java.sql.ResultSet')
@@ -1043,13 +1169,10 @@ class Time(Date):
     class_name = 'java.sql.Time'
 
     class Instance(Date.Instance):
-        def __init__(self, cls, obj):
-            super(Time.Instance, self).__init__(cls, obj)
-            self.getTime = lambda o=obj: cls.getTime(o)
-            self.setTime = lambda time, o=obj: cls.setTime(o, time)
+        __slots__ = ()
 
         def to_python(self):
-            offset = self.getTime() % 86400000
+            offset = self.cls.zone.to_local(self.getTime()) % DAY
             microsecond, offset = (offset % 1000) * 1000, offset // 1000
             second, offset = offset % 60, offset // 60
             minute, hour = offset % 60, offset // 60
@@ -1059,27 +1182,19 @@ class Time(Date):
         super(Time, self).__init__(env)
         if self.class_name == Time.class_name:
             self.cons_j = self.constructor('J')
-        self.getTime = self.method('getTime', '()J')
-        self.setTime = self.method('setTime', '(J)V')
         self._valueOf = self.static_method('valueOf', '(Ljava/lang/String;)Ljava/sql/Time;')
 
     def valueOf(self, s):
-        return self(self._valueOf(self.cls, s))
-
-    def new(self, *args):
-        if len(args) == 1:
-            if isinstance(args[0], int):
-                return self.cons_j(int(args[0]))
-        return super(Time, self).new(*args)
+        return self(self._valueOf(s))
 
     def from_python(self, value):
-        offset = (
-            (value.hour * 3600) +
-            (value.minute * 60) +
-            value.second +
-            (value.microsecond / 1e6)
-        )
-        return self.new(int(offset * 1000))
+        if isinstance(value, datetime.time):
+            local = (
+                (value.hour * 3600 + value.minute * 60 + value.second) * 1000 +
+                value.microsecond // 1000
+            )
+            return self.new(self.zone.from_local(local))
+        return self.new(value)
 
 
 class Timestamp(Date):
@@ -1089,58 +1204,38 @@ class Timestamp(Date):
     class_name = 'java.sql.Timestamp'
 
     class Instance(Date.Instance):
-        def __init__(self, cls, obj):
-            super(Timestamp.Instance, self).__init__(cls, obj)
-            self.getTime = lambda o=obj: cls.getTime(o)
-            self.setTime = lambda time, o=obj: cls.setTime(o, time)
+        __slots__ = ()
+        getNanos = JInstanceMethod('getNanos')
+        setNanos = JInstanceMethod('setNanos')
 
         def to_python(self):
-            cal = self.cls.Calendar.getInstance()
-            cal.setTimeInMillis(self.getTime())
-            return datetime.datetime(
-                cal.YEAR,
-                cal.MONTH,
-                cal.DAY_OF_MONTH,
-                cal.HOUR_OF_DAY,
-                cal.MINUTE,
-                cal.SECOND,
-                cal.MILLISECOND * 1000
+            local = self.cls.zone.to_local(self.getTime())
+            return EPOCH + datetime.timedelta(
+                seconds=local // 1000,
+                microseconds=self.getNanos() // 1000
             )
 
     def __init__(self, env):
         super(Timestamp, self).__init__(env)
-        self.Calendar = self.env.get('java.util.Calendar')
         if self.class_name == Timestamp.class_name:
             self.cons_j = self.constructor('J')
             self.cons6 = self.constructor('IIIIIII')
-        self.getTime = self.method('getTime', '()J')
-        self.setTime = self.method('setTime', '(J)V')
+        self.getNanos = self.method('getNanos', '()I')
+        self.setNanos = self.method('setNanos', '(I)V')
         self._valueOf = self.static_method(
             'valueOf',
             '(Ljava/lang/String;)Ljava/sql/Timestamp;'
         )
 
     def valueOf(self, s):
-        return self(self._valueOf(self.cls, s))
-
-    def new(self, *args):
-        if len(args) == 1:
-            if isinstance(args[0], int) or type(args[0]).__name__ == 'long':
-                return self.cons_j(int(args[0]))
-        return super(Timestamp, self).new(*args)
+        return self(self._valueOf(s))
 
     def from_python(self, value):
-        print('from_python', type(value))
-        if isinstance(value, datetime.datetime):
-            cal = self.Calendar.getInstance()
-            cal.set(self.cal.YEAR, value.year)
-            cal.set(self.cal.MONTH, value.month)
-            cal.set(self.cal.DAY_OF_MONTH, value.day)
-            cal.set(self.cal.HOUR_OF_DAY, value.hour)
-            cal.set(self.cal.MINUTE, value.minute)
-            cal.set(self.cal.SECOND, value.second)
-            cal.set(self.cal.MILLISECOND, value.microsecond // 1000)
-            value = cal.getTimeInMillis()
+        if isinstance(value, datetime.date):
+            result = self.new(self.epoch_millis(value))
+            if isinstance(value, datetime.datetime) and value.microsecond % 1000:
+                result.setNanos(value.microsecond * 1000)
+            return result
         return self.new(value)
 
 
@@ -1155,45 +1250,45 @@ class Types(Object):
 
     def __init__(self, env):
         super(Types, self).__init__(env)
-        self._ARRAY = self.static_field('ARRAY', 'I')
-        self._BIGINT = self.static_field('BIGINT', 'I')
-        self._BINARY = self.static_field('BINARY', 'I')
-        self._BIT = self.static_field('BIT', 'I')
-        self._BLOB = self.static_field('BLOB', 'I')
-        self._BOOLEAN = self.static_field('BOOLEAN', 'I')
-        self._CHAR = self.static_field('CHAR', 'I')
-        self._CLOB = self.static_field('CLOB', 'I')
-        self._DATALINK = self.static_field('DATALINK', 'I')
-        self._DATE = self.static_field('DATE', 'I')
-        self._DECIMAL = self.static_field('DECIMAL', 'I')
-        self._DISTINCT = self.static_field('DISTINCT', 'I')
-        self._DOUBLE = self.static_field('DOUBLE', 'I')
-        self._FLOAT = self.static_field('FLOAT', 'I')
-        self._INTEGER = self.static_field('INTEGER', 'I')
-        self._JAVA_OBJECT = self.static_field('JAVA_OBJECT', 'I')
-        self._LONGNVARCHAR = self.static_field('LONGNVARCHAR', 'I')
-        self._LONGVARBINARY = self.static_field('LONGVARBINARY', 'I')
-        self._LONGVARCHAR = self.static_field('LONGVARCHAR', 'I')
-        self._NCHAR = self.static_field('NCHAR', 'I')
-        self._NCLOB = self.static_field('NCLOB', 'I')
-        self._NULL = self.static_field('NULL', 'I')
-        self._NUMERIC = self.static_field('NUMERIC', 'I')
-        self._NVARCHAR = self.static_field('NVARCHAR', 'I')
-        self._OTHER = self.static_field('OTHER', 'I')
-        self._REAL = self.static_field('REAL', 'I')
-        self._REF = self.static_field('REF', 'I')
-        self._REF_CURSOR = self.static_field('REF_CURSOR', 'I')
-        self._ROWID = self.static_field('ROWID', 'I')
-        self._SMALLINT = self.static_field('SMALLINT', 'I')
-        self._SQLXML = self.static_field('SQLXML', 'I')
-        self._STRUCT = self.static_field('STRUCT', 'I')
-        self._TIME = self.static_field('TIME', 'I')
-        self._TIME_WITH_TIMEZONE = self.static_field('TIME_WITH_TIMEZONE', 'I')
-        self._TIMESTAMP = self.static_field('TIMESTAMP', 'I')
-        self._TIMESTAMP_WITH_TIMEZONE = self.static_field('TIMESTAMP_WITH_TIMEZONE', 'I')
-        self._TINYINT = self.static_field('TINYINT', 'I')
-        self._VARBINARY = self.static_field('VARBINARY', 'I')
-        self._VARCHAR = self.static_field('VARCHAR', 'I')
+        self._ARRAY = self.constant('ARRAY', 'I')
+        self._BIGINT = self.constant('BIGINT', 'I')
+        self._BINARY = self.constant('BINARY', 'I')
+        self._BIT = self.constant('BIT', 'I')
+        self._BLOB = self.constant('BLOB', 'I')
+        self._BOOLEAN = self.constant('BOOLEAN', 'I')
+        self._CHAR = self.constant('CHAR', 'I')
+        self._CLOB = self.constant('CLOB', 'I')
+        self._DATALINK = self.constant('DATALINK', 'I')
+        self._DATE = self.constant('DATE', 'I')
+        self._DECIMAL = self.constant('DECIMAL', 'I')
+        self._DISTINCT = self.constant('DISTINCT', 'I')
+        self._DOUBLE = self.constant('DOUBLE', 'I')
+        self._FLOAT = self.constant('FLOAT', 'I')
+        self._INTEGER = self.constant('INTEGER', 'I')
+        self._JAVA_OBJECT = self.constant('JAVA_OBJECT', 'I')
+        self._LONGNVARCHAR = self.constant('LONGNVARCHAR', 'I')
+        self._LONGVARBINARY = self.constant('LONGVARBINARY', 'I')
+        self._LONGVARCHAR = self.constant('LONGVARCHAR', 'I')
+        self._NCHAR = self.constant('NCHAR', 'I')
+        self._NCLOB = self.constant('NCLOB', 'I')
+        self._NULL = self.constant('NULL', 'I')
+        self._NUMERIC = self.constant('NUMERIC', 'I')
+        self._NVARCHAR = self.constant('NVARCHAR', 'I')
+        self._OTHER = self.constant('OTHER', 'I')
+        self._REAL = self.constant('REAL', 'I')
+        self._REF = self.constant('REF', 'I')
+        self._REF_CURSOR = self.constant('REF_CURSOR', 'I')
+        self._ROWID = self.constant('ROWID', 'I')
+        self._SMALLINT = self.constant('SMALLINT', 'I')
+        self._SQLXML = self.constant('SQLXML', 'I')
+        self._STRUCT = self.constant('STRUCT', 'I')
+        self._TIME = self.constant('TIME', 'I')
+        self._TIME_WITH_TIMEZONE = self.constant('TIME_WITH_TIMEZONE', 'I')
+        self._TIMESTAMP = self.constant('TIMESTAMP', 'I')
+        self._TIMESTAMP_WITH_TIMEZONE = self.constant('TIMESTAMP_WITH_TIMEZONE', 'I')
+        self._TINYINT = self.constant('TINYINT', 'I')
+        self._VARBINARY = self.constant('VARBINARY', 'I')
+        self._VARCHAR = self.constant('VARCHAR', 'I')
 
     @property
     def ARRAY(self):
@@ -1,6 +1,20 @@
 # -*- coding: utf8 -*-
 import datetime
+import six
 from py2jdbc.lang import Object
+from py2jdbc.wrap import JInstanceMethod
+
+DAY = 86400000
+HOUR = 3600000
+EPOCH = datetime.datetime(1970, 1, 1)
+OFFSET_CACHE_SIZE = 4096
+# the default GregorianCalendar cutover, 1582-10-15 UTC, before which Java uses the Julian calendar
+GREGORIAN_CUTOVER = -12219292800000
+DATE_CACHE_SIZE = 1024
+
+# the number of TimeZone.setDefault calls, so the TimeZone wrapper of every ThreadEnv
+# can tell its cached offsets and dates are out of date
+_default_changes = 0
 
 
 class Calendar(Object):
@@ -10,11 +24,10 @@ class Calendar(Object):
     class_name = 'java.util.Calendar'
 
     class Instance(Object.Instance):
-        def __init__(self, cls, obj):
-            super(Calendar.Instance, self).__init__(cls, obj)
-            self.get = lambda flag, o=obj: cls.get(o, flag)
-            self.getTimeInMillis = lambda o=obj: cls.getTimeInMillis(o)
-            self.setTimeInMillis = lambda millis, o=obj: cls.setTimeInMillis(o, millis)
+        __slots__ = ()
+        get = JInstanceMethod('get')
+        getTimeInMillis = JInstanceMethod('getTimeInMillis')
+        setTimeInMillis = JInstanceMethod('setTimeInMillis')
 
         @property
         def AM_PM(self):
@@ -108,50 +121,50 @@ class Calendar(Object):
 
     def __init__(self, env):
         super(Calendar, self).__init__(env)
-        self._ALL_STYLES = self.static_field('ALL_STYLES', 'I')
-        self._AM = self.static_field('AM', 'I')
-        self._AM_PM = self.static_field('AM_PM', 'I')
-        self._APRIL = self.static_field('APRIL', 'I')
-        self._AUGUST = self.static_field('AUGUST', 'I')
-        self._DATE = self.static_field('DATE', 'I')
-        self._DAY_OF_MONTH = self.static_field('DAY_OF_MONTH', 'I')
-        self._DAY_OF_WEEK = self.static_field('DAY_OF_WEEK', 'I')
-        self._DAY_OF_WEEK_IN_MONTH = self.static_field('DAY_OF_WEEK_IN_MONTH', 'I')
-        self._DAY_OF_YEAR = self.static_field('DAY_OF_YEAR', 'I')
-        self._DECEMBER = self.static_field('DECEMBER', 'I')
-        self._DST_OFFSET = self.static_field('DST_OFFSET', 'I')
-        self._ERA = self.static_field('ERA', 'I')
-        self._FEBRUARY = self.static_field('FEBRUARY', 'I')
-        self._FIELD_COUNT = self.static_field('FIELD_COUNT', 'I')
-        self._FRIDAY = self.static_field('FRIDAY', 'I')
-        self._HOUR = self.static_field('HOUR', 'I')
-        self._HOUR_OF_DAY = self.static_field('HOUR_OF_DAY', 'I')
-        self._JANUARY = self.static_field('JANUARY', 'I')
-        self._JULY = self.static_field('JULY', 'I')
-        self._JUNE = self.static_field('JUNE', 'I')
-        self._LONG = self.static_field('LONG', 'I')
-        self._MARCH = self.static_field('MARCH', 'I')
-        self._MAY = self.static_field('MAY', 'I')
-        self._MILLISECOND = self.static_field('MILLISECOND', 'I')
-        self._MINUTE = self.static_field('MINUTE', 'I')
-        self._MONDAY = self.static_field('MONDAY', 'I')
-        self._MONTH = self.static_field('MONTH', 'I')
-        self._NOVEMBER = self.static_field('NOVEMBER', 'I')
-        self._OCTOBER = self.static_field('OCTOBER', 'I')
-        self._PM = self.static_field('PM', 'I')
-        self._SATURDAY = self.static_field('SATURDAY', 'I')
-        self._SECOND = self.static_field('SECOND', 'I')
-        self._SEPTEMBER = self.static_field('SEPTEMBER', 'I')
-        self._SHORT = self.static_field('SHORT', 'I')
-        self._SUNDAY = self.static_field('SUNDAY', 'I')
-        self._THURSDAY = self.static_field('THURSDAY', 'I')
-        self._TUESDAY = self.static_field('TUESDAY', 'I')
-        self._UNDECIMBER = self.static_field('UNDECIMBER', 'I')
-        self._WEDNESDAY = self.static_field('WEDNESDAY', 'I')
-        self._WEEK_OF_MONTH = self.static_field('WEEK_OF_MONTH', 'I')
-        self._WEEK_OF_YEAR = self.static_field('WEEK_OF_YEAR', 'I')
-        self._YEAR = self.static_field('YEAR', 'I')
-        self._ZONE_OFFSET = self.static_field('ZONE_OFFSET', 'I')
+        self._ALL_STYLES = self.constant('ALL_STYLES', 'I')
+        self._AM = self.constant('AM', 'I')
+        self._AM_PM = self.constant('AM_PM', 'I')
+        self._APRIL = self.constant('APRIL', 'I')
+        self._AUGUST = self.constant('AUGUST', 'I')
+        self._DATE = self.constant('DATE', 'I')
+        self._DAY_OF_MONTH = self.constant('DAY_OF_MONTH', 'I')
+        self._DAY_OF_WEEK = self.constant('DAY_OF_WEEK', 'I')
+        self._DAY_OF_WEEK_IN_MONTH = self.constant('DAY_OF_WEEK_IN_MONTH', 'I')
+        self._DAY_OF_YEAR = self.constant('DAY_OF_YEAR', 'I')
+        self._DECEMBER = self.constant('DECEMBER', 'I')
+        self._DST_OFFSET = self.constant('DST_OFFSET', 'I')
+        self._ERA = self.constant('ERA', 'I')
+        self._FEBRUARY = self.constant('FEBRUARY', 'I')
+        self._FIELD_COUNT = self.constant('FIELD_COUNT', 'I')
+        self._FRIDAY = self.constant('FRIDAY', 'I')
+        self._HOUR = self.constant('HOUR', 'I')
+        self._HOUR_OF_DAY = self.constant('HOUR_OF_DAY', 'I')
+        self._JANUARY = self.constant('JANUARY', 'I')
+        self._JULY = self.constant('JULY', 'I')
+        self._JUNE = self.constant('JUNE', 'I')
+        self._LONG = self.constant('LONG', 'I')
+        self._MARCH = self.constant('MARCH', 'I')
+        self._MAY = self.constant('MAY', 'I')
+        self._MILLISECOND = self.constant('MILLISECOND', 'I')
+        self._MINUTE = self.constant('MINUTE', 'I')
+        self._MONDAY = self.constant('MONDAY', 'I')
+        self._MONTH = self.constant('MONTH', 'I')
+        self._NOVEMBER = self.constant('NOVEMBER', 'I')
+        self._OCTOBER = self.constant('OCTOBER', 'I')
+        self._PM = self.constant('PM', 'I')
+        self._SATURDAY = self.constant('SATURDAY', 'I')
+        self._SECOND = self.constant('SECOND', 'I')
+        self._SEPTEMBER = self.constant('SEPTEMBER', 'I')
+        self._SHORT = self.constant('SHORT', 'I')
+        self._SUNDAY = self.constant('SUNDAY', 'I')
+        self._THURSDAY = self.constant('THURSDAY', 'I')
+        self._TUESDAY = self.constant('TUESDAY', 'I')
+        self._UNDECIMBER = self.constant('UNDECIMBER', 'I')
+        self._WEDNESDAY = self.constant('WEDNESDAY', 'I')
+        self._WEEK_OF_MONTH = self.constant('WEEK_OF_MONTH', 'I')
+        self._WEEK_OF_YEAR = self.constant('WEEK_OF_YEAR', 'I')
+        self._YEAR = self.constant('YEAR', 'I')
+        self._ZONE_OFFSET = self.constant('ZONE_OFFSET', 'I')
         self._getInstance0 = self.static_method('getInstance', '()Ljava/util/Calendar;')
         self.get = self.method('get', '(I)I')
         self.getTime = self.method('getTime', '()Ljava/util/Date;')
@@ -341,7 +354,7 @@ class Calendar(Object):
 
     def getInstance(self, *args):
         if len(args) == 0:
-            return self(self._getInstance0(self.cls))
+            return self(self._getInstance0())
         raise RuntimeError("unexpected arguments: %r" % args)
 
 
@@ -352,8 +365,7 @@ class GregorianCalendar(Calendar):
     class_name = 'java.util.GregorianCalendar'
 
     class Instance(Calendar.Instance):
-        def __init__(self, cls, obj):
-            super(GregorianCalendar.Instance, self).__init__(cls, obj)
+        __slots__ = ()
 
     def __init__(self, env):
         super(GregorianCalendar, self).__init__(env)
@@ -362,8 +374,8 @@ class GregorianCalendar(Calendar):
             self.cons3 = self.constructor('III')
             self.cons5 = self.constructor('IIIII')
             self.cons6 = self.constructor('IIIIII')
-        self._AD = self.static_field('AD', 'I')
-        self._BC = self.static_field('BC', 'I')
+        self._AD = self.constant('AD', 'I')
+        self._BC = self.constant('BC', 'I')
 
     @property
     def AD(self):
@@ -385,6 +397,164 @@ class GregorianCalendar(Calendar):
         return super(GregorianCalendar, self).new(*args)
 
 
+class TimeZone(Object):
+    """
+    Wrapper for java.util.TimeZone java abstract class
+
+    It also converts between epoch milliseconds and local wall-clock
+    milliseconds in the JVM default time zone, (read once per ThreadEnv),
+    caching the zone offset for each hour, so most conversions are done
+    in Python without calling into the JVM.  It also caches the Python dates
+    of java.util.Date and java.sql.Date values, which depend on the zone.
+
+    Local times within a day of a zone transition, and times before the
+    Gregorian cutover, are converted by a java.util.Calendar instead, so
+    they match Java: times in a DST gap are moved forward, and old dates
+    are in the Julian calendar.
+    """
+    class_name = 'java.util.TimeZone'
+
+    class Instance(Object.Instance):
+        __slots__ = ()
+        getID = JInstanceMethod('getID')
+        getOffset = JInstanceMethod('getOffset')
+        getRawOffset = JInstanceMethod('getRawOffset')
+
+    def __init__(self, env):
+        super(TimeZone, self).__init__(env)
+        self._getDefault = self.static_method('getDefault', '()Ljava/util/TimeZone;')
+        self._getTimeZone = self.static_method(
+            'getTimeZone',
+            '(Ljava/lang/String;)Ljava/util/TimeZone;'
+        )
+        self._setDefault = self.static_method('setDefault', '(Ljava/util/TimeZone;)V')
+        self.getID = self.method('getID', '()Ljava/lang/String;')
+        self.getOffset = self.method('getOffset', '(J)I')
+        self.getRawOffset = self.method('getRawOffset', '()I')
+        self._default = None
+        self._offsets = {}
+        self._dates = {}
+        self._changes = _default_changes
+
+    def _check_default(self):
+        """
+        Clear the cached default zone, offsets and dates, if the default time
+        zone was changed since they were cached, (on any thread).
+        """
+        if self._changes != _default_changes:
+            self._changes = _default_changes
+            self._default = None
+            self._offsets.clear()
+            self._dates.clear()
+
+    @property
+    def dates(self):
+        """
+        The cache of Python dates by epoch milliseconds, (see Date.Instance.to_python).
+        """
+        self._check_default()
+        return self._dates
+
+    def getDefault(self):
+        return self(self._getDefault())
+
+    def getTimeZone(self, ID):
+        return self(self._getTimeZone(ID))
+
+    def setDefault(self, zone):
+        """
+        Change the JVM default time zone, and clear the cached offsets and dates,
+        (of the TimeZone wrappers of every thread).
+
+        :param zone: a TimeZone instance, or None to go back to the system zone
+        """
+        global _default_changes
+        self._setDefault(None if zone is None else zone.obj)
+        _default_changes += 1
+        self._check_default()
+
+    def offset(self, millis):
+        """
+        The offset of the default time zone from UTC, at a point in time.
+
+        Offsets are cached by the hour, unless the offset changes during the hour.
+
+        :param millis: milliseconds since the epoch, UTC
+        :return: the offset in milliseconds
+        """
+        self._check_default()
+        hour = millis // HOUR
+        value = self._offsets.get(hour)
+        if value is None:
+            if self._default is None:
+                self._default = self.getDefault()
+            value = self._default.getOffset(millis)
+            if value != self._default.getOffset(hour * HOUR) or \
+                    value != self._default.getOffset(hour * HOUR + HOUR - 1):
+                return value
+            if len(self._offsets) >= OFFSET_CACHE_SIZE:
+                self._offsets.clear()
+            self._offsets[hour] = value
+        return value
+
+    def to_local(self, millis):
+        """
+        Convert epoch milliseconds to local wall-clock milliseconds since the epoch.
+
+        :param millis: milliseconds since the epoch, UTC
+        :return: local milliseconds since the epoch
+        """
+        if millis < GREGORIAN_CUTOVER + DAY:
+            return self._calendar_local(millis)
+        return millis + self.offset(millis)
+
+    def from_local(self, local):
+        """
+        Convert local wall-clock milliseconds since the epoch to epoch milliseconds.
+
+        :param local: local milliseconds since the epoch
+        :return: milliseconds since the epoch, UTC
+        """
+        if local >= GREGORIAN_CUTOVER + DAY:
+            offset = self.offset(local - DAY)
+            if offset == self.offset(local + DAY):
+                return local - offset
+        return self._calendar_millis(local)
+
+    def _calendar_local(self, millis):
+        """
+        Convert epoch milliseconds to local wall-clock milliseconds with a Calendar.
+
+        :param millis: milliseconds since the epoch, UTC
+        :return: local milliseconds since the epoch, (proleptic Gregorian)
+        """
+        cal = self.env.get('java.util.Calendar').getInstance()
+        cal.setTimeInMillis(millis)
+        delta = datetime.datetime(
+            cal.YEAR,
+            cal.MONTH + 1,      # Calendar months start from 0
+            cal.DAY_OF_MONTH,
+            cal.HOUR_OF_DAY,
+            cal.MINUTE,
+            cal.SECOND
+        ) - EPOCH
+        return (delta.days * 86400 + delta.seconds) * 1000 + cal.MILLISECOND
+
+    def _calendar_millis(self, local):
+        """
+        Convert local wall-clock milliseconds to epoch milliseconds with a lenient Calendar.
+
+        :param local: local milliseconds since the epoch, (proleptic Gregorian)
+        :return: milliseconds since the epoch, UTC
+        """
+        value = EPOCH + datetime.timedelta(milliseconds=local)
+        calendar = self.env.get('java.util.Calendar')
+        cal = calendar.getInstance()
+        cal.set(value.year, value.month - 1, value.day, value.hour, value.minute, value.second)
+        cal.set(calendar.MILLISECOND, value.microsecond // 1000)
+        return cal.getTimeInMillis()
+
+
 class Date(Object):
     """
     Wrapper for java.util.Date java class
@@ -395,30 +565,65 @@ class Date(Object):
         """
         Wrapper for java.util.Date object instance
         """
-        def __init__(self, cls, obj):
-            super(Date.Instance, self).__init__(cls, obj)
+        __slots__ = ()
+        getTime = JInstanceMethod('getTime')
+        setTime = JInstanceMethod('setTime')
 
         def to_python(self):
-            cal = self.cls.cal.new()
-            cal.setTime(self.obj)
-            return datetime.date(cal.YEAR, cal.MONTH, cal.DAY_OF_MONTH)
+            millis = self.getTime()
+            zone = self.cls.zone
+            dates = zone.dates
+            value = dates.get(millis)
+            if value is None:
+                if len(dates) >= DATE_CACHE_SIZE:
+                    dates.clear()
+                local = zone.to_local(millis)
+                value = dates[millis] = EPOCH.date() + datetime.timedelta(milliseconds=local)
+            return value
 
     def __init__(self, env):
         super(Date, self).__init__(env)
-        self.cal = self.env.get('java.util.GregorianCalendar')
+        self.zone = self.env.get('java.util.TimeZone')
         if self.class_name == Date.class_name:
             self.cons_j = self.constructor('J')
+        self.getTime = self.method('getTime', '()J')
+        self.setTime = self.method('setTime', '(J)V')
 
     def new(self, *args):
         if len(args) == 1:
-            if isinstance(args[0], int):
+            if isinstance(args[0], six.integer_types):
                 return self.cons_j(args[0])
         return super(Date, self).new(*args)
 
+    def local_millis(self, value):
+        """
+        Local wall-clock milliseconds since the epoch of a Python date or datetime.
+
+        :param value: a datetime.date or naive datetime.datetime
+        :return: the number of milliseconds
+        """
+        if not isinstance(value, datetime.datetime):
+            return (value - EPOCH.date()).days * DAY
+        delta = value - EPOCH
+        return (delta.days * 86400 + delta.seconds) * 1000 + delta.microseconds // 1000
+
+    def epoch_millis(self, value):
+        """
+        Milliseconds since the epoch of a Python date or datetime.  Naive values
+        are in the JVM default time zone.
+
+        :param value: a datetime.date or datetime.datetime
+        :return: the number of milliseconds, UTC
+        """
+        if isinstance(value, datetime.datetime) and value.utcoffset() is not None:
+            return self.local_millis(value.replace(tzinfo=None) - value.utcoffset())
+        return self.zone.from_local(self.local_millis(value))
+
     def from_python(self, value):
         if isinstance(value, datetime.date):
-            cal = self.cal.new(value.year, value.month, value.day)
-            return cal.getTime()
+            if isinstance(value, datetime.datetime):
+                value = value.date()
+            return self.new(self.epoch_millis(value))
         return self.new(value)
 
 
@@ -438,10 +643,9 @@ class Enumeration(Object):
 
         Implements Python iterator symantics.
         """
-        def __init__(self, cls, obj):
-            super(Enumeration.Instance, self).__init__(cls, obj)
-            self.hasMoreElements = lambda o=obj: cls.hasMoreElements(o)
-            self.nextElement = lambda o=obj: cls.nextElement(o)
+        __slots__ = ()
+        hasMoreElements = JInstanceMethod('hasMoreElements')
+        nextElement = JInstanceMethod('nextElement')
 
         def __iter__(self):
             return self
@@ -1,23 +1,42 @@
 # -*- coding: utf8 -*-
+import functools
 import logging
+import threading
 import six
 import py2jdbc.jni
 import py2jdbc.sig
 
 log = logging.getLogger(__name__)
 
+# the ThreadEnv of each thread, (see ThreadEnv.instance)
+_local = threading.local()
+
+# process-wide JNI handles, which are valid on every thread: global references
+# to classes by name, and field and method IDs by class name, JNIEnv lookup
+# function, member name and signature
+_lock = threading.Lock()
+_global_classes = {}
+_member_ids = {}
+
+# the values of constant static fields, by class name, field name and signature
+_constants = {}
+
 
 class Register(type):
     """
-    Metaclass to register classes for loading when ThreadEnv is created.
+    Metaclass to register classes, for ThreadEnv to load when they're first used.
+
+    If more than one wrapper is declared for a Java class, the last one is used.
     """
     registry = []
+    by_name = {}
 
     def __new__(mcs, clsname, bases, attrs):
         newclass = super(Register, mcs).__new__(mcs, clsname, bases, attrs)
         class_name = getattr(newclass, 'class_name')
         if class_name:
             mcs.registry.append(newclass)
+            mcs.by_name[class_name] = newclass
         return newclass
 
 
@@ -27,8 +46,8 @@ class ThreadEnv(object):
     """
     def __init__(self, **kwargs):
         """
-        Automatically attach/create JNI environment, then run
-        through module JClass subclasses, construct and register them.
+        Automatically attach/create JNI environment.  The JClass wrappers are
+        constructed the first time they're asked for, with `get`.
 
         :param kwargs: jni.JNIEnv.get_env arguments, (like classpath, verbose, etc.)
         """
@@ -39,22 +58,25 @@ class ThreadEnv(object):
             'java.lang.Exception',
             'java.lang.Throwable'
         )
-        for cls in JClass.registry:
-            cls(self)
 
     @classmethod
     def instance(cls, **kwargs):
         """
-        Make this a weak singleton.  Call this method to grab the current ThreadEnv
+        Make this a per-thread singleton.  Call this method to grab the current ThreadEnv
         object for the thread, or create one if the current thread doesn't have one.
 
-        The instance will have all the JClass subclass wrappers already loaded
-        against the current py2jdbc.jni.JNIEnv.
+        The instance loads JClass subclass wrappers against the current
+        py2jdbc.jni.JNIEnv as they're used.  It's kept until the thread is
+        detached with `detach_thread`, or the JVM is destroyed, so `kwargs`
+        only matter the first time.
 
         :param kwargs: py2jdbc.jni.JNIEnv.get_env arguments, (like classpath, verbose, etc.)
         :return: the current thread's ThreadEnv object
         """
-        return cls(**kwargs)
+        env = getattr(_local, 'env', None)
+        if env is None or not py2jdbc.jni.vm:
+            env = _local.env = cls(**kwargs)
+        return env
 
     def exception(self, e):
         """
@@ -64,13 +86,23 @@ class ThreadEnv(object):
         :raises: JavaException if an exception occurred.
         """
         for ec in self.exceptions:
-            e_class = self.classes.get(ec)
+            e_class = self.get(ec) if ec in Register.by_name else None
             if e_class and self.env.IsInstanceOf(e.throwable, e_class.cls):
                 return e_class(e.throwable)
         return e
 
     def get(self, arg):
-        return self.classes[arg]
+        """
+        Get the wrapper of a Java class, constructing it the first time.
+
+        :param arg: the Java class name, (like 'java.sql.ResultSet')
+        :return: the JClass wrapper instance
+        :raises: KeyError if no wrapper is registered for the class
+        """
+        wrapper = self.classes.get(arg)
+        if wrapper is None:
+            wrapper = Register.by_name[arg](self)
+        return wrapper
 
 
 def get_env(**kwargs):
@@ -84,9 +116,32 @@ def get_env(**kwargs):
     return ThreadEnv.instance(**kwargs)
 
 
+def current_env():
+    """
+    The ThreadEnv of the current thread, without creating one, or attaching the thread.
+
+    :return: the current thread's ThreadEnv instance, or None if it doesn't have one.
+    """
+    return getattr(_local, 'env', None)
+
+
+def detach_thread():
+    """
+    Forget the current thread's ThreadEnv, and detach the thread from the JVM.
+
+    The wrappers of the ThreadEnv can't be used after this.
+    """
+    _local.env = None
+    py2jdbc.jni.detach_thread()
+
+
 class JBase(object):
     """
     Common structure for fields and methods.
+
+    The field or method ID, and the type handlers for its signature, are looked
+    up the first time it's used, so wrapping a class doesn't cost a JNI call
+    for every member it declares.
     """
     def __init__(self, cls, name, signature):
         """
@@ -100,6 +155,7 @@ class JBase(object):
         self.cls = cls
         self.name = name
         self.signature = signature
+        self.resolved = False
 
     @property
     def env(self):
@@ -109,6 +165,38 @@ class JBase(object):
         """
         return self.cls.env.env
 
+    def member_id(self, find):
+        """
+        Find the ID of the field or method, once per process.
+
+        :param find: the JNIEnv lookup function, like GetMethodID
+        :return: the field or method ID
+        """
+        key = (self.cls.class_name, find.__name__, self.name, self.signature)
+        mid = _member_ids.get(key)
+        if mid is None:
+            mid = _member_ids[key] = find(self.cls.cls, self.name, self.signature)
+        return mid
+
+    def resolve(self):
+        """
+        Look up the field or method, if it hasn't been already.
+
+        :raises: the wrapped Java exception if it wasn't found.
+        """
+        if not self.resolved:
+            try:
+                self.lookup()
+            except py2jdbc.jni.JavaException as e:
+                raise self.cls.env.exception(e)
+            self.resolved = True
+
+    def lookup(self):
+        """
+        Overridable function which finds the ID and type handlers.
+        """
+        raise NotImplementedError
+
 
 class JField(JBase):
     """
@@ -124,14 +212,13 @@ class JField(JBase):
         :param cls: a JClass wrapper subclass
         :param name: the name of the field.
         :param signature: the Java signature of the field
-        :raises: RuntimeError if the field was not found.
         """
         super(JField, self).__init__(cls, name, signature)
-        try:
-            self.fid = self.env.GetFieldID(cls.cls, name, signature)
-            self.restype = next(py2jdbc.sig.type_signature(self.env, signature))
-        except py2jdbc.jni.JavaException as e:
-            raise self.cls.env.exception(e)
+        self.fid = self.restype = None
+
+    def lookup(self):
+        self.fid = self.member_id(self.env.GetFieldID)
+        self.restype = next(py2jdbc.sig.type_signature(self.env, self.signature))
 
     def get(self, obj):
         """
@@ -140,6 +227,8 @@ class JField(JBase):
         :param obj: the object instance
         :return: the field value, converted for Python
         """
+        if not self.resolved:
+            self.resolve()
         return self.restype.get(obj, self.fid)
 
     def set(self, obj, value):
@@ -149,13 +238,20 @@ class JField(JBase):
         :param obj: the object instance
         :param value: the value to assign to the object field
         """
+        if not self.resolved:
+            self.resolve()
         self.restype.set(obj, self.fid, value)
 
 
 class JMethod(JBase):
     """
     Wraps a java object instance method
+
+    The method is called through a stub compiled for its signature, (see
+    `py2jdbc.sig.call_stub`), which is created when the method is looked up.
     """
+    stub_kind = 'call'
+
     def __init__(self, cls, name, signature):
         """
         Construct a JMethod instance.
@@ -166,14 +262,14 @@ class JMethod(JBase):
         :param cls: a JClass wrapper subclass
         :param name: the name of the method.
         :param signature: the Java signature of the method
-        :raises: RuntimeError if the method was not found.
         """
         super(JMethod, self).__init__(cls, name, signature)
-        try:
-            self.mid = self.env.GetMethodID(cls.cls, name, signature)
-            self.argtypes, self.restype = self.get_signature(signature)
-        except py2jdbc.jni.JavaException as e:
-            raise self.cls.env.exception(e)
+        self.mid = self.argtypes = self.restype = self.stub = None
+
+    def lookup(self):
+        self.mid = self.member_id(self.env.GetMethodID)
+        self.argtypes, self.restype = self.get_signature(self.signature)
+        self.stub = py2jdbc.sig.call_stub(self.env, self.stub_kind, self.argtypes, self.restype)
 
     def get_signature(self, signature):
         """
@@ -193,8 +289,10 @@ class JMethod(JBase):
         :param args: Python value arguments
         :return: the result value, or None for Void methods.
         """
+        if not self.resolved:
+            self.resolve()
         try:
-            return self.restype.call(obj, self.mid, self.argtypes, *args)
+            return self.stub(obj, self.mid, *args)
         except py2jdbc.jni.JavaException as e:
             raise self.cls.env.exception(e)
 
@@ -203,6 +301,8 @@ class JConstructor(JMethod):
     """
     Wraps a java object constructor method
     """
+    stub_kind = 'new'
+
     def __init__(self, cls, signature):
         """
         Create an instance of a constructor.
@@ -210,7 +310,6 @@ class JConstructor(JMethod):
 
         :param cls: a JClass wrapper subclass
         :param signature: the Java signature of the constructor, (just the arguments)
-        :raises: RuntimeError if no matching constructor was found
         """
         super(JConstructor, self).__init__(cls, '<init>', '({})V'.format(signature))
 
@@ -235,9 +334,10 @@ class JConstructor(JMethod):
         :param args: Python value arguments
         :return: the resulting object instance handle
         """
+        if not self.resolved:
+            self.resolve()
         try:
-            obj = self.restype.new(self.cls.cls, self.mid, self.argtypes, *args)
-            return self.cls(obj)
+            return self.cls(self.stub(self.cls.cls, self.mid, *args))
         except py2jdbc.jni.JavaException as e:
             raise self.cls.env.exception(e)
 
@@ -245,22 +345,48 @@ class JConstructor(JMethod):
 class JStaticField(JBase):
     """
     Wraps a java class static field
+
+    A constant field, (a static final primitive or string), is read once per
+    process when it's first used, then its value is returned without calling
+    into the JVM.
     """
-    def __init__(self, cls, name, signature):
+    def __init__(self, cls, name, signature, constant=False):
+        """
+        :param cls: a JClass wrapper subclass
+        :param name: the name of the field.
+        :param signature: the Java signature of the field
+        :param constant: True if the field is a constant
+        """
+        if constant and signature[0] in 'L[' and signature != 'Ljava/lang/String;':
+            raise ValueError("constant field {} isn't a primitive or string".format(name))
         super(JStaticField, self).__init__(cls, name, signature)
-        try:
-            self.fid = self.env.GetStaticFieldID(cls.cls, name, signature)
-            self.restype = next(py2jdbc.sig.type_signature(self.env, signature))
-        except py2jdbc.jni.JavaException as e:
-            raise self.cls.env.exception(e)
+        self.fid = self.restype = self.value = None
+        self.constant = constant
+
+    def lookup(self):
+        self.fid = self.member_id(self.env.GetStaticFieldID)
+        self.restype = next(py2jdbc.sig.type_signature(self.env, self.signature))
+        if self.constant:
+            key = (self.cls.class_name, self.name, self.signature)
+            if key not in _constants:
+                _constants[key] = self.restype.get_static(self.cls.cls, self.fid)
+            self.value = _constants[key]
 
     def get(self, cls):
+        if not self.resolved:
+            self.resolve()
+        if self.constant:
+            return self.value
         try:
             return self.restype.get_static(cls, self.fid)
         except py2jdbc.jni.JavaException as e:
             raise self.cls.env.exception(e)
 
     def set(self, cls, value):
+        if self.constant:
+            raise RuntimeError("can't set constant field {}".format(self.name))
+        if not self.resolved:
+            self.resolve()
         try:
             self.restype.set_static(cls, self.fid, value)
         except py2jdbc.jni.JavaException as e:
@@ -281,11 +407,14 @@ class JStaticMethod(JBase):
         :param cls: a JClass wrapper subclass
         :param name: the name of the method.
         :param signature: the Java signature of the method
-        :raises: RuntimeError if the method was not found.
         """
         super(JStaticMethod, self).__init__(cls, name, signature)
-        self.mid = self.env.GetStaticMethodID(self.cls.cls, name, signature)
-        self.argtypes, self.restype = py2jdbc.sig.method_signature(self.env, signature)
+        self.mid = self.argtypes = self.restype = self.stub = None
+
+    def lookup(self):
+        self.mid = self.member_id(self.env.GetStaticMethodID)
+        self.argtypes, self.restype = py2jdbc.sig.method_signature(self.env, self.signature)
+        self.stub = py2jdbc.sig.call_stub(self.env, 'call_static', self.argtypes, self.restype)
 
     def __call__(self, *args):
         """
@@ -294,14 +423,66 @@ class JStaticMethod(JBase):
         :param args: Python value arguments
         :return: the result value, or None for Void static methods.
         """
+        if not self.resolved:
+            self.resolve()
         try:
-            value = self.restype.call_static(self.cls.cls, self.mid, self.argtypes, *args)
-            self.restype.release(value)
-            return value
+            return self.stub(self.cls.cls, self.mid, *args)
         except py2jdbc.jni.JavaException as e:
             raise self.cls.env.exception(e)
 
 
+class JInstanceMethod(object):
+    """
+    Binds a method of a class wrapper to the objects of its Instance wrapper.
+
+    It's declared on the Instance class, (``close = JInstanceMethod('close')``),
+    so ``instance.close()`` calls ``instance.cls.close(instance.obj)``, without
+    every instance having to carry its own bound functions.
+
+    Instance classes created by `BindMethods` replace the declaration with the
+    plain function from `function`, which Python calls without binding anything.
+    """
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        """
+        :param name: the name of the JMethod attribute of the class wrapper
+        """
+        self.name = name
+
+    def function(self, attr):
+        """
+        Create the method function for the declaration.
+
+        :param attr: the attribute name in the Instance class
+        :return: a function calling the JMethod on the instance's object
+        """
+        name = self.name
+
+        def method(instance, *args):
+            return getattr(instance.cls, name)(instance.obj, *args)
+
+        method.__name__ = str(attr)
+        return method
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return functools.partial(getattr(instance.cls, self.name), instance.obj)
+
+
+class BindMethods(type):
+    """
+    Metaclass of the Instance wrappers, which replaces JInstanceMethod declarations
+    with plain functions when the class is created.
+    """
+    def __new__(mcs, clsname, bases, attrs):
+        for attr, value in list(attrs.items()):
+            if isinstance(value, JInstanceMethod):
+                attrs[attr] = value.function(attr)
+        return super(BindMethods, mcs).__new__(mcs, clsname, bases, attrs)
+
+
 class JClass(six.with_metaclass(Register)):
     """
     Wraps a Java class.
@@ -311,20 +492,74 @@ class JClass(six.with_metaclass(Register)):
     to describe the desired items that you want to access.
     """
     class_name = None
+    bytecode = None
 
     def __init__(self, env):
         """
         Create base of Java class instance for the current thread's local environment.
 
+        The wrapper is a per-thread view of the class: `cls` is a global reference,
+        shared by every thread, (see `find_class`).
+
         :param env: the current thread's local environment
         """
         self.env = env
         try:
-            self.cls = env.env.FindClass(self.class_name)
+            self.cls = self.find_class()
             self.env.classes[self.class_name] = self
         except py2jdbc.jni.JavaException as e:
             raise self.env.exception(e)
 
+    def find_class(self):
+        """
+        Find the class once per process, and keep a global reference to it.
+
+        If the class can't be found and the wrapper has ``bytecode``, the class
+        is defined from it instead.
+
+        :return: the global reference to the jclass
+        """
+        ref = _global_classes.get(self.class_name)
+        if ref is None:
+            with _lock:
+                ref = _global_classes.get(self.class_name)
+                if ref is None:
+                    env = self.env.env
+                    try:
+                        local = env.FindClass(self.class_name)
+                    except py2jdbc.jni.JavaException:
+                        if self.bytecode is None:
+                            raise
+                        local = self.define_class()
+                    ref = _global_classes[self.class_name] = env.NewGlobalRef(local)
+                    env.DeleteLocalRef(local)
+        return ref
+
+    def define_class(self):
+        """
+        Define the class in the JVM from the wrapper's ``bytecode``.
+
+        The class is defined in the system class loader, so it can see
+        classes on the classpath, like JDBC drivers, and later calls to
+        FindClass will find it.
+
+        :return: the jclass object pointer
+        """
+        env = self.env.env
+        loader_class = env.FindClass('java.lang.ClassLoader')
+        mid = env.GetStaticMethodID(
+            loader_class,
+            'getSystemClassLoader',
+            '()Ljava/lang/ClassLoader;'
+        )
+        loader = env.CallStaticObjectMethodA(loader_class, mid, None)
+        buf = (py2jdbc.jni.jbyte * len(self.bytecode)).from_buffer_copy(self.bytecode)
+        try:
+            return env.DefineClass(self.class_name, loader, buf, len(self.bytecode))
+        finally:
+            env.DeleteLocalRef(loader)
+            env.DeleteLocalRef(loader_class)
+
     def field(self, name, signature):
         """
         Link a JField declaration to the current class.
@@ -345,6 +580,17 @@ class JClass(six.with_metaclass(Register)):
         """
         return JStaticField(self, name, signature)
 
+    def constant(self, name, signature):
+        """
+        Link a constant JStaticField declaration, (a static final primitive
+        or string, read once), to the current class.
+
+        :param name: the static field name
+        :param signature: the static field signature
+        :return: the static field's value
+        """
+        return JStaticField(self, name, signature, constant=True)
+
     def method(self, name, signature):
         """
         Link a JMethod declaration to the current class.
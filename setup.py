@@ -25,6 +25,11 @@ It implements the DB API 2.0 specification.
     package_dir={'': '.'},
     py_modules=['py2jdbc'],
     include_package_data=True,
+    extras_require={
+        'numpy': ['numpy'],
+        'pandas': ['numpy', 'pandas'],
+        'arrow': ['pyarrow'],
+    },
     zip_safe=True,
     classifiers=[
         'Development Status :: 3 - Alpha',
@@ -0,0 +1,80 @@
+package py2jdbc;
+
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.InputStreamReader;
+import java.io.Reader;
+import java.nio.ByteBuffer;
+
+/**
+ * An InputStream over a direct ByteBuffer of Python memory, so drivers can
+ * read Python buffers and files without py2jdbc copying them into a byte[].
+ *
+ * A stream without a source reads the buffer once.  A stream with a source
+ * calls fill() each time the buffer has been read, which py2jdbc registers
+ * as a native method.  It reads the next chunk from the Python object with
+ * that source number into the buffer, returning the number of bytes, -1 at
+ * the end of the data, or -2 if reading failed.
+ */
+public class BufferInputStream extends InputStream {
+    private final ByteBuffer buffer;
+    private final long source;
+    private boolean eof;
+
+    public BufferInputStream(ByteBuffer buffer, long source) {
+        this.buffer = buffer;
+        this.source = source;
+        this.eof = source == 0;
+        if (source != 0) {
+            buffer.limit(0);
+        }
+    }
+
+    private static native int fill(long source);
+
+    private boolean ready() throws IOException {
+        while (!buffer.hasRemaining()) {
+            if (eof) {
+                return false;
+            }
+            int n = fill(source);
+            if (n < -1) {
+                throw new IOException("error reading Python source " + source);
+            }
+            if (n == -1) {
+                eof = true;
+                return false;
+            }
+            buffer.clear();
+            buffer.limit(n);
+        }
+        return true;
+    }
+
+    public int read() throws IOException {
+        return ready() ? buffer.get() & 0xff : -1;
+    }
+
+    public int read(byte[] b, int off, int len) throws IOException {
+        if (len == 0) {
+            return 0;
+        }
+        if (!ready()) {
+            return -1;
+        }
+        int n = Math.min(len, buffer.remaining());
+        buffer.get(b, off, n);
+        return n;
+    }
+
+    public int available() {
+        return buffer.remaining();
+    }
+
+    /**
+     * A Reader of the stream, for text encoded as UTF-16LE.
+     */
+    public Reader reader() throws IOException {
+        return new InputStreamReader(this, "UTF-16LE");
+    }
+}
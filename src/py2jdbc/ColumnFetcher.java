@@ -0,0 +1,225 @@
+package py2jdbc;
+
+import java.io.ByteArrayOutputStream;
+import java.io.UnsupportedEncodingException;
+import java.math.BigDecimal;
+import java.sql.ResultSet;
+import java.sql.ResultSetMetaData;
+import java.sql.SQLException;
+import java.sql.Timestamp;
+import java.util.TimeZone;
+
+/**
+ * Reads batches of rows from a ResultSet into one array per column, so
+ * py2jdbc can copy a whole column out of the JVM with a single JNI call.
+ *
+ * fetch() returns three entries per column, followed by an int[] holding
+ * the number of rows read:
+ *
+ *   values  - long[] or double[], or one byte[] of all the text values,
+ *             (encoded as UTF-8), or of all the binary values, or of all
+ *             the decimal values
+ *   offsets - int[] of end offsets into the byte[], else null
+ *   nulls   - byte[] bitmap, bit (row % 8) of byte (row / 8) set for NULL
+ *
+ * Temporal values are local wall-clock times: DATE as days since the
+ * epoch, TIME as milliseconds since midnight, TIMESTAMP as microseconds
+ * since the epoch.  DECIMAL values are unscaled to the column scale, as
+ * little-endian two's complement integers of 16 bytes, or 32 bytes if the
+ * column precision is over 38 digits, (the Arrow decimal128 and decimal256
+ * layouts), with zeros for NULL values.
+ */
+public class ColumnFetcher {
+    public static final int LONG = 0;
+    public static final int DOUBLE = 1;
+    public static final int STRING = 2;
+    public static final int BYTES = 3;
+    public static final int BOOLEAN = 4;
+    public static final int DATE = 5;
+    public static final int TIME = 6;
+    public static final int TIMESTAMP = 7;
+    public static final int DECIMAL = 8;
+
+    private static final long DAY = 86400000L;
+
+    private final ResultSet rs;
+    private final int[] kinds;
+    private final TimeZone zone;
+    private final int[] scales;
+    private final int[] widths;
+
+    public ColumnFetcher(ResultSet rs, int[] kinds) throws SQLException {
+        this.rs = rs;
+        this.kinds = kinds;
+        this.zone = TimeZone.getDefault();
+        this.scales = new int[kinds.length];
+        this.widths = new int[kinds.length];
+        ResultSetMetaData meta = null;
+        for (int c = 0; c < kinds.length; c++) {
+            if (kinds[c] == DECIMAL) {
+                if (meta == null) {
+                    meta = rs.getMetaData();
+                }
+                int precision = meta.getPrecision(c + 1);
+                scales[c] = meta.getScale(c + 1);
+                widths[c] = precision > 0 && precision <= 38 ? 16 : 32;
+            }
+        }
+    }
+
+    private static long floorDiv(long x, long y) {
+        long q = x / y;
+        return (x % y != 0 && (x < 0) != (y < 0)) ? q - 1 : q;
+    }
+
+    private long local(long millis) {
+        return millis + zone.getOffset(millis);
+    }
+
+    private static byte[] utf8(String s) throws SQLException {
+        try {
+            return s.getBytes("UTF-8");
+        } catch (UnsupportedEncodingException e) {
+            throw new SQLException(e.toString());
+        }
+    }
+
+    private static void unscaled(ByteArrayOutputStream out, BigDecimal d, int scale, int width)
+            throws SQLException {
+        byte[] b = d.setScale(scale, BigDecimal.ROUND_HALF_UP).unscaledValue().toByteArray();
+        if (b.length > width) {
+            throw new SQLException("decimal value " + d + " is out of range");
+        }
+        int sign = b[0] < 0 ? 0xff : 0;
+        for (int k = 1; k <= width; k++) {
+            out.write(k <= b.length ? (int) b[b.length - k] : sign);
+        }
+    }
+
+    public Object[] fetch(int size) throws SQLException {
+        int columns = kinds.length;
+        Object[] values = new Object[columns];
+        int[][] offsets = new int[columns][];
+        byte[][] nulls = new byte[columns][(size + 7) / 8];
+        ByteArrayOutputStream[] binary = new ByteArrayOutputStream[columns];
+        for (int c = 0; c < columns; c++) {
+            switch (kinds[c]) {
+            case DOUBLE:
+                values[c] = new double[size];
+                break;
+            case STRING:
+            case BYTES:
+                binary[c] = new ByteArrayOutputStream();
+                offsets[c] = new int[size];
+                break;
+            case DECIMAL:
+                binary[c] = new ByteArrayOutputStream(size * widths[c]);
+                break;
+            case LONG:
+            case BOOLEAN:
+            case DATE:
+            case TIME:
+            case TIMESTAMP:
+                values[c] = new long[size];
+                break;
+            default:
+                throw new SQLException("unsupported column kind " + kinds[c]);
+            }
+        }
+        int rows = 0;
+        while (rows < size && rs.next()) {
+            for (int c = 0; c < columns; c++) {
+                int i = c + 1;
+                boolean isNull;
+                switch (kinds[c]) {
+                case LONG: {
+                    ((long[]) values[c])[rows] = rs.getLong(i);
+                    isNull = rs.wasNull();
+                    break;
+                }
+                case DOUBLE: {
+                    ((double[]) values[c])[rows] = rs.getDouble(i);
+                    isNull = rs.wasNull();
+                    break;
+                }
+                case STRING: {
+                    String s = rs.getString(i);
+                    isNull = s == null;
+                    if (!isNull) {
+                        byte[] b = utf8(s);
+                        binary[c].write(b, 0, b.length);
+                    }
+                    offsets[c][rows] = binary[c].size();
+                    break;
+                }
+                case BYTES: {
+                    byte[] b = rs.getBytes(i);
+                    isNull = b == null;
+                    if (!isNull) {
+                        binary[c].write(b, 0, b.length);
+                    }
+                    offsets[c][rows] = binary[c].size();
+                    break;
+                }
+                case DECIMAL: {
+                    BigDecimal d = rs.getBigDecimal(i);
+                    isNull = d == null;
+                    if (isNull) {
+                        binary[c].write(new byte[widths[c]], 0, widths[c]);
+                    } else {
+                        unscaled(binary[c], d, scales[c], widths[c]);
+                    }
+                    break;
+                }
+                case BOOLEAN: {
+                    ((long[]) values[c])[rows] = rs.getBoolean(i) ? 1 : 0;
+                    isNull = rs.wasNull();
+                    break;
+                }
+                case DATE: {
+                    java.util.Date d = rs.getDate(i);
+                    isNull = d == null;
+                    if (!isNull) {
+                        ((long[]) values[c])[rows] = floorDiv(local(d.getTime()), DAY);
+                    }
+                    break;
+                }
+                case TIME: {
+                    java.util.Date t = rs.getTime(i);
+                    isNull = t == null;
+                    if (!isNull) {
+                        long millis = local(t.getTime());
+                        ((long[]) values[c])[rows] = millis - floorDiv(millis, DAY) * DAY;
+                    }
+                    break;
+                }
+                default: {
+                    Timestamp ts = rs.getTimestamp(i);
+                    isNull = ts == null;
+                    if (!isNull) {
+                        long seconds = floorDiv(local(ts.getTime()), 1000L);
+                        ((long[]) values[c])[rows] = seconds * 1000000L + ts.getNanos() / 1000;
+                    }
+                    break;
+                }
+                }
+                if (isNull) {
+                    nulls[c][rows >> 3] |= (byte) (1 << (rows & 7));
+                }
+            }
+            rows++;
+        }
+        Object[] result = new Object[3 * columns + 1];
+        for (int c = 0; c < columns; c++) {
+            if (binary[c] != null) {
+                result[3 * c] = binary[c].toByteArray();
+            } else {
+                result[3 * c] = values[c];
+            }
+            result[3 * c + 1] = offsets[c];
+            result[3 * c + 2] = nulls[c];
+        }
+        result[3 * columns] = new int[] {rows};
+        return result;
+    }
+}
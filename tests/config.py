@@ -67,7 +67,7 @@ path = os.path.join(LIB, 'mysql-connector-java-8.0.12.jar')
 HAS_MYSQL = os.path.exists(path)
 if os.path.exists(path):
     CLASSPATH.append(path)
-path = os.path.join(LIB, 'derby.jar')
+path = os.getenv('DERBY_JAR', os.path.join(LIB, 'derby.jar'))
 HAS_DERBY = os.path.exists(path)
 if HAS_DERBY:
     CLASSPATH.append(path)
@@ -1,10 +1,18 @@
 # -*- coding: utf8 -*-
 import datetime
+import decimal
+import io
+import mmap
 import os
 import logging
+import tempfile
+import threading
 
 import six
 import py2jdbc
+import py2jdbc.columns
+import py2jdbc.dbi
+import py2jdbc.lob
 from py2jdbc.jni import jfloat
 import pytest
 from tests.config import HAS_DERBY, MAX_INT
@@ -91,6 +99,18 @@ def test_blob():
     _test_field(3, 'blob', value, py2jdbc.BLOB, MAX_INT, MAX_INT, 0)
 
 
+def test_blob_buffers():
+    value = os.urandom(5 << 20)
+    cu.execute("delete from tests where id = 3")
+    cu.execute("insert into tests (id, name, blob_field) values (?, ?, ?)", (3, 'test_blob', memoryview(value)))
+    cu.execute("insert into tests (id, name) values (?, ?)", (21, 'test_blob'))
+    cu.execute("select blob_field from tests where id in (3, 21) order by id")
+    assert cu.fetchall() == ((value,), (None,))
+    cu.execute("update tests set blob_field = ? where id = 3", (bytearray(value[:10]),))
+    cu.execute("select blob_field from tests where id = 3")
+    assert cu.fetchone() == (value[:10],)
+
+
 def test_boolean():
     _test_field(4, 'boolean', True, py2jdbc.BOOLEAN, 5, 1, 0)
 
@@ -126,12 +146,102 @@ def test_clob():
     _test_field(6, 'clob', CLOB, py2jdbc.CLOB, MAX_INT, MAX_INT, 0)
 
 
+def test_lob_readers():
+    blob = os.urandom(5000)
+    clob = u'line one\nline two \U0001f600\n' * 200
+    cu.execute("delete from tests where id >= 22")
+    cu.execute("insert into tests (id, name, blob_field, clob_field) values (?, ?, ?, ?)",
+               (22, 'test_lob_readers', blob, clob))
+    cu.execute("insert into tests (id, name, blob_field, clob_field) values (?, ?, ?, ?)",
+               (23, 'test_lob_readers', b'small', u'small'))
+    cu.execute("insert into tests (id, name) values (?, ?)", (24, 'test_lob_readers'))
+    cu.execute("select blob_field, clob_field from tests where id >= 22 order by id")
+    cu.setoutputsize(100)
+    b, c = cu.fetchone()
+    assert isinstance(b, io.RawIOBase) and isinstance(c, io.TextIOBase)
+    assert len(b) == len(blob) and b.read(10) == blob[:10] and b.tell() == 10
+    b.seek(-5, io.SEEK_END)
+    assert b.read() == blob[-5:]
+    b.seek(0)
+    b.chunksize = 1024
+    buf = bytearray(4096)
+    assert b.readinto(buf) == 1024 and bytes(buf[:1024]) == blob[:1024]
+    assert b.read() == blob[1024:]
+    c.chunksize = 7
+    assert c.readline() == u'line one\n' and c.tell() == 9
+    assert c.readline() == u'line two \U0001f600\n'
+    c.seek(0)
+    assert c.read() == clob and c.tell() == len(c)
+    b.close()
+    c.close()
+    assert cu.fetchall() == ((b'small', u'small'), (None, None))
+
+
+def test_lob_reader_other_thread(monkeypatch):
+    freed = []
+    cu.setoutputsize(100)
+    cu.execute("select blob_field from tests where id = 22")
+    reader, = cu.fetchone()
+    lob = reader.lob
+    monkeypatch.setattr(type(lob), 'free', lambda self: freed.append(self))
+    thread = threading.Thread(target=reader.close)
+    thread.start()
+    thread.join()
+    assert reader.closed and not freed
+    assert lob.obj is None and not lob.kept
+    cu.execute("select blob_field from tests where id = 22")
+    reader, = cu.fetchone()
+    reader.close()
+    assert len(freed) == 1
+
+
+def test_lob_streams():
+    blob = os.urandom(200000)
+    clob = u'line one\nline two \U0001f600\n' * 10000
+    path = os.path.join(tempfile.mkdtemp(), 'blob')
+    with open(path, 'wb') as f:
+        f.write(blob)
+    cu.execute("delete from tests where id >= 22")
+    sql = "insert into tests (id, name, blob_field, clob_field) values (?, ?, ?, ?)"
+    cu.execute(sql, (22, 'test_lob_streams', io.BytesIO(blob), io.StringIO(clob)))
+    cu.execute(sql, (23, 'test_lob_streams', memoryview(blob), u''))
+    cu.execute(sql, (24, 'test_lob_streams', memoryview(bytearray(blob)), io.StringIO()))
+    with open(path, 'rb') as f:
+        f.seek(100)
+        cu.execute(sql, (25, 'test_lob_streams', f, u''))
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        cu.executemany(sql, [(26, 'test_lob_streams', m, u'')])
+        m.close()
+    cu2 = cx.cursor()
+    cu2.execute("select id, blob_field, clob_field from tests where id >= 22 order by id")
+    assert cu2.fetchall() == (
+        (22, blob, clob),
+        (23, blob, u''),
+        (24, blob, u''),
+        (25, blob[100:], u''),
+        (26, blob, u''),
+    )
+    assert not py2jdbc.lob._sources
+
+
 def test_date():
     _test_field(7, 'date', datetime.date(2014, 7, 14), py2jdbc.DATE, 10, 10, 0)
 
 
 def test_decimal():
-    _test_field(8, 'decimal', 12345.67871, py2jdbc.DECIMAL, 12, 10, 5)
+    _test_field(8, 'decimal', decimal.Decimal('12345.67871'), py2jdbc.DECIMAL, 12, 10, 5)
+
+
+def test_decimal_precision():
+    cu.execute(
+        "select cast(? as decimal(31, 10)), cast(? as decimal(18, 0)),"
+        " cast(null as decimal(31, 10)) from tests where id = 1",
+        (decimal.Decimal('-123456789012345678901.0123456789'), 123456789012345678)
+    )
+    row = cu.fetchone()
+    assert row == (decimal.Decimal('-123456789012345678901.0123456789'),
+                   decimal.Decimal(123456789012345678), None)
+    assert row[0].as_tuple().exponent == -10
 
 
 def test_double():
@@ -151,7 +261,7 @@ def test_long_varchar():
 
 
 def test_numeric():
-    _test_field(13, 'numeric', 564.342, py2jdbc.NUMERIC, 12, 10, 5)
+    _test_field(13, 'numeric', decimal.Decimal('-564.34200'), py2jdbc.NUMERIC, 12, 10, 5)
 
 
 def test_real():
@@ -171,6 +281,26 @@ def test_timestamp():
     _test_field(17, 'timestamp', _now, py2jdbc.TIMESTAMP, 29, 29, 9)
 
 
+def test_temporal_literals():
+    cu.execute(
+        "select date('2014-07-14') = ?, time('07:08:09') = ?,"
+        " timestamp('2014-07-14 07:08:09.123456') = ?,"
+        " date('2014-07-14'), timestamp('2014-07-14 07:08:09.123456')"
+        " from tests where id = 1",
+        (datetime.date(2014, 7, 14), datetime.time(7, 8, 9),
+         datetime.datetime(2014, 7, 14, 7, 8, 9, 123456))
+    )
+    assert cu.fetchone() == (True, True, True, datetime.date(2014, 7, 14),
+                             datetime.datetime(2014, 7, 14, 7, 8, 9, 123456))
+
+
+def test_unicode():
+    value = u'夢fooÞbar印 \U0001f600'
+    cu.execute("select cast(? as varchar(20)), length(cast(? as varchar(20))) from tests where id = 1",
+               (value, value))
+    assert cu.fetchone() == (value, len(value.encode('utf-16-le')) // 2)
+
+
 def test_varchar():
     _test_field(18, 'varchar', 'this is a varchar', py2jdbc.VARCHAR, 50, 50, 0)
 
@@ -182,8 +312,11 @@ def test_execute_no_args():
 
 def test_execute_illegal_sql():
     global cu
-    with pytest.raises(py2jdbc.OperationalError):
+    with pytest.raises(py2jdbc.OperationalError) as excinfo:
         cu.execute("select asdf")
+    assert excinfo.value.sqlstate.startswith('42')
+    assert not hasattr(excinfo.value.cause, '_message')
+    assert 'Syntax error' in str(excinfo.value)
 
 
 def test_execute_too_much_sql2():
@@ -423,6 +556,212 @@ def test_fetchall():
     assert res == tuple()
 
 
+def test_fetch_nulls():
+    global cu
+    cu.execute("delete from tests")
+    cu.execute("insert into tests(id, name, integer_field, date_field)"
+               " values (?, ?, ?, ?)",
+               (19, 'test_fetch_nulls', 42, datetime.date(2018, 2, 3)))
+    cu.execute("insert into tests(id, name) values (20, 'test_fetch_nulls')")
+    cu.execute("select id, integer_field, date_field from tests order by id")
+    assert cu.fetchone() == (19, 42, datetime.date(2018, 2, 3))
+    decoder = cu._decoder
+    assert cu.fetchall() == ((20, None, None),)
+    assert cu._decoder is decoder
+    cu.execute("select name from tests order by id")
+    assert cu._decoder is None
+    assert cu.fetchmany(1) == (('test_fetch_nulls',),)
+
+
+def test_fetch_columns():
+    global cu
+    cu.execute("delete from tests")
+    cu.execute("insert into tests(id, name, double_field, date_field, timestamp_field)"
+               " values (21, 'test_fetch_columns', 1.5, '2018-02-03', '2018-02-03 04:05:06.789')")
+    cu.execute("insert into tests(id, name) values (22, '')")
+    cu.execute("select id, name, double_field, date_field, timestamp_field"
+               " from tests order by id")
+    ids, names, doubles, dates, timestamps = cu.fetch_columns(1)
+    assert list(ids.values) == [21]
+    assert names.values == ['test_fetch_columns']
+    assert list(doubles.values) == [1.5]
+    epoch = datetime.datetime(1970, 1, 1)
+    assert list(dates.values) == [(datetime.datetime(2018, 2, 3) - epoch).days]
+    delta = datetime.datetime(2018, 2, 3, 4, 5, 6, 789000) - epoch
+    assert list(timestamps.values) == [
+        (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+    ]
+    assert not any(py2jdbc.columns.is_null(col.nulls, 0) for col in (ids, names, doubles))
+    columns = cu.fetch_columns()
+    assert [py2jdbc.columns.is_null(col.nulls, 0) for col in columns] == [
+        False, False, True, True, True
+    ]
+    assert columns[1].values == ['']
+    assert all(len(col.values) == 0 for col in cu.fetch_columns())
+    cu.execute("select cast(? as decimal(31, 10)), cast(null as decimal(10, 5))"
+               " from tests where id = 21", (decimal.Decimal('-0.0000000001'),))
+    decimals, nulls = cu.fetch_columns()
+    assert decimals.values == [decimal.Decimal('-0.0000000001')]
+    assert nulls.values == [None] and py2jdbc.columns.is_null(nulls.nulls, 0)
+
+
+def test_fetchnumpy():
+    numpy = pytest.importorskip('numpy')
+    cu.execute("delete from tests")
+    cu.execute("insert into tests(id, name, integer_field, timestamp_field)"
+               " values (23, 'test_fetchnumpy', 42, '2018-02-03 04:05:06.789')")
+    cu.execute("insert into tests(id, name) values (24, 'test_fetchnumpy')")
+    cu.execute("select id, name, integer_field, timestamp_field from tests order by id")
+    arrays = cu.fetchnumpy()
+    assert list(arrays) == ['ID', 'NAME', 'INTEGER_FIELD', 'TIMESTAMP_FIELD']
+    assert arrays['ID'].dtype == numpy.int32
+    assert arrays['ID'].tolist() == [23, 24]
+    assert arrays['NAME'].tolist() == ['test_fetchnumpy', 'test_fetchnumpy']
+    assert arrays['INTEGER_FIELD'].tolist() == [42, None]
+    assert arrays['TIMESTAMP_FIELD'][0] == numpy.datetime64('2018-02-03T04:05:06.789')
+    assert numpy.isnat(arrays['TIMESTAMP_FIELD'][1])
+    assert len(cu.fetchnumpy()['ID']) == 0
+
+
+def test_fetch_dataframe():
+    pytest.importorskip('pandas')
+    cu.execute("select id, integer_field from tests order by id")
+    frame = cu.fetch_dataframe()
+    assert list(frame.columns) == ['ID', 'INTEGER_FIELD']
+    assert frame['ID'].tolist() == [23, 24]
+    assert str(frame['INTEGER_FIELD'].dtype) == 'Int32'
+    cu.execute("select id from tests order by id")
+    assert [len(frame) for frame in cu.iter_dataframes(1)] == [1, 1]
+
+
+def test_fetch_arrow():
+    pa = pytest.importorskip('pyarrow')
+    cu.execute("select id, name, integer_field, decimal_field, timestamp_field"
+               " from tests order by id")
+    batches = list(cu.fetch_arrow_batches(1))
+    assert [batch.num_rows for batch in batches] == [1, 1]
+    schema = batches[0].schema
+    assert schema.names == ['ID', 'NAME', 'INTEGER_FIELD', 'DECIMAL_FIELD', 'TIMESTAMP_FIELD']
+    assert schema.field('ID').type == pa.int32()
+    assert not schema.field('ID').nullable
+    assert schema.field('DECIMAL_FIELD').type == pa.decimal128(10, 5)
+    assert schema.field('TIMESTAMP_FIELD').type == pa.timestamp('us')
+    cu.execute("select id, name, integer_field from tests order by id")
+    table = cu.fetch_arrow_table()
+    assert table.to_pydict() == {
+        'ID': [23, 24],
+        'NAME': ['test_fetchnumpy', 'test_fetchnumpy'],
+        'INTEGER_FIELD': [42, None],
+    }
+    cu.execute("select cast(? as decimal(31, 10)), cast(null as numeric(10, 5))"
+               " from tests where id = 23",
+               (decimal.Decimal('-123456789012345678901.0123456789'),))
+    table = cu.fetch_arrow_table()
+    assert table.schema.types == [pa.decimal128(31, 10), pa.decimal128(10, 5)]
+    assert table.column(0).to_pylist() == [decimal.Decimal('-123456789012345678901.0123456789')]
+    assert table.column(1).to_pylist() == [None]
+
+
+def test_prefetch():
+    cu.execute("delete from tests")
+    cu.executemany("insert into tests(id, name) values (?, ?)",
+                   [(i, 'test_prefetch') for i in range(25, 32)])
+    with cx.cursor(prefetch=2) as pc:
+        pc.arraysize = 2
+        pc.execute("select id from tests order by id")
+        assert pc.fetchone() == (25,)
+        assert pc.fetchmany(3) == ((26,), (27,), (28,))
+        assert pc.fetchall() == ((29,), (30,), (31,))
+        assert pc.fetchone() is None
+        pc.execute("select id from tests order by id")
+        assert [len(rows) for rows in pc.iter_batches(3)] == [3, 3, 1]
+        pc.execute("select id from tests order by id")
+        assert pc.fetchone() == (25,)
+        with pytest.raises(py2jdbc.NotSupportedError):
+            pc.fetch_columns()
+        pc.execute("select id / (id - 27) from tests where id >= 25 order by id")
+        with pytest.raises(py2jdbc.DatabaseError) as e:
+            pc.fetchall()
+        assert e.value.sqlstate == '22012' and 'divide by zero' in str(e.value)
+    assert pc._prefetcher is None
+
+
+def test_maxrows():
+    cu.execute("delete from tests")
+    cu.executemany("insert into tests(id, name) values (?, ?)",
+                   [(i, 'test_maxrows') for i in range(32, 37)])
+    with cx.cursor() as mc:
+        mc.arraysize = 2
+        mc.maxrows = 3
+        mc.execute("select id from tests order by id")
+        assert mc.fetchall() == ((32,), (33,), (34,))
+        mc.maxrows = MAX_INT + 1
+        mc.execute("select id from tests order by id")
+        assert len(mc.fetchall()) == 5
+        mc.maxrows = -1
+        with pytest.raises(py2jdbc.ProgrammingError):
+            mc.execute("select id from tests order by id")
+
+
+def test_statement_cache():
+    cu.execute("delete from tests")
+    cu.executemany("insert into tests(id, name) values (?, ?)",
+                   [(i, 'test_statement_cache') for i in range(40, 45)])
+    with py2jdbc.connect('jdbc:derby:py2jdbc_derby', statement_cache_size=2) as sc:
+        cache = sc.statement_cache
+        c1, c2 = sc.cursor(), sc.cursor()
+        query = "select id from tests where id >= ? order by id"
+        c1.maxrows = 2
+        c1.execute(query, (40,))
+        c2.execute(query, (43,))
+        assert (cache.hits, cache.misses, len(cache)) == (0, 2, 0)
+        assert c1.fetchall() == ((40,), (41,)) and c2.fetchall() == ((43,), (44,))
+        c1.execute("select count(*) from tests")
+        c2.execute(query, (42,))
+        assert (cache.hits, cache.misses) == (1, 3) and query not in cache
+        assert c2.fetchall() == ((42,), (43,), (44,))
+        c1.execute("update tests set name = ? where id = ?", ('cached', 40))
+        c1.execute("update tests set name = ? where id = ?", ('cached', 41))
+        assert (cache.hits, cache.misses) == (2, 4) and c1.rowcount == 1
+        c1.close()
+        c2.close()
+        assert len(cache) == 2 and query in cache
+        assert "select count(*) from tests" not in cache
+    assert len(cache) == 0
+    cu.execute("select id from tests where name = 'cached' order by id")
+    assert cu.fetchall() == ((40,), (41,))
+
+
+def test_execute_bad_parameter(monkeypatch):
+    closed = []
+    close_statement = py2jdbc.dbi._close_statement
+    monkeypatch.setattr(py2jdbc.dbi, '_close_statement',
+                        lambda stmt: closed.append(stmt) or close_statement(stmt))
+    with pytest.raises(RuntimeError):
+        cu.execute("select id from tests where id = ? and name = ?", (1, object()))
+    assert len(closed) == 1
+    cu.execute("select count(*) from tests where id = ?", (-1,))
+    assert cu.fetchall() == ((0,),)
+
+
+def test_local_frames():
+    cu.execute("delete from tests")
+    cu.executemany("insert into tests(id, name, varchar_field) values (?, ?, ?)",
+                   [(i, 'test_local_frames', str(i)) for i in range(50, 70)])
+    query = "select id, varchar_field from tests where id >= ? order by id"
+    cu.arraysize = 3
+    cu.execute(query, (50,))
+    assert cu.fetchone() == (50, '50')
+    assert len(cu.fetchmany()) == 3
+    assert cu.fetchall() == tuple((i, str(i)) for i in range(54, 70))
+    cu.arraysize = 1
+    cu.execute("select id / (id - 60) from tests where id >= ? order by id", (58,))
+    with pytest.raises(py2jdbc.DatabaseError) as e:
+        cu.fetchall()
+    assert e.value.sqlstate == '22012'
+    assert 'divide by zero' in str(e.value)
+
+
 def test_cursor_connection():
     global cx, cu
     assert cu.connection == cx
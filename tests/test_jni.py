@@ -1,5 +1,6 @@
 # -*- coding: utf8 -*-
 import random
+import time
 import six
 from ctypes import byref, string_at
 import logging
@@ -251,6 +252,17 @@ def test_utf():
     _utf('夢fooÞbar印')
 
 
+def test_python_string():
+    for src in (u'', u'abc\0foo', u'夢fooÞbar印', u'\U0001f600 \U0010ffff', u'x' * 1000,
+                u'y' * (py2jdbc.jni.STRING_BUFFER_SIZE + 1)):
+        s = py2jdbc.jni.new_string(_env, src)
+        assert _env.GetStringLength(s) == len(src.encode('utf-16-le')) // 2
+        assert py2jdbc.jni.get_string(_env, s) == src
+        _env.DeleteLocalRef(s)
+    # longer strings don't grow the reused buffer
+    assert len(py2jdbc.jni._chars.buf) <= py2jdbc.jni.STRING_BUFFER_SIZE
+
+
 def test_boolean_array():
     count = random.randint(0, 9)
     data = [random.choice((False, True)) for _ in range(count)]
@@ -823,3 +835,33 @@ def test_get_class_name():
     assert py2jdbc.jni.get_class_name(_env, obj) == 'java.lang.Integer'
     _env.DeleteLocalRef(obj)
     _env.DeleteLocalRef(cls)
+
+
+def test_dispatch():
+    assert _env.dispatch is py2jdbc.jni.get_dispatch(_env.functions)
+    assert _env.ExceptionCheck() == py2jdbc.jni.JNI_FALSE
+    cls = _env.FindClass('java.lang.Integer')
+    cons = _env.GetMethodID(cls, '<init>', '(I)V')
+    args = py2jdbc.jni.jvalue.__mul__(1)()
+    args[0].i = 42
+    obj = _env.NewObjectA(cls, cons, args)
+    mid = _env.GetMethodID(cls, 'intValue', '()I')
+    fid = _env.GetFieldID(cls, 'value', 'I')
+    # micro-benchmark of JNI round trips
+    count = 10000
+    start = time.time()
+    for _ in range(count):
+        _env.CallIntMethodA(obj, mid, args)
+    call_time = time.time() - start
+    start = time.time()
+    for _ in range(count):
+        _env.GetIntField(obj, fid)
+    field_time = time.time() - start
+    log.info(
+        'CallIntMethodA %.2fus, GetIntField %.2fus',
+        call_time / count * 1e6,
+        field_time / count * 1e6
+    )
+    assert _env.CallIntMethodA(obj, mid, args) == _env.GetIntField(obj, fid) == 42
+    _env.DeleteLocalRef(obj)
+    _env.DeleteLocalRef(cls)
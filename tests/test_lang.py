@@ -1,8 +1,11 @@
 # -*- coding: utf8 -*-
+import gc
 import logging
+import threading
 import six
 import pytest
-from py2jdbc.jni import jdouble, jobject
+import py2jdbc.lang
+from py2jdbc.jni import jdouble, jobject, jobjectType
 from py2jdbc.wrap import get_env
 from py2jdbc.lang import (
     Boolean,
@@ -42,6 +45,51 @@ def test_object():
     assert obj2.toString().startswith('java.lang.Object@')
     assert obj1 != obj2
     assert obj1.hashCode() != obj2.hashCode()
+    assert not hasattr(obj1, '__dict__')
+    assert not hasattr(_env.get('java.lang.Boolean').new('true'), '__dict__')
+
+
+def test_keep_release():
+    global _env
+    cls = _env.get('java.lang.Object')
+    env = _env.env
+    obj = cls.new().keep()
+    assert env.GetObjectRefType(obj.obj) == jobjectType.JNIGlobalRefType
+    assert obj.keep() is obj and obj.toString().startswith('java.lang.Object@')
+    kept = len(py2jdbc.lang._kept)
+    with obj:
+        pass
+    assert obj.obj is None and len(py2jdbc.lang._kept) == kept - 1
+    obj = cls.new().keep()
+    assert len(py2jdbc.lang._kept) == kept
+    del obj
+    gc.collect()
+    assert len(py2jdbc.lang._kept) == kept - 1
+    obj = cls.new()
+    assert env.GetObjectRefType(obj.obj) == jobjectType.JNILocalRefType
+    obj.release()
+    assert obj.obj is None
+
+
+def test_release_unattached():
+    global _env
+    cls = _env.get('java.lang.Object')
+    objs = [cls.new().keep()]
+    kept = len(py2jdbc.lang._kept)
+    attached = []
+
+    def drop():
+        del objs[:]
+        gc.collect()
+        attached.append(py2jdbc.jni.attached_env())
+
+    thread = threading.Thread(target=drop)
+    thread.start()
+    thread.join()
+    assert attached == [None]
+    assert len(py2jdbc.lang._kept) == kept - 1 and len(py2jdbc.lang._dropped) == 1
+    cls.new().keep().release()
+    assert not py2jdbc.lang._dropped
 
 
 def test_boolean():
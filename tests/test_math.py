@@ -1,4 +1,5 @@
 # -*- coding: utf8 -*-
+import decimal
 import logging
 from py2jdbc.wrap import get_env
 from py2jdbc.math import BigDecimal
@@ -26,3 +27,14 @@ def test_big_decimal():
     assert int(obj) == 123
     assert float(obj) == 123.567
     assert cls.new('-123').abs() == cls.new(123)
+
+
+def test_big_decimal_python():
+    cls = _env.get('java.math.BigDecimal')
+    for text in ('0', '-1.50', '123.567', '1E+5', '-98765432109876543210.0123456789'):
+        value = decimal.Decimal(text)
+        obj = cls.from_python(value)
+        assert str(obj) == str(cls.new(text))
+        result = obj.to_python()
+        assert result == value
+        assert result.as_tuple().exponent == value.as_tuple().exponent
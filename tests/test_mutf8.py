@@ -1,4 +1,6 @@
 # -*- coding: utf8 -*-
+import codecs
+import io
 import six
 from py2jdbc.mutf8 import (
     mutf8_encode,
@@ -202,3 +204,38 @@ def test_errors():
             mutf8_encode(mutf8_unichr(0x100000), errors='backslashreplace') ==
             six.b('\\U00100000')
         )
+
+
+def test_hangul():
+    # 3-byte sequences starting with 0xed, which aren't surrogates
+    for a, b in _pairs((0xd000, (0xed, 0x80, 0x80)), (0xd7a3, (0xed, 0x9e, 0xa3))):
+        assert mutf8_encode(a) == b
+        assert mutf8_decode(b) == a
+
+
+def _chunks(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_incremental():
+    text = six.u('abc\u0000\u00de\u5922') + mutf8_unichr(0x1f600) + six.u('\ud55c xyz')
+    data = mutf8_encode(text)
+    for size in range(1, 8):
+        decoder = codecs.getincrementaldecoder('mutf8')()
+        result = six.u('').join(decoder.decode(chunk) for chunk in _chunks(data, size))
+        assert result + decoder.decode(six.b(''), final=True) == text
+        encoder = codecs.getincrementalencoder('mutf8')()
+        result = six.b('').join(encoder.encode(chunk) for chunk in _chunks(text, size))
+        assert result + encoder.encode(six.u(''), final=True) == data
+    decoder = codecs.getincrementaldecoder('mutf8')()
+    assert decoder.decode(six.b('ab\xc0')) == six.u('ab')
+    with pytest.raises(UnicodeDecodeError):
+        decoder.decode(six.b(''), final=True)
+
+
+def test_stream_reader():
+    text = six.u('line 1 \u5922\nline 2 ') + mutf8_unichr(0x1f600) + six.u('\n')
+    reader = codecs.getreader('mutf8')(io.BytesIO(mutf8_encode(text)))
+    assert reader.read(3) == six.u('lin')
+    assert reader.readline() == six.u('e 1 \u5922\n')
+    assert reader.read() == six.u('line 2 ') + mutf8_unichr(0x1f600) + six.u('\n')
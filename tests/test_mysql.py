@@ -1,5 +1,6 @@
 # -*- coding: utf8 -*-
 import datetime
+import decimal
 import os
 from getpass import getuser
 import logging
@@ -112,7 +113,7 @@ def test_bigint():
 
 
 def test_decimal():
-    _test_field(9, 'decimal', 12345.67871, py2jdbc.DECIMAL, 12, 10, 5)
+    _test_field(9, 'decimal', decimal.Decimal('12345.67871'), py2jdbc.DECIMAL, 12, 10, 5)
 
 
 def test_float():
@@ -1,9 +1,11 @@
 # -*- coding: utf8 -*-
+import array
 import os
 import random
 import six
 from ctypes import c_float, c_double
 import logging
+import pytest
 import py2jdbc.jni
 import py2jdbc.sig
 from tests.config import (
@@ -334,6 +336,32 @@ def test_double_array():
     _env.DeleteLocalRef(ja)
 
 
+def test_array_buffers():
+    ia = next(py2jdbc.sig.type_signature(_env, '[I'))
+    a = array.array('i', range(-5, 5))
+    ja = ia.py2j(a)
+    assert ia.j2py(ja) == a.tolist()
+    assert ia.j2py_array(ja) == a
+    buf = array.array('i', [0] * 4)
+    assert ia.j2py_into(ja, buf, 8) == 2
+    assert buf.tolist() == [3, 4, 0, 0]
+    j2 = ia.py2j(memoryview(a)[2:4])
+    assert ia.j2py(j2) == [-3, -2]
+    with pytest.raises(TypeError):
+        ia.j2py_into(ja, bytes(16))
+    ba = next(py2jdbc.sig.type_signature(_env, '[B'))
+    j3 = ba.py2j(a)
+    assert ba.j2py(j3) == a.tobytes()
+    buf = bytearray(8)
+    assert ba.j2py_into(j3, memoryview(buf)[4:]) == 4
+    assert bytes(buf[4:]) == a.tobytes()[:4]
+    assert ba.j2py(ba.py2j(bytearray(b'\x00\xff'))) == b'\x00\xff'
+    assert ba.j2py(ba.py2j(b'')) == b''
+    assert ba.j2py(None) is None
+    for j in (ja, j2, j3):
+        _env.DeleteLocalRef(j)
+
+
 def test_system():
     cls = _env.FindClass('java.lang.System')
     signature = '(Ljava/lang/String;)Ljava/lang/String;'
@@ -366,6 +394,84 @@ def test_class():
     _env.DeleteLocalRef(cls)
 
 
+def test_call_stub():
+    cls = _env.FindClass('java.lang.String')
+    mid1 = _env.GetStaticMethodID(cls, 'valueOf', '(Ljava/lang/Object;)Ljava/lang/String;')
+    # declared with a String argument, so Python strings are converted
+    argtypes, restype = py2jdbc.sig.method_signature(_env, '(Ljava/lang/String;)Ljava/lang/String;')
+    stub = py2jdbc.sig.call_stub(_env, 'call_static', argtypes, restype)
+    assert stub(cls, mid1, u'caf\xe9') == u'caf\xe9'
+    assert stub(cls, mid1, None) == 'null'
+    with pytest.raises(TypeError):
+        stub(cls, mid1)
+    signature = '(II)Ljava/lang/String;'
+    mid2 = _env.GetMethodID(cls, 'substring', signature)
+    argtypes, restype = py2jdbc.sig.method_signature(_env, signature)
+    stub = py2jdbc.sig.call_stub(_env, 'call', argtypes, restype)
+    obj = py2jdbc.jni.new_string(_env, 'abcdef')
+    assert stub(obj, mid2, 1, 3) == 'bc'
+    assert stub(obj, mid2, 2, 6.0) == 'cdef'
+    mid3 = _env.GetMethodID(cls, 'equals', '(Ljava/lang/Object;)Z')
+    argtypes, restype = py2jdbc.sig.method_signature(_env, '(Ljava/lang/Object;)Z')
+    stub = py2jdbc.sig.call_stub(_env, 'call', argtypes, restype)
+    assert stub(obj, mid3, obj) is True
+    assert stub(obj, mid3, None) is False
+    signature = '([C)V'
+    mid4 = _env.GetMethodID(cls, '<init>', signature)
+    argtypes, restype = py2jdbc.sig.constructor_signature(_env, 'java.lang.String', '[C')
+    stub = py2jdbc.sig.call_stub(_env, 'new', argtypes, restype)
+    obj2 = stub(cls, mid4, u'xyz')
+    assert py2jdbc.jni.get_string(_env, obj2) == 'xyz'
+    for ref in (obj, obj2, cls):
+        _env.DeleteLocalRef(ref)
+
+
+def test_call_stub_bad_argument(monkeypatch):
+    cls = _env.FindClass('java.lang.String')
+    signature = '(Ljava/lang/String;I)I'
+    mid = _env.GetMethodID(cls, 'indexOf', signature)
+    argtypes, restype = py2jdbc.sig.method_signature(_env, signature)
+    stub = py2jdbc.sig.call_stub(_env, 'call', argtypes, restype)
+    obj = py2jdbc.jni.new_string(_env, 'abcabc')
+    assert stub(obj, mid, 'c', 3) == 5
+    created = []
+    deleted = []
+
+    def new_string(env, value):
+        created.append(py2jdbc.jni.new_string(env, value))
+        return created[-1]
+
+    def delete_local_ref(ref):
+        deleted.append(ref)
+        py2jdbc.jni.JNIEnv.DeleteLocalRef(_env, ref)
+
+    monkeypatch.setitem(stub.__globals__, 'new_string', new_string)
+    monkeypatch.setattr(_env, 'DeleteLocalRef', delete_local_ref)
+    with pytest.raises(TypeError):
+        stub(obj, mid, 'c', None)
+    assert len(created) == 1 and deleted == created
+    monkeypatch.undo()
+    for ref in (obj, cls):
+        _env.DeleteLocalRef(ref)
+
+
+def test_signature_cache():
+    argtypes1, restype1 = py2jdbc.sig.method_signature(_env, '(Ljava/lang/String;I)Ljava/lang/String;')
+    argtypes2, restype2 = py2jdbc.sig.method_signature(_env, '(ILjava/lang/String;)V')
+    assert argtypes1[0] is restype1 is argtypes2[1]
+    assert argtypes1[1] is argtypes2[0]
+    assert py2jdbc.sig.method_signature(_env, '(ILjava/lang/String;)V') == (argtypes2, restype2)
+    sa = next(py2jdbc.sig.type_signature(_env, '[Ljava/lang/String;'))
+    assert sa is next(py2jdbc.sig.type_signature(_env, '[Ljava/lang/String;'))
+    j = sa.py2j(['a', 'b'])
+    assert sa.j2py(j) == ['a', 'b']
+    sa.release(j)
+    s = restype1
+    s.release(s.py2j('x'))
+    s.release(s.py2j(None))
+    assert not hasattr(s, '_release')
+
+
 def test_drivermanager():
     cls = _env.FindClass('java.sql.DriverManager')
     signature = '(Ljava/lang/String;)Ljava/sql/Connection;'
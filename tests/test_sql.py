@@ -23,7 +23,7 @@ def test_date():
     cal = _env.get('java.util.Calendar').getInstance()
     cal.setTime(obj.obj)
     assert cal.YEAR == today.year
-    assert cal.MONTH == today.month
+    assert cal.MONTH == today.month - 1     # Calendar months start from 0
     assert cal.DAY_OF_MONTH == today.day
 
 
@@ -62,6 +62,19 @@ def test_timestamp():
     assert ts == ts2
 
 
+def test_timestamp_micros():
+    cls = _env.get('java.sql.Timestamp')
+    for ts in (
+        datetime.datetime(2018, 3, 11, 1, 59, 59, 999999),
+        datetime.datetime(2018, 7, 4, 12, 30, 15, 123456),
+        datetime.datetime(1960, 12, 31, 23, 59, 59, 1),
+    ):
+        obj = cls.from_python(ts)
+        assert obj.getNanos() == ts.microsecond * 1000
+        assert obj.to_python() == ts
+    assert str(cls.from_python(datetime.datetime(2018, 7, 4, 12, 30, 15))) == '2018-07-04 12:30:15.0'
+
+
 def test_drivermanager():
     cls = _env.get('java.sql.DriverManager')
     conn = cls.getConnection('jdbc:sqlite::memory:')
@@ -45,5 +45,47 @@ def test_date():
     cal = _env.get('java.util.GregorianCalendar').new()
     cal.setTime(obj.obj)
     assert cal.YEAR == today.year
-    assert cal.MONTH == today.month
+    assert cal.MONTH == today.month - 1     # Calendar months start from 0
     assert cal.DAY_OF_MONTH == today.day
+
+
+def test_zone_transitions():
+    zones = _env.get('java.util.TimeZone')
+    default = zones.getDefault()
+    zones.setDefault(zones.getTimeZone('America/New_York'))
+    try:
+        cls = _env.get('java.sql.Timestamp')
+        cal = _env.get('java.util.GregorianCalendar')
+        for value in (
+            datetime.datetime(2020, 3, 8, 2, 30),   # in the DST gap
+            datetime.datetime(2020, 11, 1, 1, 30),  # repeated when DST ends
+            datetime.datetime(2020, 7, 4, 12, 0),
+            datetime.datetime(1582, 10, 4, 23, 0),  # the last Julian day
+            datetime.datetime(1500, 3, 1, 12, 0),
+        ):
+            millis = cal.new(
+                value.year, value.month - 1, value.day, value.hour, value.minute, 0
+            ).getTimeInMillis()
+            assert cls.from_python(value).getTime() == millis
+        gap = cls.from_python(datetime.datetime(2020, 3, 8, 2, 30))
+        assert gap.to_python() == datetime.datetime(2020, 3, 8, 3, 30)
+        dates = _env.get('java.sql.Date')
+        for value in (datetime.date(1500, 3, 1), datetime.date(1582, 10, 4)):
+            assert dates.from_python(value).to_python() == value
+            assert dates(dates.valueOf(value.isoformat())).to_python() == value
+    finally:
+        zones.setDefault(default)
+
+
+def test_zone_change_dates():
+    zones = _env.get('java.util.TimeZone')
+    default = zones.getDefault()
+    zones.setDefault(zones.getTimeZone('UTC'))
+    try:
+        for cls in (_env.get('java.util.Date'), _env.get('java.sql.Date')):
+            assert cls.new(0).to_python() == datetime.date(1970, 1, 1)
+        zones.setDefault(zones.getTimeZone('America/Los_Angeles'))
+        for cls in (_env.get('java.util.Date'), _env.get('java.sql.Date')):
+            assert cls.new(0).to_python() == datetime.date(1969, 12, 31)
+    finally:
+        zones.setDefault(default)
@@ -1,10 +1,14 @@
 # -*- coding: utf8 -*-
 import logging
+import threading
+import types
+import pytest
 import six
+from py2jdbc.exc import OperationalError
 from py2jdbc.jni import JNI_FALSE, jfloat, jdouble
-from py2jdbc.wrap import get_env
-from py2jdbc.lang import Object, ArgumentError
-from tests.config import JAVA_OPTS, FIELDS, STATIC_FIELDS
+from py2jdbc.wrap import ThreadEnv, detach_thread, get_env
+from py2jdbc.lang import Object, Throwable, ArgumentError
+from tests.config import JAVA_OPTS, FIELDS, MAX_INT, STATIC_FIELDS
 
 log = logging.getLogger(__name__)
 log.setLevel(logging.DEBUG)
@@ -241,3 +245,91 @@ def test_custom():
     assert cls.staticFloatMethod() == jfloat(98.6).value
     assert cls.staticDoubleMethod() == jdouble(777.665544).value
     assert cls.staticStringMethod() == 'hello world'
+
+
+def test_thread_env():
+    assert get_env() is _env
+    envs = []
+    names = []
+
+    def run():
+        envs.append(get_env())
+        envs.append(get_env())
+        names.append(envs[0].get('java.lang.Class').forName('java.lang.String').getName())
+        detach_thread()
+        envs.append(get_env())
+        detach_thread()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    assert envs[0] is envs[1] and envs[0] is not _env and envs[2] is not envs[0]
+    assert names == ['java.lang.String']
+    assert envs[0].get('java.lang.Class').cls is _env.get('java.lang.Class').cls
+
+    class Late(Object):
+        class_name = 'java.lang.Runnable'
+
+    assert get_env() is _env and isinstance(_env.get('java.lang.Runnable'), Late)
+
+
+def test_lazy_env():
+    env = ThreadEnv()
+    assert 'java.sql.ResultSet' not in env.classes
+    rs = env.get('java.sql.ResultSet')
+    assert env.classes['java.sql.ResultSet'] is rs and env.get('java.sql.ResultSet') is rs
+    assert not rs.next.resolved
+
+    class Missing(Object):
+        class_name = 'java.lang.Cloneable'
+
+        def __init__(self, env):
+            super(Missing, self).__init__(env)
+            self.missing = self.static_method('missing', '()V')
+
+    cls = env.get('java.lang.Cloneable')
+    with pytest.raises(Throwable.Instance):
+        cls.missing()
+
+
+def test_constant():
+    cls = _env.get('java.lang.Integer')
+    assert cls.MAX_VALUE == MAX_INT
+    assert cls._MAX_VALUE.constant and cls._MAX_VALUE.value == MAX_INT
+    with pytest.raises(RuntimeError):
+        cls._MAX_VALUE.set(cls.cls, 0)
+    with pytest.raises(ValueError):
+        cls.constant('MAX_VALUE', 'Ljava/lang/Integer;')
+    cal = _env.get('java.util.Calendar')
+    assert cal.YEAR == 1 and cal._YEAR.resolved
+
+
+def test_instance_methods():
+    cls = _env.get('java.lang.Integer')
+    obj = cls.new(42)
+    method = next(c.__dict__['intValue'] for c in type(obj).__mro__ if 'intValue' in c.__dict__)
+    assert isinstance(method, types.FunctionType) and method.__name__ == 'intValue'
+    assert obj.intValue() == 42 and obj.hashCode() == 42
+
+
+def test_error_other_thread():
+    errors = []
+
+    def run():
+        env = get_env()
+        try:
+            env.get('java.lang.Class').forName('no.such.Klass')
+        except Throwable.Instance as e:
+            errors.append(OperationalError.from_java(e, message=True))
+            errors.append(OperationalError.from_java(e))
+            assert str(errors[1]).startswith('no.such.Klass\n    at ')
+            errors.append(OperationalError.from_java(e))
+        finally:
+            detach_thread()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    assert str(errors[0]) == 'no.such.Klass'
+    assert str(errors[1]).startswith('no.such.Klass\n    at ')
+    assert str(errors[2]).endswith(', (raised on another thread)')